@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from tests.cypher_tck.engines import selected_engines
+from tests.cypher_tck.graph_cache import graph_nbytes
+from tests.cypher_tck.harness import (
+    chain_planner,
+    engine_chain,
+    graph_frames,
+    graph_from_frames,
+    label_encoding,
+    scenario_chain,
+)
+from tests.cypher_tck.models import GraphFixture, Scenario
+from tests.cypher_tck.results_store import pygraphistry_version
+from tests.cypher_tck.scenarios import REGISTRY
+from tests.cypher_tck.stats import clear_stats_cache
+
+BENCH_FORMAT = 1
+DEFAULT_SIZES = (10**3, 10**4, 10**5, 10**6, 10**7)
+
+
+def _template_groups(template: np.ndarray, size: int) -> Dict[int, np.ndarray]:
+    order = np.argsort(template, kind="stable")
+    values, starts = np.unique(template[order], return_index=True)
+    return dict(zip(values.tolist(), np.split(order, starts[1:]))) if size else {}
+
+
+def _pick(groups: Dict[int, np.ndarray], templates: np.ndarray, n_nodes: int, rng: np.random.Generator) -> np.ndarray:
+    # For each edge, a random synthesized node cloned from the edge's template
+    # endpoint, so label/type combinations along edges survive scaling.
+    picked = rng.integers(0, n_nodes, len(templates))
+    for template, positions in _template_groups(templates, len(templates)).items():
+        members = groups.get(template)
+        if members is not None and len(members):
+            picked[positions] = members[rng.integers(0, len(members), len(positions))]
+    return picked
+
+
+def synthesize_frames(
+    fixture: GraphFixture, n_edges: int, seed: int = 0, nodes_per_edge: Optional[float] = None
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    # Scales a fixture by cloning its rows: nodes keep their labels and
+    # properties, edges keep their type and properties and connect clones of
+    # their original endpoints. IDs become dense integers.
+    template_nodes, template_edges = graph_frames(fixture)
+    rng = np.random.default_rng(seed)
+    if nodes_per_edge is None:
+        nodes_per_edge = len(template_nodes) / len(template_edges) if len(template_edges) else 1.0
+    n_nodes = max(1, int(round(n_edges * min(max(nodes_per_edge, 0.05), 2.0))))
+
+    node_templates = rng.integers(0, max(len(template_nodes), 1), n_nodes)
+    if len(template_nodes):
+        nodes_df = template_nodes.iloc[node_templates].reset_index(drop=True)
+    else:
+        nodes_df = pd.DataFrame(index=pd.RangeIndex(n_nodes))
+    nodes_df[fixture.node_id] = np.arange(n_nodes, dtype=np.int64)
+    groups = _template_groups(node_templates, n_nodes)
+
+    if len(template_edges):
+        edge_templates = rng.integers(0, len(template_edges), n_edges)
+        edges_df = template_edges.iloc[edge_templates].reset_index(drop=True)
+        positions = pd.Index(template_nodes[fixture.node_id])
+        src_templates = positions.get_indexer(template_edges[fixture.src])[edge_templates]
+        dst_templates = positions.get_indexer(template_edges[fixture.dst])[edge_templates]
+    else:
+        # Edge-less fixtures still get edges (untyped) so traversal cost scales too.
+        edges_df = pd.DataFrame({col: pd.Series([None] * n_edges, dtype=object) for col in fixture.edge_columns})
+        src_templates = dst_templates = np.full(n_edges, -1)
+    edges_df[fixture.src] = _pick(groups, src_templates, n_nodes, rng)
+    edges_df[fixture.dst] = _pick(groups, dst_templates, n_nodes, rng)
+    edges_df[fixture.edge_id] = np.arange(n_edges, dtype=np.int64)
+    return nodes_df, edges_df
+
+
+@dataclass(frozen=True)
+class BenchRecord:
+    scenario: str
+    engine: str
+    edges: int
+    nodes: int
+    seconds: List[float]
+    median: float
+    edges_per_sec: float
+    peak_bytes: int
+    graph_bytes: int
+    result_nodes: int
+    result_edges: int
+    pygraphistry: str
+    label_encoding: str
+    planner: str
+    seed: int
+    environment: Dict[str, str] = field(default_factory=dict)
+    format: int = BENCH_FORMAT
+
+
+def environment() -> Dict[str, str]:
+    return {
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "processor": platform.processor() or "unknown",
+    }
+
+
+def _time_gfql(g: Any, chain: Sequence[Any], engine: str, repeat: int) -> Tuple[List[float], int, Any]:
+    seconds: List[float] = []
+    result = None
+    tracing = not tracemalloc.is_tracing()
+    for attempt in range(repeat + 1):
+        # The first run warms up imports and caches and is traced for memory;
+        # only the untraced runs are timed.
+        if attempt == 0:
+            if tracing:
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+            result = g.gfql(chain, engine=engine)
+            peak = tracemalloc.get_traced_memory()[1] - baseline
+            if tracing:
+                tracemalloc.stop()
+            continue
+        start = time.perf_counter()
+        result = g.gfql(chain, engine=engine)
+        seconds.append(time.perf_counter() - start)
+    return seconds, peak, result
+
+
+def bench_scenario(
+    scenario: Scenario, sizes: Sequence[int], engines: Optional[Sequence[str]] = None, repeat: int = 3, seed: int = 0
+) -> Iterator[BenchRecord]:
+    chain = scenario_chain(scenario)
+    env = environment()
+    for size in sizes:
+        nodes_df, edges_df = synthesize_frames(scenario.graph, size, seed=seed)
+        g = graph_from_frames(scenario.graph, nodes_df, edges_df)
+        planned = engine_chain(chain, g)
+        for engine in selected_engines(engines):
+            engine_g = g if engine.convert is None else engine.convert(g)
+            seconds, peak, result = _time_gfql(engine_g, planned, engine.gfql_engine or engine.name, repeat)
+            median = statistics.median(seconds)
+            yield BenchRecord(
+                scenario=scenario.key,
+                engine=engine.name,
+                edges=len(edges_df),
+                nodes=len(nodes_df),
+                seconds=seconds,
+                median=median,
+                edges_per_sec=len(edges_df) / median if median > 0 else float("inf"),
+                peak_bytes=peak,
+                graph_bytes=graph_nbytes(engine_g),
+                result_nodes=0 if result._nodes is None else len(result._nodes),
+                result_edges=0 if result._edges is None else len(result._edges),
+                pygraphistry=pygraphistry_version(),
+                label_encoding=label_encoding(),
+                planner=chain_planner(),
+                seed=seed,
+                environment=env,
+            )
+        # Statistics hold the frames they describe; do not keep every size alive.
+        clear_stats_cache()
+
+
+def record_key(record: Dict[str, Any]) -> Tuple[str, str, str, str, int]:
+    # Timings from different planners or label encodings are not comparable.
+    # Records written before those fields existed used the defaults.
+    return (
+        record["scenario"],
+        record["engine"],
+        record.get("planner", "selectivity"),
+        record.get("label_encoding", "columns"),
+        int(record["edges"]),
+    )
+
+
+def read_records(path: str) -> List[Dict[str, Any]]:
+    with open(path, encoding="utf-8") as handle:
+        return [json.loads(line) for line in handle if line.strip()]
+
+
+def format_record(record: BenchRecord) -> str:
+    return (
+        f"{record.scenario:<16} {record.engine:<8} {record.edges:>10} edges  "
+        f"{record.median * 1000:>10.2f} ms  {record.edges_per_sec:>14,.0f} edges/s  "
+        f"{record.peak_bytes / 2**20:>9.1f} MiB peak"
+    )
+
+
+def _sizes(text: str) -> List[int]:
+    return [int(float(size)) for size in text.split(",") if size.strip()]
+
+
+def _positive_int(text: str) -> int:
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return value
+
+
+def _parse_args(argv: Optional[Sequence[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark translated TCK chains on synthesized graphs.")
+    parser.add_argument("--sizes", type=_sizes, default=list(DEFAULT_SIZES), help="edge counts, e.g. 1e3,1e5")
+    parser.add_argument("--key", action="append", dest="keys", help="benchmark only this scenario (repeatable)")
+    parser.add_argument("--engine", action="append", dest="engines", help="engine name (default: TCK_GFQL_ENGINES)")
+    parser.add_argument("--repeat", type=_positive_int, default=3, help="timed runs per size (default: 3)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="append one JSON record per scenario, engine and size to this path")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = _parse_args(argv)
+    entries = REGISTRY.entries(keys=args.keys, status=None if args.keys else "supported")
+    handle = open(args.output, "a", encoding="utf-8") if args.output else None
+    try:
+        for entry in entries:
+            scenario = REGISTRY.get(entry.key)
+            if scenario.gfql is None:
+                continue
+            for record in bench_scenario(scenario, args.sizes, args.engines, args.repeat, args.seed):
+                print(format_record(record), flush=True)
+                if handle is not None:
+                    handle.write(json.dumps(asdict(record), sort_keys=True) + "\n")
+                    handle.flush()
+    finally:
+        if handle is not None:
+            handle.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import argparse
+import sys
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from tests.cypher_tck.bench import read_records, record_key
+
+BenchKey = Tuple[str, str, str, str, int]
+
+
+def pooled_seconds(records: Iterable[Dict]) -> Dict[BenchKey, np.ndarray]:
+    # Records appended by several bench runs pool their timed trials.
+    pooled: Dict[BenchKey, List[float]] = {}
+    for record in records:
+        pooled.setdefault(record_key(record), []).extend(record["seconds"])
+    return {key: np.asarray(seconds, dtype=float) for key, seconds in pooled.items() if seconds}
+
+
+def bootstrap_ratio(
+    baseline: np.ndarray, candidate: np.ndarray, resamples: int = 2000, confidence: float = 0.95, seed: int = 0
+) -> Tuple[float, float, float]:
+    # Ratio of medians (candidate / baseline) with a percentile bootstrap CI.
+    rng = np.random.default_rng(seed)
+    base = np.median(rng.choice(baseline, size=(resamples, len(baseline)), replace=True), axis=1)
+    cand = np.median(rng.choice(candidate, size=(resamples, len(candidate)), replace=True), axis=1)
+    ratios = cand / np.maximum(base, 1e-12)
+    tail = (1.0 - confidence) / 2.0
+    low, high = np.quantile(ratios, [tail, 1.0 - tail])
+    return float(np.median(candidate) / max(np.median(baseline), 1e-12)), float(low), float(high)
+
+
+@dataclass(frozen=True)
+class Comparison:
+    key: BenchKey
+    baseline_trials: int
+    candidate_trials: int
+    ratio: float
+    low: float
+    high: float
+    verdict: str
+
+
+def compare(
+    baseline: Dict[BenchKey, np.ndarray],
+    candidate: Dict[BenchKey, np.ndarray],
+    threshold: float = 0.10,
+    resamples: int = 2000,
+    confidence: float = 0.95,
+    seed: int = 0,
+) -> List[Comparison]:
+    # A benchmark regresses only when the whole CI sits above 1 + threshold,
+    # and improves only when it sits below 1 / (1 + threshold); noisy
+    # intervals that straddle the band are "unchanged".
+    comparisons: List[Comparison] = []
+    for key in sorted(set(baseline) & set(candidate)):
+        ratio, low, high = bootstrap_ratio(baseline[key], candidate[key], resamples, confidence, seed)
+        if low > 1.0 + threshold:
+            verdict = "regressed"
+        elif high < 1.0 / (1.0 + threshold):
+            verdict = "improved"
+        else:
+            verdict = "unchanged"
+        comparisons.append(Comparison(key, len(baseline[key]), len(candidate[key]), ratio, low, high, verdict))
+    return comparisons
+
+
+def format_comparisons(
+    comparisons: Sequence[Comparison], missing: Sequence[BenchKey], threshold: float, confidence: float
+) -> str:
+    lines = [
+        f"GFQL benchmark comparison (median ratio candidate/baseline, {confidence:.0%} bootstrap CI, "
+        f"threshold {threshold:.0%})",
+        "",
+        "| scenario | engine | planner | labels | edges | trials | ratio | CI | verdict |",
+        "|---|---|---|---|---:|---:|---:|---|---|",
+    ]
+    for item in comparisons:
+        scenario, engine, planner, encoding, edges = item.key
+        lines.append(
+            f"| {scenario} | {engine} | {planner} | {encoding} | {edges} | "
+            f"{item.baseline_trials}/{item.candidate_trials} | {item.ratio:.3f} | "
+            f"[{item.low:.3f}, {item.high:.3f}] | {item.verdict} |"
+        )
+    regressed = sum(1 for item in comparisons if item.verdict == "regressed")
+    improved = sum(1 for item in comparisons if item.verdict == "improved")
+    lines.extend(["", f"Regressed: {regressed}, improved: {improved}, compared: {len(comparisons)}"])
+    if missing:
+        lines.append(f"Only in one file (not compared): {len(missing)}")
+    return "\n".join(lines) + "\n"
+
+
+def _parse_args(argv: Optional[Sequence[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Compare two bench.py result files for performance regressions.")
+    parser.add_argument("baseline", help="bench JSONL from the reference ref")
+    parser.add_argument("candidate", help="bench JSONL from the ref under test")
+    parser.add_argument("--threshold", type=float, default=0.10, help="allowed slowdown fraction (default: 0.10)")
+    parser.add_argument("--confidence", type=float, default=0.95, help="bootstrap CI level (default: 0.95)")
+    parser.add_argument("--resamples", type=int, default=2000, help="bootstrap resamples (default: 2000)")
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = _parse_args(argv)
+    baseline = pooled_seconds(read_records(args.baseline))
+    candidate = pooled_seconds(read_records(args.candidate))
+    comparisons = compare(baseline, candidate, args.threshold, args.resamples, args.confidence, args.seed)
+    missing = sorted(set(baseline) ^ set(candidate))
+    print(format_comparisons(comparisons, missing, args.threshold, args.confidence), end="")
+    return 1 if any(item.verdict == "regressed" for item in comparisons) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
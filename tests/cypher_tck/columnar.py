@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Union, overload
+
+import numpy as np
+
+from tests.cypher_tck.models import FrozenRecord
+
+
+def typed_array(values: Sequence[Any]) -> np.ndarray:
+    kinds = {type(value) for value in values}
+    array: Optional[np.ndarray] = None
+    if kinds == {bool}:
+        array = np.array(values, dtype=bool)
+    elif kinds == {int}:
+        try:
+            array = np.array(values, dtype=np.int64)
+        except OverflowError:
+            array = None
+    elif kinds == {float}:
+        # Mixed int/float columns stay object: 1 and 1.0 are different values.
+        array = np.array(values, dtype=np.float64)
+    if array is None:
+        array = np.fromiter(values, dtype=object, count=len(values))
+    array.flags.writeable = False
+    return array
+
+
+# Read-only, column-backed table that still iterates as fixture records.
+# `columns` are present in every row; `properties` are sparse and a None cell
+# means the property is absent, matching Cypher's null semantics.
+class ColumnTable(Sequence[Dict[str, Any]]):
+    __slots__ = ("columns", "properties", "length")
+
+    def __init__(
+        self,
+        columns: Mapping[str, np.ndarray],
+        properties: Mapping[str, np.ndarray],
+        length: int,
+    ) -> None:
+        self.columns = dict(columns)
+        self.properties = dict(properties)
+        self.length = length
+        for values in (*self.columns.values(), *self.properties.values()):
+            values.flags.writeable = False
+
+    @classmethod
+    def from_lists(
+        cls, columns: Mapping[str, Sequence[Any]], properties: Mapping[str, Sequence[Any]], length: int
+    ) -> "ColumnTable":
+        return cls(
+            {name: typed_array(values) for name, values in columns.items()},
+            {name: typed_array(values) for name, values in properties.items()},
+            length,
+        )
+
+    @classmethod
+    def from_records(cls, records: Iterable[Mapping[str, Any]], columns: Sequence[str] = ()) -> "ColumnTable":
+        rows = list(records)
+        names: Dict[str, None] = {}
+        for row in rows:
+            names.update(dict.fromkeys(row))
+        structural = {name: [row.get(name) for row in rows] for name in columns}
+        properties = {
+            name: [row.get(name) for row in rows] for name in names if name not in structural
+        }
+        return cls.from_lists(structural, properties, len(rows))
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (ColumnTable, (self.columns, self.properties, self.length))
+
+    def __len__(self) -> int:
+        return self.length
+
+    @overload
+    def __getitem__(self, index: int) -> Dict[str, Any]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Dict[str, Any]]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return [self._row(i) for i in range(*index.indices(self.length))]
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("ColumnTable index out of range")
+        return self._row(index)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for i in range(self.length):
+            yield self._row(i)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ColumnTable):
+            return list(self) == list(other)
+        if isinstance(other, (list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"ColumnTable(length={self.length}, columns={list(self.columns)}, properties={list(self.properties)})"
+
+    def _row(self, index: int) -> FrozenRecord:
+        row = {name: _scalar(values[index]) for name, values in self.columns.items()}
+        for name, values in self.properties.items():
+            value = values[index]
+            if value is not None:
+                row[name] = _scalar(value)
+        return FrozenRecord(row)
+
+    def update_digest(self, digest: Any) -> None:
+        # Column at a time: names, dtypes and buffers; object columns by the
+        # repr of their values, which keeps types (1, 1.0, "1") apart.
+        digest.update(repr(self.length).encode())
+        for tag, arrays in ((b"columns", self.columns), (b"properties", self.properties)):
+            digest.update(tag)
+            for name in sorted(arrays):
+                values = arrays[name]
+                digest.update(repr((name, values.dtype.str)).encode())
+                if values.dtype == object:
+                    digest.update(repr(values.tolist()).encode())
+                else:
+                    digest.update(np.ascontiguousarray(values).tobytes())
+                digest.update(b"\n")
+
+    def column_names(self) -> List[str]:
+        return [*self.columns, *(name for name in self.properties if name not in self.columns)]
+
+    def to_pandas(self, required_columns: Iterable[str] = ()) -> Any:
+        import pandas as pd
+
+        data: Dict[str, Any] = {**self.columns, **self.properties}
+        for name in required_columns:
+            if name not in data:
+                data[name] = np.full(self.length, pd.NA, dtype=object)
+        return pd.DataFrame(data, index=pd.RangeIndex(self.length), copy=False)
+
+    def to_arrow(self, required_columns: Iterable[str] = ()) -> Any:
+        import pyarrow as pa
+
+        data: Dict[str, Any] = {}
+        for name, values in {**self.columns, **self.properties}.items():
+            data[name] = pa.array(values, from_pandas=True)
+        for name in required_columns:
+            if name not in data:
+                data[name] = pa.nulls(self.length)
+        return pa.table(data)
+
+
+def _scalar(value: Any) -> Any:
+    return value.item() if isinstance(value, np.generic) else value
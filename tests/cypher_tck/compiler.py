@@ -0,0 +1,482 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from graphistry.compute import e_forward, e_reverse, e_undirected, ge, gt, is_in, isna, le, lt, n, notna
+
+from tests.cypher_tck.oracle_cache import chain_key
+from tests.cypher_tck.parse_cypher import Token, tokenize
+from tests.cypher_tck.where import And, Comparison, IsNull, Not, Or, Predicate, Xor, mask_expression
+
+# Compiles the single-MATCH subset of Cypher that maps onto one linear GFQL
+# chain: a path pattern with labels, relationship types (or alternatives) and
+# property maps, a WHERE predicate tree whose conjuncts each touch one
+# variable, and RETURN of one variable.
+
+_PLAN_CACHE_SIZE = 4096
+_KEYWORDS = frozenset(
+    {"MATCH", "OPTIONAL", "WHERE", "RETURN", "DISTINCT", "AS", "AND", "OR", "XOR", "NOT", "IS", "NULL", "TRUE", "FALSE"}
+)
+_COMPARISONS = {">": gt, ">=": ge, "<": lt, "<=": le}
+_FLIPPED = {">": "<", ">=": "<=", "<": ">", "<=": ">=", "=": "=", "<>": "<>"}
+_HOPS = {("-", "->"): e_forward, ("<-", "-"): e_reverse, ("-", "-"): e_undirected}
+
+
+class UnsupportedQuery(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class CompiledQuery:
+    chain: Tuple[Any, ...]
+    # Named node the harness reads results from; None returns every node.
+    return_alias: Optional[str]
+    returns: str
+
+
+@dataclass
+class _Element:
+    var: Optional[str]
+    filters: Dict[str, Any]
+    # Edge direction tokens, e.g. ("-", "->"); None for nodes.
+    arrows: Optional[Tuple[str, str]] = None
+    # WHERE conjuncts rendered into the hop's query mask.
+    masks: List[Predicate] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class _Labels:
+    var: str
+    labels: Tuple[str, ...]
+
+
+def _atoms(predicate: Any) -> Iterator[Any]:
+    if isinstance(predicate, (And, Or)):
+        for operand in predicate.operands:
+            yield from _atoms(operand)
+    elif isinstance(predicate, Xor):
+        yield from _atoms(predicate.left)
+        yield from _atoms(predicate.right)
+    elif isinstance(predicate, Not):
+        yield from _atoms(predicate.operand)
+    else:
+        yield predicate
+
+
+def _conjuncts(predicate: Any) -> List[Any]:
+    if isinstance(predicate, And):
+        return [conjunct for operand in predicate.operands for conjunct in _conjuncts(operand)]
+    return [predicate]
+
+
+def _filter_entry(predicate: Any) -> Tuple[Optional[str], Any]:
+    # The filter_dict entry equivalent to `predicate`, or (None, None).
+    if isinstance(predicate, Comparison) and predicate.op in _COMPARISONS:
+        return predicate.key, _COMPARISONS[predicate.op](predicate.value)
+    if isinstance(predicate, Comparison) and predicate.op == "=":
+        return predicate.key, predicate.value
+    if isinstance(predicate, IsNull):
+        return predicate.key, notna() if predicate.negated else isna()
+    if isinstance(predicate, Or) and all(
+        isinstance(operand, Comparison)
+        and operand.op == "="
+        and (operand.var, operand.key) == (predicate.operands[0].var, predicate.operands[0].key)
+        for operand in predicate.operands
+    ):
+        # `x = 1 OR x = 2` is one membership test.
+        return predicate.operands[0].key, is_in(list(dict.fromkeys(operand.value for operand in predicate.operands)))
+    return None, None
+
+
+def _keyword_position(tokens: Sequence[Token], index: int, braces: int) -> bool:
+    # Labels, relationship types, property keys, map keys and variables may
+    # spell keywords; only names outside those positions are keywords.
+    before = tokens[index - 1].value if index else ""
+    after = tokens[index + 1].value if index + 1 < len(tokens) else ""
+    if before in (".", "|") or after == ":":
+        return False
+    return before != ":" or braces > 0
+
+
+def normalize_query(text: str) -> str:
+    # Token-level normalization: whitespace and keyword case never change a plan.
+    parts: List[str] = []
+    tokens = tokenize(text)
+    braces = 0
+    for index, token in enumerate(tokens):
+        braces += {"{": 1, "}": -1}.get(token.kind, 0)
+        if (
+            token.kind == "name"
+            and token.raw == token.value
+            and token.value.upper() in _KEYWORDS
+            and _keyword_position(tokens, index, braces)
+        ):
+            parts.append(token.value.upper())
+        elif token.kind == "other" and token.value in "=>" and not token.space and parts and parts[-1] in "<>":
+            # Keep two-character operators (`<=`, `>=`, `<>`) in one piece.
+            parts[-1] += token.raw
+        else:
+            parts.append(token.raw)
+    while parts and parts[-1] == ";":
+        parts.pop()
+    return " ".join(parts)
+
+
+class _QueryReader:
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.tokens = tokenize(text)
+        self.pos = 0
+        self.elements: List[_Element] = []
+        self.variables: Dict[str, _Element] = {}
+
+    def _peek(self, offset: int = 0) -> Optional[Token]:
+        index = self.pos + offset
+        return self.tokens[index] if index < len(self.tokens) else None
+
+    def _next(self) -> Token:
+        token = self._peek()
+        if token is None:
+            raise UnsupportedQuery(f"Unexpected end of query: {self.text}")
+        self.pos += 1
+        return token
+
+    def _expect(self, kind: str, value: Optional[str] = None) -> Token:
+        token = self._next()
+        if token.kind != kind or (value is not None and token.value != value):
+            raise UnsupportedQuery(f"Expected '{value or kind}' but found '{token.raw}' in: {self.text}")
+        return token
+
+    def _at(self, kind: str, offset: int = 0, value: Optional[str] = None) -> bool:
+        token = self._peek(offset)
+        return token is not None and token.kind == kind and (value is None or token.value == value)
+
+    def _at_keyword(self, keyword: str, offset: int = 0) -> bool:
+        token = self._peek(offset)
+        return token is not None and token.kind == "name" and token.raw.upper() == keyword
+
+    def _keyword(self, keyword: str) -> None:
+        if not self._at_keyword(keyword):
+            found = self._peek()
+            raise UnsupportedQuery(f"Expected {keyword} but found '{found.raw if found else 'end'}' in: {self.text}")
+        self.pos += 1
+
+    def _operator(self) -> str:
+        # The tokenizer yields one "other" token per character ("<", "=").
+        first = self._next()
+        if first.kind != "other" or first.value not in "<>=":
+            raise UnsupportedQuery(f"Unsupported operator '{first.raw}' in: {self.text}")
+        if first.value in "<>" and self._at("other", value="=") and not self._peek().space:
+            self.pos += 1
+            return first.value + "="
+        if first.value == "<" and self._at("other", value=">") and not self._peek().space:
+            self.pos += 1
+            return "<>"
+        return first.value
+
+    def compile(self) -> CompiledQuery:
+        self._keyword("MATCH")
+        self._pattern()
+        if self._at_keyword("WHERE"):
+            self.pos += 1
+            self._where()
+        returns = self._return()
+        while self._at(";"):
+            self.pos += 1
+        if self.pos != len(self.tokens):
+            raise UnsupportedQuery(f"Unsupported clause '{self._peek().raw}' in: {self.text}")
+        return self._build(returns)
+
+    # Pattern
+
+    def _pattern(self) -> None:
+        self._node()
+        while self._at("-") or self._at("<-"):
+            self._relationship()
+            self._node()
+        if self._at(","):
+            raise UnsupportedQuery(f"Comma-separated patterns are not a linear chain: {self.text}")
+
+    def _bind(self, element: _Element) -> None:
+        if element.var is not None:
+            if element.var in self.variables:
+                raise UnsupportedQuery(f"Variable '{element.var}' is bound twice: {self.text}")
+            self.variables[element.var] = element
+        self.elements.append(element)
+
+    def _variable(self) -> Optional[str]:
+        if self._at("name"):
+            return self._next().value
+        return None
+
+    def _node(self) -> None:
+        self._expect("(")
+        element = _Element(self._variable(), {})
+        while self._at(":"):
+            self.pos += 1
+            element.filters[f"label__{self._expect('name').value}"] = True
+        self._properties(element)
+        self._expect(")")
+        self._bind(element)
+
+    def _relationship(self) -> None:
+        left = self._next().kind
+        element = _Element(None, {})
+        if self._at("["):
+            self.pos += 1
+            element.var = self._variable()
+            if self._at(":"):
+                self.pos += 1
+                types = [self._expect("name").value]
+                while self._at("other", value="|"):
+                    # `[:A|B]`, and the older `[:A|:B]` spelling.
+                    self.pos += 1
+                    if self._at(":"):
+                        self.pos += 1
+                    types.append(self._expect("name").value)
+                types = list(dict.fromkeys(types))
+                # Alternatives are one set-membership test on the type column.
+                element.filters["type"] = types[0] if len(types) == 1 else is_in(types)
+            if self._at("other", value="*"):
+                raise UnsupportedQuery(f"Variable-length relationships are not supported: {self.text}")
+            self._properties(element)
+            self._expect("]")
+        right = self._next().kind
+        if (left, right) not in _HOPS:
+            raise UnsupportedQuery(f"Malformed relationship '{left}...{right}' in: {self.text}")
+        element.arrows = (left, right)
+        self._bind(element)
+
+    def _properties(self, element: _Element) -> None:
+        if not self._at("{"):
+            return
+        self.pos += 1
+        while not self._at("}"):
+            key = self._expect("name").value
+            self._expect(":")
+            self._merge(element, key, self._literal())
+            if self._at(","):
+                self.pos += 1
+        self._expect("}")
+
+    # WHERE
+
+    def _where(self) -> None:
+        # Top-level conjuncts that one filter_dict entry can express stay
+        # there; anything else (OR, XOR, NOT, `<>`, a second predicate on the
+        # same key) is ANDed into the hop's query mask.
+        for conjunct in _conjuncts(self._or()):
+            if isinstance(conjunct, _Labels):
+                element = self._reference(conjunct.var)
+                for label in conjunct.labels:
+                    self._merge(element, f"label__{label}", True)
+                continue
+            if any(isinstance(atom, _Labels) for atom in _atoms(conjunct)):
+                raise UnsupportedQuery(f"Label predicates under OR/NOT are not supported: {self.text}")
+            variables = {atom.var for atom in _atoms(conjunct)}
+            if len(variables) != 1:
+                raise UnsupportedQuery(f"Predicates across several pattern variables: {self.text}")
+            element = self._reference(variables.pop())
+            key, value = _filter_entry(conjunct)
+            if key is None or not self._merge(element, key, value, strict=False):
+                element.masks.append(conjunct)
+
+    def _or(self) -> Any:
+        operands = [self._xor()]
+        while self._at_keyword("OR"):
+            self.pos += 1
+            operands.append(self._xor())
+        return operands[0] if len(operands) == 1 else Or(tuple(operands))
+
+    def _xor(self) -> Any:
+        left = self._and()
+        while self._at_keyword("XOR"):
+            self.pos += 1
+            left = Xor(left, self._and())
+        return left
+
+    def _and(self) -> Any:
+        operands = [self._not()]
+        while self._at_keyword("AND"):
+            self.pos += 1
+            operands.append(self._not())
+        return operands[0] if len(operands) == 1 else And(tuple(operands))
+
+    def _not(self) -> Any:
+        if self._at_keyword("NOT"):
+            self.pos += 1
+            return Not(self._not())
+        return self._atom()
+
+    def _atom(self) -> Any:
+        if self._at("("):
+            self.pos += 1
+            predicate = self._or()
+            self._expect(")")
+            return predicate
+        if self._at("name") and self._at(":", 1):
+            var = self._reference(self._next().value).var
+            labels = []
+            while self._at(":"):
+                self.pos += 1
+                labels.append(self._expect("name").value)
+            return _Labels(var, tuple(labels))
+        if self._at_keyword("TYPE") and self._at("(", 1):
+            self.pos += 2
+            element = self._reference(self._expect("name").value)
+            self._expect(")")
+            if element.arrows is None:
+                raise UnsupportedQuery(f"type() of a node in: {self.text}")
+            return self._comparison(element, "type", self._operator(), self._literal())
+        if self._at("name") and self._at("other", 1, "."):
+            element, key = self._property()
+            if self._at_keyword("IS"):
+                self.pos += 1
+                negated = self._at_keyword("NOT")
+                if negated:
+                    self.pos += 1
+                self._keyword("NULL")
+                return IsNull(key, negated, element.var)
+            return self._comparison(element, key, self._operator(), self._literal())
+        value = self._literal()
+        operator = _FLIPPED[self._operator()]
+        element, key = self._property()
+        return self._comparison(element, key, operator, value)
+
+    def _property(self) -> Tuple[_Element, str]:
+        element = self._reference(self._expect("name").value)
+        self._expect("other", ".")
+        return element, self._expect("name").value
+
+    def _reference(self, var: str) -> _Element:
+        element = self.variables.get(var)
+        if element is None:
+            raise UnsupportedQuery(f"Unknown variable '{var}' in: {self.text}")
+        return element
+
+    def _comparison(self, element: _Element, key: str, operator: str, value: Any) -> Comparison:
+        if value is None:
+            # `x = null` is null for every row.
+            raise UnsupportedQuery(f"Comparison with null in: {self.text}")
+        return Comparison(key, operator, value, element.var)
+
+    def _merge(self, element: _Element, key: str, value: Any, strict: bool = True) -> bool:
+        if key in element.filters and element.filters[key] != value:
+            if strict:
+                raise UnsupportedQuery(f"Several predicates on '{key}' in: {self.text}")
+            return False
+        element.filters[key] = value
+        return True
+
+    # Literals
+
+    def _string(self) -> str:
+        return self._expect("string").value
+
+    def _literal(self) -> Any:
+        token = self._next()
+        if token.kind == "string":
+            return token.value
+        if token.kind == "-" and self._at("number"):
+            return -self._number(self._next().value)
+        if token.kind == "number":
+            return self._number(token.value)
+        if token.kind == "name" and token.raw.upper() in ("TRUE", "FALSE", "NULL"):
+            return {"TRUE": True, "FALSE": False, "NULL": None}[token.raw.upper()]
+        raise UnsupportedQuery(f"Unsupported literal '{token.raw}' in: {self.text}")
+
+    @staticmethod
+    def _number(raw: str) -> Union[int, float]:
+        return float(raw) if any(char in raw for char in ".eE") else int(raw)
+
+    # RETURN
+
+    def _return(self) -> str:
+        self._keyword("RETURN")
+        if self._at_keyword("DISTINCT"):
+            self.pos += 1
+        var = self._expect("name").value
+        if var not in self.variables:
+            raise UnsupportedQuery(f"Unsupported RETURN item '{var}' in: {self.text}")
+        if self._at_keyword("AS"):
+            self.pos += 1
+            self._expect("name")
+        if self._at(",") or self._at("other", value="."):
+            raise UnsupportedQuery(f"Only a single returned variable is supported: {self.text}")
+        return var
+
+    def _build(self, returns: str) -> CompiledQuery:
+        returned = self.variables[returns]
+        # A single node pattern returns every matched node; longer chains name
+        # the returned node so its rows can be told apart from the rest.
+        alias = returns if returned.arrows is None and len(self.elements) > 1 else None
+        chain: List[Any] = []
+        for element in self.elements:
+            name = alias if element is returned else None
+            query = None
+            if element.masks:
+                query = mask_expression(element.masks[0] if len(element.masks) == 1 else And(tuple(element.masks)))
+            if element.arrows is None:
+                chain.append(n(element.filters, name=name, query=query))
+            else:
+                chain.append(_HOPS[element.arrows](edge_match=element.filters, name=name, edge_query=query))
+        return CompiledQuery(tuple(chain), alias, returns)
+
+
+@lru_cache(maxsize=_PLAN_CACHE_SIZE)
+def _compile_normalized(normalized: str) -> Union[CompiledQuery, UnsupportedQuery]:
+    # Rejections are cached too: most of the suite is outside the subset.
+    try:
+        return _QueryReader(normalized).compile()
+    except UnsupportedQuery as exc:
+        return exc
+
+
+def compile_cypher(text: str) -> CompiledQuery:
+    plan = _compile_normalized(normalize_query(text))
+    if isinstance(plan, UnsupportedQuery):
+        raise UnsupportedQuery(*plan.args)
+    return plan
+
+
+def plan_cache_info() -> Any:
+    return _compile_normalized.cache_info()
+
+
+def _comparable(chain: Sequence[Any], keep: Optional[str]) -> Optional[List[Dict[str, Any]]]:
+    # Names other than the returned alias do not change the result.
+    if chain_key(chain) is None:
+        return None
+    ops = []
+    for op in chain:
+        data = dict(op.to_json())
+        if data.get("name") != keep:
+            data.pop("name", None)
+        for key in ("filter_dict", "edge_match"):
+            if not data.get(key):
+                data.pop(key, None)
+        ops.append(data)
+    return ops
+
+
+def translation_mismatch(cypher: str, chain: Sequence[Any], return_alias: Optional[str]) -> Optional[str]:
+    # Checks a hand-written translation against the compiled one; returns a
+    # description of the first difference, or None when they agree.
+    try:
+        compiled = compile_cypher(cypher)
+    except UnsupportedQuery as exc:
+        return f"not compilable: {exc}"
+    if compiled.return_alias != return_alias:
+        return f"return alias {return_alias!r} but compiled {compiled.return_alias!r}"
+    expected = _comparable(chain, return_alias)
+    actual = _comparable(compiled.chain, return_alias)
+    if expected is None or actual is None:
+        return "chain is not serializable"
+    if len(expected) != len(actual):
+        return f"{len(expected)} ops but compiled {len(actual)}"
+    for index, (left, right) in enumerate(zip(expected, actual)):
+        if left != right:
+            return f"op {index}: {left} but compiled {right}"
+    return None
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+from graphistry.embed_utils import check_cudf
+
+
+def _always() -> bool:
+    return True
+
+
+@dataclass(frozen=True)
+class Engine:
+    name: str
+    # Converts the pandas-built graph; None runs on the pandas graph itself.
+    convert: Optional[Callable[[Any], Any]] = None
+    available: Callable[[], bool] = _always
+    # Passed as g.gfql(..., engine=...); defaults to the registered name.
+    gfql_engine: Optional[str] = None
+
+
+ENGINES: Dict[str, Engine] = {}
+# Live view handed to BuiltGraphCache, so engines registered later still convert.
+CONVERTERS: Dict[str, Callable[[Any], Any]] = {}
+
+
+def register_engine(engine: Engine) -> Engine:
+    ENGINES[engine.name] = engine
+    if engine.convert is not None:
+        CONVERTERS[engine.name] = engine.convert
+    else:
+        CONVERTERS.pop(engine.name, None)
+    return engine
+
+
+def _default_engine_names() -> Tuple[str, ...]:
+    names = os.environ.get("TCK_GFQL_ENGINES")
+    if names:
+        return tuple(name.strip() for name in names.split(",") if name.strip())
+    return ("pandas", "cudf") if os.environ.get("TEST_CUDF", "0") == "1" else ("pandas",)
+
+
+def selected_engines(names: Optional[Sequence[str]] = None) -> Tuple[Engine, ...]:
+    # Unavailable engines are dropped, like TEST_CUDF=1 on a machine without cudf.
+    selected = []
+    for name in names if names is not None else _default_engine_names():
+        engine = ENGINES.get(name)
+        if engine is None:
+            raise ValueError(f"Unknown engine '{name}'; registered: {sorted(ENGINES)}")
+        if engine.available():
+            selected.append(engine)
+    return tuple(selected)
+
+
+@lru_cache(maxsize=1)
+def _has_cudf() -> bool:
+    return check_cudf()[0]
+
+
+def _to_cudf(g: Any) -> Any:
+    import cudf
+
+    return g.nodes(cudf.from_pandas(g._nodes)).edges(cudf.from_pandas(g._edges))
+
+
+register_engine(Engine("pandas"))
+register_engine(Engine("cudf", convert=_to_cudf, available=_has_cudf))
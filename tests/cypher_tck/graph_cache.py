@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import warnings
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from tests.cypher_tck.models import GraphFixture
+
+_DEFAULT_MAX_ENTRIES = int(os.environ.get("TCK_GRAPH_CACHE_SIZE", "128"))
+_DEFAULT_MAX_BYTES = int(os.environ.get("TCK_GRAPH_CACHE_MB", "512")) * 1024 * 1024
+# Debug aid: hash entries when stored and re-hash them on every hit. Costs
+# about half a rebuild per hit, so it is off unless asked for.
+_DEFAULT_VERIFY = os.environ.get("TCK_GRAPH_CACHE_VERIFY", "0") == "1"
+
+
+def _frame_nbytes(df: Any) -> int:
+    if df is None:
+        return 0
+    return int(df.memory_usage(deep=True, index=True).sum())
+
+
+def graph_nbytes(g: Any) -> int:
+    return _frame_nbytes(g._nodes) + _frame_nbytes(g._edges)
+
+
+def _array_bytes(values: np.ndarray) -> bytes:
+    # Object cells (strings, lists, tuples) are hashed through their repr.
+    return repr(values.tolist()).encode() if values.dtype == object else np.ascontiguousarray(values).tobytes()
+
+
+def _frame_digest(df: Any) -> Optional[bytes]:
+    if df is None:
+        return None
+    if hasattr(df, "to_pandas"):
+        df = df.to_pandas()
+    digest = hashlib.blake2b(repr((list(df.columns), [str(dtype) for dtype in df.dtypes])).encode())
+    digest.update(_array_bytes(df.index.to_numpy()))
+    for name in df.columns:
+        digest.update(_array_bytes(df[name].to_numpy()))
+    return digest.digest()
+
+
+def graph_digest(g: Any) -> Tuple[Optional[bytes], Optional[bytes]]:
+    return _frame_digest(g._nodes), _frame_digest(g._edges)
+
+
+def _freeze_frame(df: Any) -> None:
+    # Read-only NumPy buffers make an in-place edit of the cached frames raise
+    # up front; copy-on-write views still copy before writing. Arrow and cudf
+    # columns are left as they are.
+    if not isinstance(df, pd.DataFrame):
+        return
+    for name in df.columns:
+        values = df[name].array
+        if isinstance(values, pd.arrays.NumpyExtensionArray):
+            array = np.asarray(values)
+            while isinstance(array.base, np.ndarray):
+                array = array.base
+            array.flags.writeable = False
+
+
+def freeze_graph(g: Any) -> Any:
+    _freeze_frame(g._nodes)
+    _freeze_frame(g._edges)
+    return g
+
+
+def _shallow_view(g: Any) -> Any:
+    nodes = g._nodes.copy(deep=False) if g._nodes is not None else None
+    edges = g._edges.copy(deep=False) if g._edges is not None else None
+    return g.nodes(nodes).edges(edges)
+
+
+class BuiltGraphCache:
+    def __init__(
+        self,
+        build: Callable[[GraphFixture], Any],
+        converters: Optional[Mapping[str, Callable[[Any], Any]]] = None,
+        max_entries: int = _DEFAULT_MAX_ENTRIES,
+        max_bytes: int = _DEFAULT_MAX_BYTES,
+        verify: bool = _DEFAULT_VERIFY,
+    ) -> None:
+        self._build = build
+        # Kept by reference so engines registered after construction convert too.
+        self._converters: Mapping[str, Callable[[Any], Any]] = converters if converters is not None else {}
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.verify = verify
+        # (graph, bytes, digest at store time or None when not verifying)
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[Any, int, Any]]" = OrderedDict()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.mutations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, fixture: GraphFixture, engine: str = "pandas") -> Any:
+        key = (fixture.fingerprint, engine)
+        cached = self._entries.get(key)
+        if cached is not None and self.verify and graph_digest(cached[0]) != cached[2]:
+            # Something edited the shared frames in place; rebuild rather than hand it on.
+            self.mutations += 1
+            warnings.warn(f"Cached graph for fixture {fixture.fingerprint} ({engine}) was mutated in place; rebuilding")
+            self._evict(key)
+            cached = None
+        if cached is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return _shallow_view(cached[0])
+        self.misses += 1
+        if engine == "pandas":
+            g = self._build(fixture)
+        else:
+            converter = self._converters.get(engine)
+            if converter is None:
+                raise ValueError(f"No graph converter registered for engine '{engine}'")
+            g = converter(self.get(fixture, "pandas"))
+        self._store(key, g)
+        return _shallow_view(g)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.nbytes = 0
+
+    def _store(self, key: Tuple[str, str], g: Any) -> None:
+        size = graph_nbytes(g)
+        if size > self.max_bytes:
+            return
+        self._entries[key] = (freeze_graph(g), size, graph_digest(g) if self.verify else None)
+        self.nbytes += size
+        while self._entries and (len(self._entries) > self.max_entries or self.nbytes > self.max_bytes):
+            _, (_, evicted, _) = self._entries.popitem(last=False)
+            self.nbytes -= evicted
+
+    def _evict(self, key: Tuple[str, str]) -> None:
+        _, size, _ = self._entries.pop(key)
+        self.nbytes -= size
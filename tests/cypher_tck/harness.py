@@ -0,0 +1,287 @@
+from __future__ import annotations
+
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from graphistry.gfql.ref.enumerator import OracleCaps, enumerate_chain
+from graphistry.tests.test_compute import CGFull
+
+from tests.cypher_tck.columnar import ColumnTable
+from tests.cypher_tck.engines import CONVERTERS, Engine, selected_engines
+from tests.cypher_tck.graph_cache import BuiltGraphCache
+from tests.cypher_tck.idsets import IdSet, alias_ids, assert_same_ids, id_set, ids_from_df
+from tests.cypher_tck.labels import encode_label_bitmask, label_dictionary, rewrite_label_filters
+from tests.cypher_tck.models import GraphFixture, Scenario, ScenarioIndexEntry
+from tests.cypher_tck.oracle_cache import OracleCache, OracleEntry, default_oracle_cache_dir, oracle_entry
+from tests.cypher_tck.planner import plan_chain
+from tests.cypher_tck.profiling import PhaseTimer, phase
+from tests.cypher_tck.rows import RowTable, compare_rows, node_values, returns_ordered
+from tests.cypher_tck.scenarios import REGISTRY, ScenarioRegistry
+from tests.cypher_tck.stats import graph_stats
+from tests.cypher_tck.where import with_mask_columns
+
+
+_LABEL_ENCODING = os.environ.get("TCK_LABEL_ENCODING", "columns")
+# "selectivity" lets engines run a chain reversed when its far end is the
+# cheaper anchor; "off" runs chains as written. The oracle always runs them
+# as written, so every reversal is checked against it.
+_CHAIN_PLANNER = os.environ.get("TCK_GFQL_PLANNER", "selectivity")
+
+
+def active_engines() -> Tuple[str, ...]:
+    return tuple(engine.name for engine in selected_engines())
+
+
+def label_encoding() -> str:
+    return _LABEL_ENCODING
+
+
+def chain_planner() -> str:
+    return _CHAIN_PLANNER
+
+
+def _df_from_records(records: Sequence[dict], required_cols: Iterable[str]) -> pd.DataFrame:
+    if isinstance(records, ColumnTable):
+        return records.to_pandas(required_cols)
+    if records:
+        df = pd.DataFrame(records)
+        for col in required_cols:
+            if col not in df.columns:
+                df[col] = pd.NA
+        return df
+    return pd.DataFrame(columns=list(required_cols))
+
+
+def _expand_label_columns(nodes_df: pd.DataFrame, label_col: str = "labels") -> pd.DataFrame:
+    if label_col not in nodes_df.columns:
+        return nodes_df
+    # One row per (node, label); strings explode to themselves, empty lists to NaN.
+    exploded = nodes_df[label_col].reset_index(drop=True).explode()
+    exploded = exploded[exploded.notna()]
+    if exploded.empty:
+        return nodes_df
+    codes, names = pd.factorize(exploded, sort=True)
+    mask = np.zeros((len(nodes_df), len(names)), dtype=bool)
+    mask[exploded.index.to_numpy(), codes] = True
+    label_df = pd.DataFrame(mask, columns=[f"label__{name}" for name in names], index=nodes_df.index)
+    nodes_df = nodes_df.drop(columns=[col for col in label_df.columns if col in nodes_df.columns])
+    return pd.concat([nodes_df, label_df], axis=1)
+
+
+def graph_frames(fixture: GraphFixture) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    # Node and edge frames as the engines see them, labels encoded.
+    with phase("fixture_build"):
+        nodes_df = _df_from_records(fixture.nodes, fixture.node_columns)
+        edges_df = _df_from_records(fixture.edges, fixture.edge_columns)
+    with phase("label_expansion"):
+        if _LABEL_ENCODING == "bitmask":
+            nodes_df = encode_label_bitmask(nodes_df, label_dictionary(fixture))
+        else:
+            nodes_df = _expand_label_columns(nodes_df)
+    return nodes_df, edges_df
+
+
+def graph_from_frames(fixture: GraphFixture, nodes_df: pd.DataFrame, edges_df: pd.DataFrame) -> Any:
+    g = CGFull().nodes(nodes_df, fixture.node_id)
+    return g.edges(edges_df, fixture.src, fixture.dst, edge=fixture.edge_id)
+
+
+def _build_graph(fixture: GraphFixture) -> Any:
+    nodes_df, edges_df = graph_frames(fixture)
+    with phase("fixture_build"):
+        return graph_from_frames(fixture, nodes_df, edges_df)
+
+
+def scenario_chain(scenario: Scenario) -> List[Any]:
+    assert scenario.gfql is not None
+    if _LABEL_ENCODING == "bitmask":
+        return rewrite_label_filters(scenario.gfql, label_dictionary(scenario.graph))
+    return list(scenario.gfql)
+
+
+def engine_chain(chain: Sequence[Any], g: Any, fixture: Optional[GraphFixture] = None) -> List[Any]:
+    if _CHAIN_PLANNER == "off":
+        return list(chain)
+    # Cached graphs come back as fresh shallow views, so their statistics are
+    # keyed by fixture rather than by frame identity.
+    key = None if fixture is None else (fixture.fingerprint, _LABEL_ENCODING)
+    return plan_chain(chain, g, graph_stats(g, key)).chain
+
+
+GRAPH_CACHE = BuiltGraphCache(_build_graph, converters=CONVERTERS)
+ORACLE_CACHE = OracleCache(default_oracle_cache_dir())
+_ORACLE_CAPS = OracleCaps(max_nodes=100, max_edges=100)
+
+
+def _run_oracle(scenario: Scenario, g: Any, chain: Sequence[Any]) -> OracleEntry:
+    # Keyed on the scenario's own chain; the label encoding picks the rewrite.
+    return ORACLE_CACHE.get(
+        scenario.graph,
+        scenario.gfql,
+        _ORACLE_CAPS,
+        lambda: oracle_entry(enumerate_chain(g, chain, caps=_ORACLE_CAPS), g._node, g._edge),
+        variant=_LABEL_ENCODING,
+    )
+
+
+def _reference_ids(expected_ids: Optional[Sequence[Any]], oracle_ids: IdSet, what: str) -> Tuple[IdSet, str]:
+    # Engines are checked against the scenario's IDs when it has them (after
+    # the oracle agrees), otherwise against the oracle.
+    if expected_ids is None:
+        return oracle_ids, "oracle"
+    reference = id_set(expected_ids)
+    assert_same_ids(reference, oracle_ids, f"{what} (expected vs oracle)")
+    return reference, "expected"
+
+
+def _result_ids(result: Any, g: Any, alias: Optional[str]) -> Tuple[IdSet, IdSet]:
+    if alias:
+        nodes = alias_ids(result._nodes, g._node, alias)
+    else:
+        nodes = ids_from_df(result._nodes, g._node)
+    return nodes, ids_from_df(result._edges, g._edge)
+
+
+def _row_column(scenario: Scenario) -> Optional[str]:
+    # Rows are checked for single-column node returns, the shape a GFQL node
+    # result can reproduce; GFQL returns node sets, so multiplicity and ORDER BY
+    # are out of reach here.
+    rows = scenario.expected.rows
+    if not rows or scenario.gfql is None or returns_ordered(scenario.cypher):
+        return None
+    columns = {name for row in rows for name in row}
+    if len(columns) != 1:
+        return None
+    (column,) = columns
+    if scenario.return_alias:
+        return column if column == scenario.return_alias else None
+    return column if len(scenario.gfql) == 1 else None
+
+
+def _property_columns(fixture: GraphFixture) -> List[str]:
+    if isinstance(fixture.nodes, ColumnTable):
+        names = fixture.nodes.column_names()
+    else:
+        names = list(dict.fromkeys(key for record in fixture.nodes for key in record))
+    return [name for name in names if name not in fixture.node_columns]
+
+
+def _assert_rows(scenario: Scenario, column: str, nodes_df: Any, id_col: str, engine: str) -> None:
+    if nodes_df is None:
+        nodes_df = pd.DataFrame(columns=[id_col])
+    if hasattr(nodes_df, "to_pandas"):
+        nodes_df = nodes_df.to_pandas()
+    if scenario.return_alias and scenario.return_alias in nodes_df.columns:
+        nodes_df = nodes_df[nodes_df[scenario.return_alias].fillna(False).astype(bool)]
+    nodes_df = nodes_df.drop_duplicates(subset=[id_col])
+    actual = RowTable.from_columns({column: node_values(nodes_df, _property_columns(scenario.graph))})
+    if scenario.expected.values is not None:
+        expected = RowTable.from_values(scenario.expected.values)
+    else:
+        expected = RowTable.from_expected(scenario.expected.rows or [])
+    message = compare_rows(expected.distinct(), actual)
+    if message is not None:
+        raise AssertionError(f"{column} rows ({engine}): {message}")
+
+
+def _engine_graph(scenario: Scenario, g: Any, engine: Engine) -> Any:
+    return g if engine.convert is None else GRAPH_CACHE.get(scenario.graph, engine.name)
+
+
+def _frame_len(df: Any) -> int:
+    return 0 if df is None else len(df)
+
+
+def check_scenario(
+    scenario: Scenario, engines: Optional[Sequence[Engine]] = None, timer: Optional[PhaseTimer] = None
+) -> Dict[str, float]:
+    # Builds the graph once, runs the oracle once, then every engine against the
+    # same reference sets; per-engine failures are collected so one engine's
+    # mismatch does not hide another's. Returns wall time per phase
+    # (profiling.SHARED_PHASES and "<engine>.<phase>").
+    timer = PhaseTimer({}) if timer is None else timer
+    chain = scenario_chain(scenario)
+
+    with timer.active():
+        g = with_mask_columns(GRAPH_CACHE.get(scenario.graph), chain)
+    hits = ORACLE_CACHE.hits
+    with timer.phase("oracle"):
+        oracle = _run_oracle(scenario, g, chain)
+    # A cache hit times the lookup, not the oracle; reports leave it out of speedups.
+    timer.metrics["oracle.cached"] = int(ORACLE_CACHE.hits > hits)
+    timer.metrics["oracle.nodes"] = len(oracle.node_ids)
+    timer.metrics["oracle.edges"] = len(oracle.edge_ids)
+    with timer.phase("plan"):
+        planned = engine_chain(chain, g, scenario.graph)
+
+    with timer.phase("comparison"):
+        oracle_nodes = id_set(oracle.tags.get(scenario.return_alias, ()) if scenario.return_alias else oracle.node_ids)
+        expected_nodes, node_source = _reference_ids(scenario.expected.node_ids, oracle_nodes, "node ids")
+        expected_edges, edge_source = _reference_ids(scenario.expected.edge_ids, id_set(oracle.edge_ids), "edge ids")
+        row_column = _row_column(scenario)
+
+    failures: List[str] = []
+    for engine in selected_engines() if engines is None else engines:
+        with timer.phase(f"{engine.name}.convert"):
+            engine_g = with_mask_columns(_engine_graph(scenario, g, engine), chain)
+        with timer.phase(f"{engine.name}.run"):
+            result = engine_g.gfql(planned, engine=engine.gfql_engine or engine.name)
+        timer.metrics[f"{engine.name}.nodes"] = _frame_len(result._nodes)
+        timer.metrics[f"{engine.name}.edges"] = _frame_len(result._edges)
+        with timer.phase(f"{engine.name}.comparison"):
+            try:
+                nodes, edges = _result_ids(result, g, scenario.return_alias)
+                assert_same_ids(expected_nodes, nodes, f"node ids ({node_source} vs {engine.name})")
+                assert_same_ids(expected_edges, edges, f"edge ids ({edge_source} vs {engine.name})")
+                if row_column is not None:
+                    _assert_rows(scenario, row_column, result._nodes, g._node, engine.name)
+            except AssertionError as exc:
+                failures.append(str(exc))
+    if failures:
+        raise AssertionError("\n".join(failures))
+    return timer.timings
+
+
+@dataclass(frozen=True)
+class ScenarioResult:
+    key: str
+    feature_path: str
+    outcome: str
+    message: Optional[str] = None
+    duration: float = 0.0
+    cached: bool = False
+    # Seconds per phase and "<engine>.<phase>"; see profiling.profile_records.
+    timings: Dict[str, float] = field(default_factory=dict)
+    # Peak traced bytes per phase (when tracing) and result row counts.
+    metrics: Dict[str, int] = field(default_factory=dict)
+
+
+def run_entry(
+    entry: ScenarioIndexEntry, registry: ScenarioRegistry = REGISTRY, trace_memory: bool = False
+) -> ScenarioResult:
+    # Mirrors test_cypher_tck_scenario without pytest: xfail/skip entries are not executed.
+    if entry.status == "skip":
+        return ScenarioResult(entry.key, entry.feature_path, "skipped", entry.reason or "skipped")
+    if entry.status == "xfail":
+        return ScenarioResult(entry.key, entry.feature_path, "xfailed", entry.reason or "expected failure")
+    start = time.perf_counter()
+    timer = PhaseTimer({}, {}, trace_memory=trace_memory)
+    try:
+        with timer.phase("catalog_load"):
+            scenario = registry.get(entry.key)
+        check_scenario(scenario, timer=timer)
+    except AssertionError as exc:
+        outcome, message = "failed", str(exc) or "AssertionError"
+    except Exception as exc:
+        outcome, message = "error", f"{type(exc).__name__}: {exc}"
+    else:
+        outcome, message = "passed", None
+    duration = time.perf_counter() - start
+    return ScenarioResult(
+        entry.key, entry.feature_path, outcome, message, duration, timings=timer.timings, metrics=timer.metrics
+    )
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+_DIFF_LIMIT = 10
+# Object columns holding only numbers compare by value, like numeric columns.
+_NUMERIC_INFERRED = {"integer", "floating", "mixed-integer-float"}
+_TAG_MULTIPLIER = np.uint64(0x9E3779B97F4A7C15)
+
+
+# Sorted, de-duplicated ID set. Numeric IDs compare by value; everything else
+# compares by 64-bit hash, so no Python objects are boxed on the equal path.
+# Null IDs are kept (as NaN or None) so an engine returning them fails.
+@dataclass(frozen=True, eq=False)
+class IdSet:
+    keys: np.ndarray
+    values: np.ndarray
+    hashed: bool
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, IdSet):
+            return NotImplemented
+        if len(self.keys) != len(other.keys):
+            return False
+        if not len(self.keys):
+            return True
+        return self.hashed == other.hashed and bool(np.array_equal(self.keys, other.keys, equal_nan=True))
+
+    __hash__ = None  # type: ignore[assignment]
+
+
+def _as_array(values: Any) -> np.ndarray:
+    if values is None:
+        return np.empty(0, dtype=object)
+    if hasattr(values, "to_pandas"):
+        values = values.to_pandas()
+    if isinstance(values, (set, frozenset)):
+        values = list(values)
+    series = values if isinstance(values, pd.Series) else pd.Series(values)
+    if series.dtype == object:
+        # Path follows the values, not the dtype: object columns of ints match int64 ones.
+        inferred = pd.api.types.infer_dtype(series, skipna=True)
+        if inferred in _NUMERIC_INFERRED:
+            series = pd.to_numeric(series)
+        elif inferred == "boolean" and not series.hasnans:
+            series = series.astype(bool)
+    if series.dtype.kind in "iufb":
+        if series.hasnans:
+            return series.to_numpy(dtype=np.float64, na_value=np.nan)
+        return series.to_numpy(dtype=getattr(series.dtype, "numpy_dtype", series.dtype))
+    return series.to_numpy(dtype=object, na_value=None)
+
+
+def _type_name(value: Any) -> str:
+    if isinstance(value, np.generic):
+        value = value.item()
+    return "" if isinstance(value, str) else type(value).__name__
+
+
+def _hash_ids(array: np.ndarray) -> np.ndarray:
+    # hash_array stringifies objects, so 1, True, (1, 2) and None would collide
+    # with "1", "True", "(1, 2)" and "None". Non-string values mix in a hash of
+    # their type; strings keep the plain hash, so all-string columns skip the
+    # per-value pass.
+    keys = pd.util.hash_array(array, categorize=False)
+    if pd.api.types.infer_dtype(array, skipna=False) in ("string", "empty"):
+        return keys
+    tags = np.fromiter(map(_type_name, array), dtype=object, count=len(array))
+    mixed = pd.util.hash_array(tags, categorize=False) * _TAG_MULTIPLIER
+    return np.where(tags == "", keys, keys ^ mixed)
+
+
+def id_set(values: Any) -> IdSet:
+    array = _as_array(values)
+    hashed = array.dtype.kind not in "iufb"
+    keys = _hash_ids(array) if hashed else array
+    keys, first = np.unique(keys, return_index=True)
+    return IdSet(keys=keys, values=array[first], hashed=hashed)
+
+
+def ids_from_df(df: Any, id_col: str) -> IdSet:
+    if df is None or id_col not in df.columns:
+        return id_set(None)
+    return id_set(df[id_col])
+
+
+def alias_ids(df: Any, id_col: str, alias: str) -> IdSet:
+    if df is None or alias not in df.columns:
+        return id_set(None)
+    return id_set(df[id_col][df[alias].fillna(False).astype(bool)])
+
+
+def _only_in(left: IdSet, right: IdSet) -> np.ndarray:
+    if left.hashed != right.hashed:
+        return left.values
+    mask = ~np.isin(left.keys, right.keys, assume_unique=True)
+    if left.keys.dtype.kind == "f" and right.keys.dtype.kind == "f" and np.isnan(right.keys).any():
+        mask &= ~np.isnan(left.keys)
+    return left.values[mask]
+
+
+def diff_ids(expected: IdSet, actual: IdSet) -> Tuple[np.ndarray, np.ndarray]:
+    return _only_in(expected, actual), _only_in(actual, expected)
+
+
+def _preview(values: np.ndarray, limit: int) -> str:
+    shown: List[Any] = [value.item() if isinstance(value, np.generic) else value for value in values[:limit]]
+    more = len(values) - len(shown)
+    return f"{shown}" + (f" (+{more} more)" if more > 0 else "")
+
+
+def assert_same_ids(expected: IdSet, actual: IdSet, what: str, limit: int = _DIFF_LIMIT) -> None:
+    if expected == actual:
+        return
+    missing, extra = diff_ids(expected, actual)
+    raise AssertionError(
+        f"{what}: expected {len(expected)}, got {len(actual)}; "
+        f"missing {_preview(missing, limit)}, extra {_preview(extra, limit)}"
+    )
+
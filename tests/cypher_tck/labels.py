@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import copy
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from graphistry.compute import is_in
+from graphistry.compute.ast import ASTEdge, ASTNode
+from graphistry.compute.predicates.ASTPredicate import ASTPredicate
+
+from tests.cypher_tck.columnar import ColumnTable
+from tests.cypher_tck.models import GraphFixture
+
+LABEL_PREFIX = "label__"
+MASK_PREFIX = "label_mask_"
+_WORD_BITS = 64
+
+
+@dataclass(frozen=True)
+class LabelDictionary:
+    labels: Tuple[str, ...]
+
+    @property
+    def n_words(self) -> int:
+        return max(1, -(-len(self.labels) // _WORD_BITS))
+
+    @property
+    def columns(self) -> List[str]:
+        return [f"{MASK_PREFIX}{word}" for word in range(self.n_words)]
+
+    def masks(self, labels: Iterable[str]) -> Optional[List[int]]:
+        words = [0] * self.n_words
+        positions = {label: idx for idx, label in enumerate(self.labels)}
+        for label in labels:
+            position = positions.get(label)
+            if position is None:
+                return None
+            words[position // _WORD_BITS] |= 1 << (position % _WORD_BITS)
+        return words
+
+
+def _exploded_labels(labels: pd.Series) -> pd.Series:
+    exploded = labels.reset_index(drop=True).explode()
+    return exploded[exploded.notna()]
+
+
+def label_dictionary(fixture: GraphFixture) -> LabelDictionary:
+    nodes = fixture.nodes
+    if isinstance(nodes, ColumnTable) and "labels" in nodes.columns:
+        labels = pd.Series(nodes.columns["labels"], dtype=object)
+    else:
+        labels = pd.Series([node.get("labels") for node in nodes], dtype=object)
+    return LabelDictionary(tuple(sorted(pd.unique(_exploded_labels(labels)))))
+
+
+def encode_label_bitmask(
+    nodes_df: pd.DataFrame, dictionary: Optional[LabelDictionary] = None, label_col: str = "labels"
+) -> pd.DataFrame:
+    if label_col not in nodes_df.columns:
+        exploded = pd.Series([], dtype=object)
+    else:
+        exploded = _exploded_labels(nodes_df[label_col])
+    if dictionary is None:
+        dictionary = LabelDictionary(tuple(sorted(pd.unique(exploded))))
+    positions = pd.Index(dictionary.labels, dtype=object).get_indexer(exploded)
+    if (positions < 0).any():
+        missing = sorted(set(exploded[positions < 0]))
+        raise ValueError(f"Labels missing from dictionary: {missing}")
+    words = np.zeros((len(nodes_df), dictionary.n_words), dtype=np.uint64)
+    bits = np.left_shift(np.uint64(1), (positions % _WORD_BITS).astype(np.uint64))
+    np.bitwise_or.at(words, (exploded.index.to_numpy(dtype=np.int64), positions // _WORD_BITS), bits)
+    mask_df = pd.DataFrame(words, columns=dictionary.columns, index=nodes_df.index)
+    nodes_df = nodes_df.drop(columns=[col for col in mask_df.columns if col in nodes_df.columns])
+    return pd.concat([nodes_df, mask_df], axis=1)
+
+
+class HasLabels(ASTPredicate):
+    def __init__(self, all_of: int = 0, none_of: int = 0) -> None:
+        self.all_of = all_of
+        self.none_of = none_of
+
+    def __call__(self, s: Any) -> Any:
+        values = s.astype("uint64")
+        all_of = np.uint64(self.all_of)
+        result = (values & all_of) == all_of
+        if self.none_of:
+            result = result & ((values & np.uint64(self.none_of)) == np.uint64(0))
+        return result
+
+
+def has_labels(all_of: int = 0, none_of: int = 0) -> HasLabels:
+    return HasLabels(all_of=all_of, none_of=none_of)
+
+
+def label_mask_filter(filter_dict: Optional[Dict[str, Any]], dictionary: LabelDictionary) -> Optional[Dict[str, Any]]:
+    if not filter_dict or not any(key.startswith(LABEL_PREFIX) for key in filter_dict):
+        return filter_dict
+    required: List[str] = []
+    forbidden: List[str] = []
+    rewritten: Dict[str, Any] = {}
+    for key, value in filter_dict.items():
+        if not key.startswith(LABEL_PREFIX) or not isinstance(value, (bool, np.bool_)):
+            rewritten[key] = value
+            continue
+        (required if value else forbidden).append(key[len(LABEL_PREFIX):])
+    required_masks = dictionary.masks(required)
+    if required_masks is None:
+        # A required label that no node carries can never match.
+        rewritten[dictionary.columns[0]] = is_in([])
+        return rewritten
+    forbidden_masks = dictionary.masks(label for label in forbidden if label in dictionary.labels) or []
+    for word, column in enumerate(dictionary.columns):
+        all_of = required_masks[word]
+        none_of = forbidden_masks[word] if forbidden_masks else 0
+        if all_of or none_of:
+            rewritten[column] = has_labels(all_of=all_of, none_of=none_of)
+    return rewritten
+
+
+def rewrite_label_filters(chain: Sequence[Any], dictionary: LabelDictionary) -> List[Any]:
+    rewritten: List[Any] = []
+    for op in chain:
+        if isinstance(op, ASTNode):
+            new_op = copy.copy(op)
+            new_op.filter_dict = label_mask_filter(op.filter_dict, dictionary)
+        elif isinstance(op, ASTEdge):
+            new_op = copy.copy(op)
+            new_op.source_node_match = label_mask_filter(op.source_node_match, dictionary)
+            new_op.destination_node_match = label_mask_filter(op.destination_node_match, dictionary)
+        else:
+            new_op = op
+        rewritten.append(new_op)
+    return rewritten
@@ -1,5 +1,34 @@
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Sequence, Tuple
+import hashlib
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, Dict, List, NoReturn, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:
+    from tests.cypher_tck.values import ValueRows
+
+
+class FrozenRecord(dict):
+    __slots__ = ()
+
+    def _readonly(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise TypeError("FrozenRecord is immutable")
+
+    __setitem__ = _readonly
+    __delitem__ = _readonly
+    __ior__ = _readonly
+    clear = _readonly
+    pop = _readonly
+    popitem = _readonly
+    setdefault = _readonly
+    update = _readonly
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (FrozenRecord, (dict(self),))
+
+
+def _record_key(record: Dict[str, Any]) -> str:
+    items = sorted(record.items(), key=lambda item: item[0])
+    return repr([(key, tuple(value) if isinstance(value, list) else value) for key, value in items])
 
 
 @dataclass(frozen=True)
@@ -13,12 +42,30 @@ class GraphFixture:
     node_columns: Tuple[str, ...] = ("id", "labels")
     edge_columns: Tuple[str, ...] = ("src", "dst", "edge_id", "type")
 
+    @cached_property
+    def fingerprint(self) -> str:
+        digest = hashlib.sha256()
+        digest.update(repr((self.node_id, self.src, self.dst, self.edge_id)).encode())
+        digest.update(repr((self.node_columns, self.edge_columns)).encode())
+        for tag, records in ((b"nodes", self.nodes), (b"edges", self.edges)):
+            digest.update(tag)
+            if hasattr(records, "update_digest"):
+                # ColumnTable: hash the column buffers, not one record at a time.
+                records.update_digest(digest)
+                continue
+            for record in records:
+                digest.update(_record_key(record).encode())
+                digest.update(b"\n")
+        return digest.hexdigest()
+
 
 @dataclass(frozen=True)
 class Expected:
     node_ids: Optional[Sequence[Any]] = None
     edge_ids: Optional[Sequence[Any]] = None
     rows: Optional[List[Dict[str, Any]]] = None
+    # Typed `rows`, filled in by the registry so the catalog caches the parse.
+    values: Optional["ValueRows"] = field(default=None, compare=False, repr=False)
 
 
 @dataclass(frozen=True)
@@ -34,3 +81,14 @@ class Scenario:
     reason: Optional[str] = None
     tags: Tuple[str, ...] = ()
     return_alias: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class ScenarioIndexEntry:
+    key: str
+    feature_path: str
+    module_path: str
+    status: str = "supported"
+    reason: Optional[str] = None
+    tags: Tuple[str, ...] = ()
+    translated: bool = False
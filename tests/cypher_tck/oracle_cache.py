@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+from graphistry.gfql.ref import enumerator
+from graphistry.gfql.ref.enumerator import OracleCaps
+
+from tests.cypher_tck.models import GraphFixture
+from tests.cypher_tck.scenarios.catalog import default_cache_dir
+
+ORACLE_CACHE_FORMAT = 1
+
+
+def default_oracle_cache_dir() -> Optional[Path]:
+    if os.environ.get("TCK_GFQL_ORACLE_CACHE", "1") == "0":
+        return None
+    return default_cache_dir() / "oracle"
+
+
+@lru_cache(maxsize=1)
+def oracle_version() -> str:
+    # The oracle is the reference enumerator package, not the engines under
+    # test, so its sources (rather than the pygraphistry version) key the cache.
+    digest = hashlib.sha256(f"format={ORACLE_CACHE_FORMAT}".encode())
+    for path in sorted(Path(enumerator.__file__).parent.glob("*.py")):
+        digest.update(path.name.encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def chain_key(chain: Sequence[Any]) -> Optional[str]:
+    try:
+        return json.dumps([op.to_json() for op in chain], sort_keys=True, default=repr)
+    except Exception:
+        return None
+
+
+@dataclass(frozen=True)
+class OracleEntry:
+    node_ids: Tuple[Any, ...]
+    edge_ids: Tuple[Any, ...]
+    tags: Dict[str, Tuple[Any, ...]]
+
+
+def oracle_entry(result: Any, node_col: str, edge_col: Optional[str]) -> OracleEntry:
+    def _ids(df: Any, col: Optional[str]) -> Tuple[Any, ...]:
+        if df is None or col is None or col not in df.columns:
+            return ()
+        return tuple(df[col].tolist())
+
+    return OracleEntry(
+        node_ids=_ids(result.nodes, node_col),
+        edge_ids=_ids(result.edges, edge_col),
+        tags={alias: tuple(ids) for alias, ids in result.tags.items()},
+    )
+
+
+class OracleCache:
+    def __init__(self, directory: Optional[Path]) -> None:
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, fixture: GraphFixture, chain: Sequence[Any], caps: OracleCaps, variant: str = "") -> Optional[str]:
+        serialized = chain_key(chain)
+        if serialized is None:
+            return None
+        payload = json.dumps(
+            [fixture.fingerprint, serialized, asdict(caps), oracle_version(), variant], sort_keys=True, default=repr
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        assert self.directory is not None
+        return self.directory / key[:2] / f"{key}.pkl"
+
+    def load(self, key: str) -> Optional[OracleEntry]:
+        try:
+            entry = pickle.loads(self._path(key).read_bytes())
+        except Exception:
+            return None
+        return entry if isinstance(entry, OracleEntry) else None
+
+    def store(self, key: str, entry: OracleEntry) -> None:
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".oracle-", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as handle:
+                    pickle.dump(entry, handle, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_name, path)
+            except BaseException:
+                if os.path.exists(tmp_name):
+                    os.unlink(tmp_name)
+                raise
+        except OSError:
+            # A read-only checkout still runs; it just recomputes the oracle next time.
+            pass
+
+    def get(
+        self,
+        fixture: GraphFixture,
+        chain: Sequence[Any],
+        caps: OracleCaps,
+        compute: Callable[[], OracleEntry],
+        variant: str = "",
+    ) -> OracleEntry:
+        key = self.key(fixture, chain, caps, variant) if self.directory is not None else None
+        if key is not None:
+            cached = self.load(key)
+            if cached is not None:
+                self.hits += 1
+                return cached
+        self.misses += 1
+        entry = compute()
+        if key is not None:
+            self.store(key, entry)
+        return entry
@@ -1,177 +1,321 @@
+import os
 import re
+import weakref
+from collections import deque
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, List, Sequence, Tuple
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Union
 
+from tests.cypher_tck.columnar import ColumnTable
 from tests.cypher_tck.models import GraphFixture
 
+_NODE_COLUMNS = ("id", "labels")
+_EDGE_COLUMNS = ("edge_id", "src", "dst", "type", "undirected")
+
+
+class _TableBuilder:
+    def __init__(self, columns: Sequence[str]) -> None:
+        self.columns: Dict[str, List[Any]] = {name: [] for name in columns}
+        self.properties: Dict[str, List[Any]] = {}
+        self.length = 0
+
+    def append(self, values: Dict[str, Any], props: Dict[str, Any]) -> int:
+        for name, column in self.columns.items():
+            column.append(values.get(name))
+        for key, value in props.items():
+            column = self.properties.get(key)
+            if column is None:
+                column = self.properties[key] = [None] * self.length
+            column.append(value)
+        self.length += 1
+        for column in self.properties.values():
+            if len(column) < self.length:
+                column.append(None)
+        return self.length - 1
+
+    def set_default(self, row: int, key: str, value: Any) -> None:
+        column = self.properties.get(key)
+        if column is None:
+            column = self.properties[key] = [None] * self.length
+        if column[row] is None:
+            column[row] = value
+
+    def build(self) -> ColumnTable:
+        return ColumnTable.from_lists(self.columns, self.properties, self.length)
+
 
 @dataclass
 class ParseContext:
-    nodes_by_id: Dict[str, Dict[str, Any]]
+    nodes: _TableBuilder
+    edges: _TableBuilder
+    node_rows: Dict[str, int]
     var_to_id: Dict[str, str]
     node_counter: int
     rel_counter: int
 
 
-_CREATE_SPLIT_RE = re.compile(r"\bCREATE\b", flags=re.IGNORECASE)
+ScriptSource = Union[str, "os.PathLike[str]", Iterable[str]]
+_FIXTURE_CACHE_SIZE = 1024
+_FIXTURE_EDGE_COLUMNS = ("src", "dst", "edge_id", "type", "undirected")
+_DEFAULT_CHUNK_ROWS = 100_000
+_INTERNED_FIXTURES: "weakref.WeakValueDictionary[str, GraphFixture]" = weakref.WeakValueDictionary()
 
 
-def _split_top_level(text: str) -> List[str]:
-    parts: List[str] = []
-    buf: List[str] = []
-    depth_paren = 0
-    depth_brace = 0
-    depth_bracket = 0
-    in_quote = False
-    for ch in text:
-        if ch == "'":
-            in_quote = not in_quote
-        if not in_quote:
-            if ch == '(':
-                depth_paren += 1
-            elif ch == ')':
-                depth_paren = max(depth_paren - 1, 0)
-            elif ch == '{':
-                depth_brace += 1
-            elif ch == '}':
-                depth_brace = max(depth_brace - 1, 0)
-            elif ch == '[':
-                depth_bracket += 1
-            elif ch == ']':
-                depth_bracket = max(depth_bracket - 1, 0)
-        if ch == ',' and not in_quote and depth_paren == 0 and depth_brace == 0 and depth_bracket == 0:
-            part = ''.join(buf).strip()
-            if part:
-                parts.append(part)
-            buf = []
-            continue
-        buf.append(ch)
-    tail = ''.join(buf).strip()
-    if tail:
-        parts.append(tail)
-    return parts
-
-
-def _extract_balanced(text: str, open_ch: str, close_ch: str) -> Tuple[str, str]:
-    depth = 0
-    start = None
-    in_quote = False
-    for idx, ch in enumerate(text):
-        if ch == "'":
-            in_quote = not in_quote
-        if in_quote:
-            continue
-        if ch == open_ch:
-            if depth == 0:
-                start = idx
-            depth += 1
-        elif ch == close_ch:
-            depth -= 1
-            if depth == 0 and start is not None:
-                return text[start : idx + 1], text[idx + 1 :]
-    raise ValueError(f"Unbalanced {open_ch}{close_ch} in: {text}")
-
-
-def _parse_properties(prop_text: str) -> Dict[str, Any]:
-    props: Dict[str, Any] = {}
-    inner = prop_text.strip()[1:-1].strip()
-    if not inner:
-        return props
-    items = _split_top_level(inner)
-    for item in items:
-        if ':' not in item:
+class Token(NamedTuple):
+    kind: str
+    value: str
+    raw: str
+    space: str
+    start: int
+
+
+_TOKEN_RE = re.compile(
+    r"""
+    (?P<punct><-|->|[()\[\]{}:,\-;])
+    | (?P<name>[^\W\d]\w*)
+    | (?P<space>\s+)
+    | (?P<number>\d+(?:\.\d+)?(?:[eE][+-]?\d+)?)
+    | (?P<string>'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*")
+    | (?P<quoted>`(?:[^`]|``)*`(?!`))
+    | (?P<other>.)
+    """,
+    flags=re.VERBOSE | re.DOTALL,
+)
+_ESCAPE_RE = re.compile(r"\\(u[0-9a-fA-F]{4}|.)", flags=re.DOTALL)
+_ESCAPES = {"t": "\t", "b": "\b", "n": "\n", "r": "\r", "f": "\f"}
+_INT_RE = re.compile(r"-?\d+")
+_FLOAT_RE = re.compile(r"-?\d+\.\d+")
+# Rest of a literal continued from an earlier line, through its closing quote.
+_LITERAL_END_RE = {
+    "'": re.compile(r"(?:[^'\\]|\\.)*'", flags=re.DOTALL),
+    '"': re.compile(r'(?:[^"\\]|\\.)*"', flags=re.DOTALL),
+    "`": re.compile(r"(?:[^`]|``)*`(?!`)"),
+}
+# A literal open for longer than this is reported rather than buffered on.
+_MAX_LITERAL_CHARS = 1 << 20
+_OPENERS = frozenset("([{")
+_CLOSERS = frozenset(")]}")
+
+
+class _UnterminatedLiteral(ValueError):
+    def __init__(self, quote: str, offset: int, text: str) -> None:
+        super().__init__(f"Unterminated {quote} literal at offset {offset} in: {text}")
+        self.quote = quote
+        self.offset = offset
+
+
+def _unescape(body: str) -> str:
+    def replace(match: "re.Match[str]") -> str:
+        code = match.group(1)
+        if code[0] == "u" and len(code) == 5:
+            return chr(int(code[1:], 16))
+        return _ESCAPES.get(code, code)
+
+    return _ESCAPE_RE.sub(replace, body) if "\\" in body else body
+
+
+def tokenize(text: str) -> List[Token]:
+    tokens: List[Token] = []
+    append = tokens.append
+    space = ""
+    for match in _TOKEN_RE.finditer(text):
+        kind = match.lastgroup
+        raw = match.group()
+        if kind == "space":
+            space = raw
             continue
-        key, raw = item.split(':', 1)
-        key = key.strip()
-        raw = raw.strip()
-        if raw.startswith("'") and raw.endswith("'"):
-            value: Any = raw[1:-1]
-        elif re.fullmatch(r"-?\d+", raw):
-            value = int(raw)
-        elif re.fullmatch(r"-?\d+\.\d+", raw):
-            value = float(raw)
-        elif raw.lower() == "null":
-            value = None
-        elif raw.lower() in {"true", "false"}:
-            value = raw.lower() == "true"
+        start = match.start()
+        if kind == "punct":
+            append(Token(raw, raw, raw, space, start))
+        elif kind == "string":
+            append(Token("string", _unescape(raw[1:-1]), raw, space, start))
+        elif kind == "quoted":
+            append(Token("name", raw[1:-1].replace("``", "`"), raw, space, start))
+        elif kind == "other" and raw in "'\"`":
+            raise _UnterminatedLiteral(raw, start, text)
         else:
-            value = raw
-        props[key] = value
-    return props
-
-
-def _parse_node(node_text: str, ctx: ParseContext) -> str:
-    inner = node_text.strip()[1:-1].strip()
-    props: Dict[str, Any] = {}
-    if '{' in inner:
-        before, prop_part = inner.split('{', 1)
-        inner = before.strip()
-        props = _parse_properties('{' + prop_part)
-    var: str | None = None
-    labels: List[str] = []
-    if inner:
-        if inner.startswith(':'):
-            var_part = ''
-            label_part = inner
+            append(Token(kind, raw, raw, space, start))
+        space = ""
+    return tokens
+
+
+def _open_escape(quote: str, text: str) -> bool:
+    # Whether `text`, inside a quoted literal, ends on an unpaired backslash.
+    return quote != "`" and (len(text) - len(text.rstrip("\\"))) % 2 == 1
+
+
+def _literal_end(text: str, quote: str, escaped: bool) -> Tuple[int, bool]:
+    # Offset just past the closing quote in `text` (-1 if the literal stays
+    # open) and whether it ends mid-escape.
+    start = 1 if escaped else 0
+    match = _LITERAL_END_RE[quote].match(text, start)
+    if match is not None:
+        return match.end(), False
+    return -1, _open_escape(quote, text[start:])
+
+
+def _iter_line_tokens(lines: Iterable[str]) -> Iterator[Token]:
+    # Tokens as if the stripped, non-empty lines were joined by single spaces
+    # (the same text `_normalize_script` produces), without building that text.
+    # A quoted literal spanning lines is buffered from its opening quote, and
+    # each new line is only scanned for the closing quote.
+    first = True
+    quote: Optional[str] = None
+    parts: List[str] = []
+    size = 0
+    escaped = False
+    space = ""
+    opened = 0
+    number = 0
+    for chunk in lines:
+        for line in chunk.splitlines():
+            number += 1
+            line = line.strip()
+            if not line:
+                continue
+            if quote is not None:
+                text = " " + line
+                end, escaped = _literal_end(text, quote, escaped)
+                parts.append(text)
+                size += len(text)
+                if end < 0:
+                    if size > _MAX_LITERAL_CHARS:
+                        raise ValueError(
+                            f"Unterminated {quote} literal opened on line {opened} "
+                            f"runs past {_MAX_LITERAL_CHARS} characters"
+                        )
+                    continue
+                text, lead, quote = "".join(parts), space, None
+            else:
+                text, lead = line, "" if first else " "
+            try:
+                tokens = tokenize(text)
+            except _UnterminatedLiteral as exc:
+                prefix, body = text[: exc.offset], text[exc.offset:]
+                tokens = tokenize(prefix)
+                space = prefix[len(prefix.rstrip()):] if tokens else lead
+                quote, opened, parts, size = exc.quote, number, [body], len(body)
+                escaped = _open_escape(quote, body[1:])
+            if tokens:
+                tokens[0] = tokens[0]._replace(space=lead)
+                first = False
+                yield from tokens
+    if quote is not None:
+        raise ValueError(f"Unterminated {quote} literal opened on line {opened}")
+
+
+def _literal_value(raw: str) -> Any:
+    if _INT_RE.fullmatch(raw):
+        return int(raw)
+    if _FLOAT_RE.fullmatch(raw):
+        return float(raw)
+    lowered = raw.lower()
+    if lowered == "null":
+        return None
+    if lowered in {"true", "false"}:
+        return lowered == "true"
+    return raw
+
+
+def _raw_text(tokens: Sequence[Token]) -> str:
+    return "".join(token.raw if idx == 0 else token.space + token.raw for idx, token in enumerate(tokens))
+
+
+def _list_literal(tokens: Sequence[Token]) -> Tuple[Any, ...] | None:
+    # Lists of literals (nested lists included) become tuples; anything else
+    # inside the brackets keeps the whole value as source text.
+    parsed = _list_items(tokens, 0)
+    if parsed is None or parsed[1] != len(tokens):
+        return None
+    return parsed[0]
+
+
+def _list_items(tokens: Sequence[Token], index: int) -> Tuple[Tuple[Any, ...], int] | None:
+    # tokens[index] is "["; returns the items and the index after the matching "]".
+    items: List[Any] = []
+    index += 1
+    if index < len(tokens) and tokens[index].kind == "]":
+        return (), index + 1
+    while index < len(tokens):
+        if tokens[index].kind == "[":
+            nested = _list_items(tokens, index)
+            if nested is None:
+                return None
+            value, index = nested
         else:
-            var_part, *rest = inner.split(':')
-            label_part = ':' + ':'.join(rest) if rest else ''
-        var_part = var_part.strip()
-        if var_part:
-            var = var_part
-        if label_part:
-            labels = [lab for lab in label_part.split(':') if lab]
+            end = index
+            while end < len(tokens) and tokens[end].kind not in (",", "]", "["):
+                end += 1
+            value = _element_value(tokens[index:end])
+            if value is _NOT_LITERAL:
+                return None
+            index = end
+        items.append(value)
+        if index >= len(tokens):
+            return None
+        if tokens[index].kind == "]":
+            return tuple(items), index + 1
+        if tokens[index].kind != ",":
+            return None
+        index += 1
+    return None
+
+
+_NOT_LITERAL = object()
+
+
+def _element_value(tokens: Sequence[Token]) -> Any:
+    if len(tokens) == 1 and tokens[0].kind == "string":
+        return tokens[0].value
+    if not tokens or any(token.kind not in ("-", "number", "name") for token in tokens):
+        return _NOT_LITERAL
+    value = _literal_value(_raw_text(tokens))
+    return _NOT_LITERAL if isinstance(value, str) else value
+
+
+def _bind_node(ctx: ParseContext, var: str | None, labels: List[str], props: Dict[str, Any]) -> str:
     if var and var in ctx.var_to_id:
         node_id = ctx.var_to_id[var]
+        if node_id not in ctx.node_rows:
+            # Streaming ingestion already emitted this node with an earlier chunk.
+            if labels or props:
+                raise ValueError(f"Node '{var}' was flushed in an earlier chunk and cannot gain labels or properties")
+            return node_id
     else:
         node_id = var or f"anon_{ctx.node_counter}"
         ctx.node_counter += 1
         if var:
             ctx.var_to_id[var] = node_id
-    if node_id in ctx.nodes_by_id:
-        node = ctx.nodes_by_id[node_id]
-        existing_labels = list(node.get("labels", []))
+    row = ctx.node_rows.get(node_id)
+    if row is not None:
+        label_column = ctx.nodes.columns["labels"]
+        existing_labels = list(label_column[row])
         for lab in labels:
             if lab not in existing_labels:
                 existing_labels.append(lab)
-        node["labels"] = existing_labels
+        label_column[row] = tuple(existing_labels)
         for key, value in props.items():
-            node.setdefault(key, value)
+            if key not in _NODE_COLUMNS:
+                ctx.nodes.set_default(row, key, value)
     else:
-        node = {"id": node_id, "labels": labels, **props}
-        ctx.nodes_by_id[node_id] = node
+        values = {"id": node_id, "labels": tuple(labels)}
+        for key in _NODE_COLUMNS:
+            if key in props:
+                values[key] = props.pop(key)
+        ctx.node_rows[node_id] = ctx.nodes.append(values, props)
     return node_id
 
 
-def _parse_rel_segment(
-    rel_segment: str, ctx: ParseContext
-) -> Tuple[str, str | None, Dict[str, Any]]:
-    rel_inner = rel_segment.strip()[1:-1].strip()
-    rel_props: Dict[str, Any] = {}
-    if '{' in rel_inner:
-        before, prop_part = rel_inner.split('{', 1)
-        rel_inner = before.strip()
-        rel_props = _parse_properties('{' + prop_part)
-    rel_var = None
-    rel_type = None
-    if rel_inner:
-        rel_parts = rel_inner.split(':')
-        rel_var = rel_parts[0].strip() or None
-        if len(rel_parts) > 1:
-            rel_type = rel_parts[1].strip() or None
-    edge_id = rel_var or f"rel_{ctx.rel_counter}"
-    ctx.rel_counter += 1
-    return edge_id, rel_type, rel_props
-
-def _edge_from_segment(
+def _edge_record(
     left_id: str,
     right_id: str,
-    rel_segment: str,
-    left_dir: str | None,
+    edge_id: str,
+    rel_type: str | None,
+    rel_props: Dict[str, Any],
+    left_dir: str,
     right_dir: str | None,
-    ctx: ParseContext,
 ) -> Dict[str, Any]:
-    edge_id, rel_type, rel_props = _parse_rel_segment(rel_segment, ctx)
     if left_dir == '<-' and right_dir == '-':
         src, dst = right_id, left_id
     elif left_dir == '-' and right_dir == '->':
@@ -195,69 +339,233 @@ def _edge_from_segment(
     return edge
 
 
-def _parse_chain(pattern: str, ctx: ParseContext) -> List[Dict[str, Any]]:
-    edges: List[Dict[str, Any]] = []
-    node_text, rest = _extract_balanced(pattern.strip(), '(', ')')
-    left_id = _parse_node(node_text, ctx)
-    text = rest.strip()
-    while text:
-        left_dir = None
-        if text.startswith('<-'):
-            left_dir = '<-'
-            text = text[2:]
-        elif text.startswith('-'):
-            left_dir = '-'
-            text = text[1:]
-        else:
-            break
+# Recursive-descent parser over a token stream with two tokens of lookahead;
+# every token is visited once, so parse time stays linear in the script length.
+class _CreateParser:
+    def __init__(self, tokens: Iterable[Token], ctx: ParseContext) -> None:
+        self.tokens = iter(tokens)
+        self.lookahead: Deque[Token] = deque()
+        self.ctx = ctx
 
-        rel_segment, rest = _extract_balanced(text.strip(), '[', ']')
-        text = rest.strip()
+    def _peek(self, offset: int = 0) -> Token | None:
+        if offset < len(self.lookahead):
+            return self.lookahead[offset]
+        while len(self.lookahead) <= offset:
+            token = next(self.tokens, None)
+            if token is None:
+                return None
+            self.lookahead.append(token)
+        return self.lookahead[offset]
 
-        right_dir = None
-        if text.startswith('->'):
-            right_dir = '->'
-            text = text[2:]
-        elif text.startswith('-'):
-            right_dir = '-'
-            text = text[1:]
+    def _accept(self, kind: str) -> Token | None:
+        token = self._peek()
+        if token is None or token.kind != kind:
+            return None
+        return self.lookahead.popleft()
 
-        node_text, rest = _extract_balanced(text.strip(), '(', ')')
-        right_id = _parse_node(node_text, ctx)
-        text = rest.strip()
+    def _peek_kind(self, kind: str) -> bool:
+        token = self._peek()
+        return token is not None and token.kind == kind
 
-        edges.append(_edge_from_segment(left_id, right_id, rel_segment, left_dir, right_dir, ctx))
-        left_id = right_id
-    return edges
+    def _expect(self, kind: str) -> Token:
+        token = self._accept(kind)
+        if token is None:
+            found = self._peek()
+            where = f"'{found.raw}' at offset {found.start}" if found is not None else "end of script"
+            raise ValueError(f"Expected '{kind}' but found {where}")
+        return token
 
+    def parse(self) -> Iterator[None]:
+        # Yields after every node pattern and edge so streaming callers can flush.
+        while True:
+            token = self._peek()
+            if token is None:
+                return
+            self.lookahead.popleft()
+            if token.kind != "name" or token.value.upper() != "CREATE":
+                # Anything outside a CREATE clause (RETURN tails, semicolons) is not fixture data.
+                continue
+            yield from self._parse_pattern()
+            while self._accept(","):
+                yield from self._parse_pattern()
 
-def _extract_create_clauses(script: str) -> List[str]:
-    normalized = " ".join(line.strip() for line in script.strip().splitlines())
-    parts = _CREATE_SPLIT_RE.split(normalized)
-    clauses: List[str] = []
-    for part in parts[1:]:
-        clause = part.strip()
-        if clause:
-            clauses.append(clause)
-    return clauses
+    def _parse_pattern(self) -> Iterator[None]:
+        token, following = self._peek(), self._peek(1)
+        if token is not None and token.kind == "name" and following is not None and following.value == "=":
+            self.lookahead.popleft()
+            self.lookahead.popleft()
+        left_id = self._parse_node()
+        yield
+        while True:
+            token = self._peek()
+            if token is None or token.kind not in ("-", "<-"):
+                return
+            self.lookahead.popleft()
+            left_dir = token.kind
+            edge_id, rel_type, rel_props = self._parse_relationship()
+            right_dir = None
+            for kind in ("->", "-"):
+                if self._accept(kind):
+                    right_dir = kind
+                    break
+            right_id = self._parse_node()
+            edge = _edge_record(left_id, right_id, edge_id, rel_type, rel_props, left_dir, right_dir)
+            props = {key: edge.pop(key) for key in list(edge) if key not in _EDGE_COLUMNS}
+            self.ctx.edges.append(edge, props)
+            left_id = right_id
+            yield
 
+    def _parse_node(self) -> str:
+        self._expect("(")
+        var_token = self._accept("name")
+        labels: List[str] = []
+        while self._accept(":"):
+            labels.append(self._expect("name").value)
+        props = self._parse_map() if self._peek_kind("{") else {}
+        self._expect(")")
+        return _bind_node(self.ctx, var_token.value if var_token else None, labels, props)
 
-def graph_fixture_from_create(script: str) -> GraphFixture:
-    ctx = ParseContext(nodes_by_id={}, var_to_id={}, node_counter=1, rel_counter=1)
-    edges: List[Dict[str, Any]] = []
-    for clause in _extract_create_clauses(script):
-        for pattern in _split_top_level(clause):
-            if '[' in pattern and ']' in pattern:
-                edges.extend(_parse_chain(pattern, ctx))
-            else:
-                _parse_node(pattern, ctx)
-    return GraphFixture(
-        nodes=list(ctx.nodes_by_id.values()),
-        edges=edges,
-        edge_columns=("src", "dst", "edge_id", "type", "undirected"),
+    def _parse_relationship(self) -> Tuple[str, str | None, Dict[str, Any]]:
+        rel_var = None
+        rel_type = None
+        rel_props: Dict[str, Any] = {}
+        if self._accept("["):
+            var_token = self._accept("name")
+            rel_var = var_token.value if var_token else None
+            if self._accept(":"):
+                rel_type = self._expect("name").value
+            if self._peek_kind("{"):
+                rel_props = self._parse_map()
+            self._expect("]")
+        edge_id = rel_var or f"rel_{self.ctx.rel_counter}"
+        self.ctx.rel_counter += 1
+        return edge_id, rel_type, rel_props
+
+    def _parse_map(self) -> Dict[str, Any]:
+        self._expect("{")
+        props: Dict[str, Any] = {}
+        if self._accept("}"):
+            return props
+        while True:
+            key = self._expect("name").value
+            self._expect(":")
+            props[key] = self._parse_value()
+            if not self._accept(","):
+                break
+        self._expect("}")
+        return props
+
+    def _parse_value(self) -> Any:
+        first = self._peek()
+        following = self._peek(1)
+        if first is not None and first.kind == "string" and following is not None and following.kind in (",", "}"):
+            return self.lookahead.popleft().value
+        depth = 0
+        tokens: List[Token] = []
+        while True:
+            token = self._peek()
+            if token is None:
+                raise ValueError("Unterminated property map at end of script")
+            if depth == 0 and token.kind in (",", "}"):
+                break
+            if token.kind in _OPENERS:
+                depth += 1
+            elif token.kind in _CLOSERS:
+                depth -= 1
+            tokens.append(self.lookahead.popleft())
+        if not tokens:
+            raise ValueError(f"Missing property value at offset {token.start}")
+        if tokens[0].kind == "[":
+            items = _list_literal(tokens)
+            if items is not None:
+                return items
+        # Maps and expressions are kept as their source text.
+        return _literal_value(_raw_text(tokens))
+
+
+def _normalize_script(script: str) -> str:
+    return " ".join(line.strip() for line in script.strip().splitlines() if line.strip())
+
+
+def intern_fixture(fixture: GraphFixture) -> GraphFixture:
+    interned = _INTERNED_FIXTURES.get(fixture.fingerprint)
+    if interned is not None:
+        return interned
+    _INTERNED_FIXTURES[fixture.fingerprint] = fixture
+    return fixture
+
+
+def _new_context() -> ParseContext:
+    return ParseContext(
+        nodes=_TableBuilder(_NODE_COLUMNS),
+        edges=_TableBuilder(_EDGE_COLUMNS),
+        node_rows={},
+        var_to_id={},
+        node_counter=1,
+        rel_counter=1,
     )
 
 
+def _fixture_from_context(ctx: ParseContext) -> GraphFixture:
+    return GraphFixture(nodes=ctx.nodes.build(), edges=ctx.edges.build(), edge_columns=_FIXTURE_EDGE_COLUMNS)
+
+
+@lru_cache(maxsize=_FIXTURE_CACHE_SIZE)
+def _fixture_from_normalized(normalized: str) -> GraphFixture:
+    ctx = _new_context()
+    deque(_CreateParser(tokenize(normalized), ctx).parse(), maxlen=0)
+    return intern_fixture(_fixture_from_context(ctx))
+
+
+def graph_fixture_from_create(script: str) -> GraphFixture:
+    return _fixture_from_normalized(_normalize_script(script))
+
+
+def _iter_source_lines(source: ScriptSource) -> Iterator[str]:
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, encoding="utf-8") as handle:
+            yield from handle
+    else:
+        yield from source
+
+
+def iter_fixture_chunks(source: ScriptSource, chunk_rows: int = _DEFAULT_CHUNK_ROWS) -> Iterator[GraphFixture]:
+    # Only variable bindings survive a flush, so a node can gain labels or
+    # properties only while its chunk is still buffered. Chunks are not interned.
+    if chunk_rows < 1:
+        raise ValueError("chunk_rows must be positive")
+    ctx = _new_context()
+    for _ in _CreateParser(_iter_line_tokens(_iter_source_lines(source)), ctx).parse():
+        if ctx.nodes.length >= chunk_rows or ctx.edges.length >= chunk_rows:
+            yield _fixture_from_context(ctx)
+            ctx.nodes = _TableBuilder(_NODE_COLUMNS)
+            ctx.edges = _TableBuilder(_EDGE_COLUMNS)
+            ctx.node_rows = {}
+    if ctx.nodes.length or ctx.edges.length:
+        yield _fixture_from_context(ctx)
+
+
+def write_fixture_parquet(
+    source: ScriptSource, directory: Union[str, os.PathLike], chunk_rows: int = _DEFAULT_CHUNK_ROWS
+) -> List[Path]:
+    import pyarrow.parquet as pq
+
+    out_dir = Path(directory)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    written: List[Path] = []
+    for part, chunk in enumerate(iter_fixture_chunks(source, chunk_rows)):
+        for name, table, columns in (
+            ("nodes", chunk.nodes, _NODE_COLUMNS),
+            ("edges", chunk.edges, _EDGE_COLUMNS),
+        ):
+            if not len(table):
+                continue
+            path = out_dir / f"{name}-{part:05d}.parquet"
+            pq.write_table(table.to_arrow(required_columns=columns), path)
+            written.append(path)
+    return written
+
+
 def merge_fixtures(fixtures: Iterable[GraphFixture]) -> GraphFixture:
     nodes: List[Dict[str, Any]] = []
     edges: List[Dict[str, Any]] = []
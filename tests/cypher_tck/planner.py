@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, List, Optional, Sequence
+
+from graphistry.compute.ast import ASTEdge, ASTNode
+
+from tests.cypher_tck.stats import GraphStats, graph_stats
+
+# Picks which end of a linear chain GFQL starts from. A chain's result (node,
+# edge and alias sets) is the set of complete path matches, which does not
+# depend on the direction the path is walked, so a chain may be reversed
+# whenever the far end is the more selective anchor.
+
+_FLIPPED = {"forward": "reverse", "reverse": "forward", "undirected": "undirected"}
+# Only plain one-hop edges are reversed; hop labels and output bounds are
+# defined relative to the seed side.
+_EDGE_DEFAULTS = {
+    "hops": 1,
+    "min_hops": None,
+    "max_hops": None,
+    "output_min_hops": None,
+    "output_max_hops": None,
+    "label_node_hops": None,
+    "label_edge_hops": None,
+    "label_seeds": False,
+    "to_fixed_point": False,
+    "prune_to_endpoints": False,
+    "include_zero_hop_seed": False,
+}
+
+
+@dataclass(frozen=True)
+class ChainPlan:
+    chain: List[Any]
+    reversed: bool
+    # Estimated rows of the first hop's frontier, as written and reversed.
+    forward_cost: float
+    reverse_cost: float
+
+
+def _reversible(chain: Sequence[Any]) -> bool:
+    if len(chain) < 3 or len(chain) % 2 == 0:
+        return False
+    for index, op in enumerate(chain):
+        if index % 2 == 0:
+            if not isinstance(op, ASTNode):
+                return False
+        elif not isinstance(op, ASTEdge) or any(getattr(op, key) != value for key, value in _EDGE_DEFAULTS.items()):
+            return False
+    return True
+
+
+def reverse_chain(chain: Sequence[Any]) -> List[Any]:
+    reversed_ops: List[Any] = []
+    for op in reversed(chain):
+        if isinstance(op, ASTEdge):
+            # A plain ASTEdge: the e_forward/e_reverse subclasses imply a direction.
+            op = ASTEdge(
+                direction=_FLIPPED[op.direction],
+                edge_match=op.edge_match,
+                source_node_match=op.destination_node_match,
+                destination_node_match=op.source_node_match,
+                source_node_query=op.destination_node_query,
+                destination_node_query=op.source_node_query,
+                edge_query=op.edge_query,
+                name=op._name,
+            )
+        reversed_ops.append(op)
+    return reversed_ops
+
+
+def _anchor_cost(stats: GraphStats, node: Any, edge: Any) -> float:
+    # Anchor rows times the expected matching edges per anchor row.
+    n_nodes = max(stats.node_count, 1)
+    anchors = stats.node_selectivity(node.filter_dict, node.query) * n_nodes
+    fanout = stats.edge_selectivity(edge.edge_match, edge.edge_query) * stats.edge_count / n_nodes
+    return anchors * (1.0 + fanout)
+
+
+def plan_chain(chain: Sequence[Any], g: Any, stats: Optional[GraphStats] = None) -> ChainPlan:
+    # Reverses the chain when starting from its last node is estimated to be
+    # strictly cheaper; ties keep the chain as written.
+    chain = list(chain)
+    if not _reversible(chain):
+        return ChainPlan(chain, False, 0.0, 0.0)
+    stats = graph_stats(g) if stats is None else stats
+    forward_cost = _anchor_cost(stats, chain[0], chain[1])
+    reverse_cost = _anchor_cost(stats, chain[-1], chain[-2])
+    if reverse_cost < forward_cost:
+        return ChainPlan(reverse_chain(chain), True, forward_cost, reverse_cost)
+    return ChainPlan(chain, False, forward_cost, reverse_cost)
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, ContextManager, Dict, Iterator, List, Optional, Sequence
+
+# Phase names recorded once per scenario; engine phases are "<engine>.<phase>".
+SHARED_PHASES = ("catalog_load", "fixture_build", "label_expansion", "oracle", "plan", "comparison")
+ENGINE_PHASES = ("convert", "run", "comparison")
+
+_ACTIVE: "ContextVar[Optional[PhaseTimer]]" = ContextVar("tck_phase_timer", default=None)
+
+
+@dataclass
+class _OpenPhase:
+    baseline: int = 0
+    # Highest traced allocation seen before nested phases reset the peak.
+    peak: int = 0
+    nested_seconds: float = 0.0
+
+
+class PhaseTimer:
+    # Accumulates wall time per phase into `timings`; with trace_memory, also
+    # the tracemalloc peak above the phase's starting allocation into `metrics`.
+    # A phase opened inside another (fixture_build during a graph-cache miss in
+    # "<engine>.convert") is charged only to the inner phase, so timings still
+    # add up to the wall time; the outer peak still covers the inner one.
+    def __init__(
+        self, timings: Dict[str, float], metrics: Optional[Dict[str, int]] = None, trace_memory: bool = False
+    ) -> None:
+        self.timings = timings
+        self.metrics = {} if metrics is None else metrics
+        self.trace_memory = trace_memory and tracemalloc.is_tracing()
+        self._open: List[_OpenPhase] = []
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        current = _OpenPhase()
+        if self.trace_memory:
+            allocated, peak = tracemalloc.get_traced_memory()
+            if self._open:
+                self._open[-1].peak = max(self._open[-1].peak, peak)
+            tracemalloc.reset_peak()
+            current.baseline = current.peak = allocated
+        self._open.append(current)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self._open.pop()
+            if self._open:
+                self._open[-1].nested_seconds += elapsed
+            self.timings[name] = self.timings.get(name, 0.0) + elapsed - current.nested_seconds
+            if self.trace_memory:
+                current.peak = max(current.peak, tracemalloc.get_traced_memory()[1])
+                if self._open:
+                    self._open[-1].peak = max(self._open[-1].peak, current.peak)
+                peak = current.peak - current.baseline
+                self.metrics[f"{name}.peak_bytes"] = max(self.metrics.get(f"{name}.peak_bytes", 0), peak)
+
+    @contextmanager
+    def active(self) -> Iterator["PhaseTimer"]:
+        token = _ACTIVE.set(self)
+        try:
+            yield self
+        finally:
+            _ACTIVE.reset(token)
+
+
+def phase(name: str) -> ContextManager[Any]:
+    # Times `name` against the active timer, if any; code such as the graph
+    # builder runs behind caches and cannot be handed a timer directly.
+    timer = _ACTIVE.get()
+    return timer.phase(name) if timer is not None else nullcontext()
+
+
+def _engines(timings: Dict[str, float]) -> List[str]:
+    engines: List[str] = []
+    for name in timings:
+        engine, _, suffix = name.rpartition(".")
+        if engine and suffix in ENGINE_PHASES and engine not in engines:
+            engines.append(engine)
+    return engines
+
+
+def profile_records(result: Any) -> List[Dict[str, Any]]:
+    # One record per scenario and engine; shared phases repeat on each line so
+    # every line stands alone. Scenarios that ran no engine get one record.
+    shared = {name: result.timings[name] for name in SHARED_PHASES if name in result.timings}
+    shared_peaks = {
+        name: result.metrics[f"{name}.peak_bytes"] for name in SHARED_PHASES if f"{name}.peak_bytes" in result.metrics
+    }
+    base = {"key": result.key, "feature_path": result.feature_path, "outcome": result.outcome, "cached": result.cached}
+    records: List[Dict[str, Any]] = []
+    for engine in _engines(result.timings) or [None]:
+        phases = dict(shared)
+        peaks = dict(shared_peaks)
+        for name in ENGINE_PHASES:
+            if engine is None:
+                continue
+            key = f"{engine}.{name}"
+            if key in result.timings:
+                phases[f"engine_{name}"] = result.timings[key]
+            if f"{key}.peak_bytes" in result.metrics:
+                peaks[f"engine_{name}"] = result.metrics[f"{key}.peak_bytes"]
+        record = dict(base, engine=engine, phases=phases, total=sum(phases.values()))
+        if peaks:
+            record["peak_bytes"] = max(peaks.values())
+            record["peak_bytes_by_phase"] = peaks
+        if engine is not None:
+            record["result_nodes"] = result.metrics.get(f"{engine}.nodes")
+            record["result_edges"] = result.metrics.get(f"{engine}.edges")
+        record["oracle_cached"] = bool(result.metrics.get("oracle.cached"))
+        record["oracle_nodes"] = result.metrics.get("oracle.nodes")
+        record["oracle_edges"] = result.metrics.get("oracle.edges")
+        records.append(record)
+    return records
+
+
+def write_profile(results: Sequence[Any], path: str) -> None:
+    with open(path, "w", encoding="utf-8") as handle:
+        for result in results:
+            if not result.timings:
+                continue
+            for record in profile_records(result):
+                handle.write(json.dumps(record, sort_keys=True) + "\n")
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import argparse
+import heapq
+import json
+import math
 import os
 from collections import Counter, defaultdict
-from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
-from tests.cypher_tck.scenarios import SCENARIOS
+from tests.cypher_tck.scenarios import REGISTRY
 
 
 def _feature_parts(feature_path: str) -> Tuple[str, str]:
@@ -43,30 +48,174 @@ def _table_rows(
     return rows
 
 
-def build_report() -> str:
-    total = len(SCENARIOS)
-    status_counts = Counter(scenario.status for scenario in SCENARIOS)
-    gfql_defined = sum(1 for scenario in SCENARIOS if scenario.gfql is not None)
+# Log-spaced buckets (about 5% wide) give streaming percentiles without
+# keeping every duration; a bucket reports its upper bound.
+_BUCKET_BASE = 1.05
+_MIN_SECONDS = 1e-6
+
+
+def _bucket(seconds: float) -> int:
+    return math.ceil(math.log(max(seconds, _MIN_SECONDS) / _MIN_SECONDS, _BUCKET_BASE))
+
+
+@dataclass
+class _Durations:
+    count: int = 0
+    total: float = 0.0
+    largest: float = 0.0
+    buckets: Counter = field(default_factory=Counter)
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.largest = max(self.largest, seconds)
+        self.buckets[_bucket(seconds)] += 1
+
+    def quantile(self, q: float) -> float:
+        rank = max(1, math.ceil(q * self.count))
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= rank:
+                return min(_MIN_SECONDS * _BUCKET_BASE**bucket, self.largest)
+        return 0.0
+
+
+def read_profile(path: str) -> Iterator[Dict[str, Any]]:
+    with open(path, encoding="utf-8") as handle:
+        for line in handle:
+            if line.strip():
+                yield json.loads(line)
+
+
+def _record_key(record: Dict[str, Any]) -> Tuple[str, str]:
+    return record["key"], record.get("engine") or ""
+
+
+# Regressions compare only what the engine did: the oracle phase swings with
+# oracle cache hits, which say nothing about the engine.
+_COMPARED_PHASES = ("engine_convert", "engine_run")
+
+
+def engine_seconds(record: Dict[str, Any]) -> float:
+    phases = record.get("phases", {})
+    return float(sum(phases.get(name, 0.0) for name in _COMPARED_PHASES))
+
+
+def load_baseline(records: Iterable[Dict[str, Any]]) -> Dict[Tuple[str, str], float]:
+    return {
+        _record_key(record): engine_seconds(record)
+        for record in records
+        if record.get("engine") and not record.get("cached")
+    }
+
+
+@dataclass
+class PerformanceSummary:
+    # Accumulates profile records (profiling.profile_records) in one pass.
+    baseline: Dict[Tuple[str, str], float] = field(default_factory=dict)
+    top_n: int = 10
+    regression_ratio: float = 1.5
+    regression_min_seconds: float = 0.01
+    records: int = 0
+    # Reused verdicts carry timings from an earlier run; they are counted only.
+    cached_records: int = 0
+    slowest: List[Tuple[float, str, str]] = field(default_factory=list)
+    groups: Dict[str, _Durations] = field(default_factory=lambda: defaultdict(_Durations))
+    engine_time: Counter = field(default_factory=Counter)
+    # Speedups pair engine and oracle time over records whose oracle ran.
+    paired_engine_time: Counter = field(default_factory=Counter)
+    oracle_time: Counter = field(default_factory=Counter)
+    regressions: List[Tuple[float, str, str, float, float]] = field(default_factory=list)
+
+    def add(self, record: Dict[str, Any]) -> None:
+        self.records += 1
+        if record.get("cached"):
+            self.cached_records += 1
+            return
+        key, engine = _record_key(record)
+        total = float(record.get("total", 0.0))
+        item = (total, key, engine)
+        if len(self.slowest) < self.top_n:
+            heapq.heappush(self.slowest, item)
+        elif item > self.slowest[0]:
+            heapq.heapreplace(self.slowest, item)
+        self.groups[_feature_parts(record.get("feature_path", ""))[0]].add(total)
+        phases = record.get("phases", {})
+        if engine:
+            self.engine_time[engine] += phases.get("engine_run", 0.0)
+            if not record.get("oracle_cached"):
+                self.paired_engine_time[engine] += phases.get("engine_run", 0.0)
+                self.oracle_time[engine] += phases.get("oracle", 0.0)
+        before = self.baseline.get((key, engine))
+        if before is None:
+            return
+        now = engine_seconds(record)
+        if now > before * self.regression_ratio and now - before >= self.regression_min_seconds:
+            self.regressions.append((now / max(before, _MIN_SECONDS), key, engine, before, now))
+
+    def lines(self) -> List[str]:
+        reused = f", {self.cached_records} reused and not timed" if self.cached_records else ""
+        lines = ["", f"Performance ({self.records} profile records{reused}):", "", "Slowest scenarios:"]
+        lines.extend(["| scenario | engine | total (s) |", "|---|---|---:|"])
+        for total, key, engine in sorted(self.slowest, reverse=True):
+            lines.append(f"| {key} | {engine or '-'} | {total:.4f} |")
+        lines.extend(["", "Time by feature group:", "| group | records | total (s) | p95 (s) |"])
+        lines.append("|---|---:|---:|---:|")
+        for name, durations in sorted(self.groups.items(), key=lambda item: item[1].total, reverse=True):
+            lines.append(f"| {name} | {durations.count} | {durations.total:.4f} | {durations.quantile(0.95):.4f} |")
+        lines.extend(["", "Engine speedup over the oracle (oracle cache hits excluded):"])
+        lines.extend(["| engine | engine (s) | oracle (s) | speedup |", "|---|---:|---:|---:|"])
+        for engine in sorted(self.engine_time):
+            paired, oracle_time = self.paired_engine_time[engine], self.oracle_time[engine]
+            if paired > 0 and oracle_time > 0:
+                lines.append(f"| {engine} | {paired:.4f} | {oracle_time:.4f} | {oracle_time / paired:.2f}x |")
+            else:
+                lines.append(f"| {engine} | n/a | n/a | n/a |")
+        if self.baseline:
+            threshold = f">{self.regression_ratio:g}x and +{self.regression_min_seconds:g}s"
+            lines.extend(["", f"Engine convert + run regressions vs baseline ({threshold}):"])
+            if not self.regressions:
+                lines.append("- none")
+            for ratio, key, engine, before, total in sorted(self.regressions, reverse=True):
+                lines.append(f"- {key} [{engine or '-'}]: {before:.4f}s -> {total:.4f}s ({ratio:.2f}x)")
+        return lines
+
+
+def build_performance(
+    records: Iterable[Dict[str, Any]], baseline: Optional[Dict[Tuple[str, str], float]] = None, top_n: int = 10
+) -> PerformanceSummary:
+    summary = PerformanceSummary(baseline=baseline or {}, top_n=top_n)
+    for record in records:
+        summary.add(record)
+    return summary
+
+
+def build_report(profile_path: Optional[str] = None, baseline_path: Optional[str] = None, top_n: int = 10) -> str:
+    entries = REGISTRY.index
+    total = len(entries)
+    status_counts = Counter(scenario.status for scenario in entries)
+    gfql_defined = sum(1 for scenario in entries if scenario.translated)
     missing_gfql = total - gfql_defined
     supported_defined = sum(
         1
-        for scenario in SCENARIOS
-        if scenario.status == "supported" and scenario.gfql is not None
+        for scenario in entries
+        if scenario.status == "supported" and scenario.translated
     )
     translated_xfail = sum(
         1
-        for scenario in SCENARIOS
-        if scenario.status == "xfail" and scenario.gfql is not None
+        for scenario in entries
+        if scenario.status == "xfail" and scenario.translated
     )
     translated_skip = sum(
         1
-        for scenario in SCENARIOS
-        if scenario.status == "skip" and scenario.gfql is not None
+        for scenario in entries
+        if scenario.status == "skip" and scenario.translated
     )
     supported_missing = sum(
         1
-        for scenario in SCENARIOS
-        if scenario.status == "supported" and scenario.gfql is None
+        for scenario in entries
+        if scenario.status == "supported" and not scenario.translated
     )
 
     supported_count = status_counts.get("supported", 0)
@@ -78,7 +227,7 @@ def build_report() -> str:
     area_counts: Dict[str, Counter] = defaultdict(Counter)
     xfail_tags = Counter()
 
-    for scenario in SCENARIOS:
+    for scenario in entries:
         group, area = _feature_parts(scenario.feature_path)
         for bucket in (group_counts[group], area_counts[area]):
             bucket["total"] += 1
@@ -126,11 +275,24 @@ def build_report() -> str:
     else:
         lines.append("- none")
 
+    if profile_path:
+        baseline = load_baseline(read_profile(baseline_path)) if baseline_path else None
+        lines.extend(build_performance(read_profile(profile_path), baseline, top_n).lines())
+
     return "\n".join(lines) + "\n"
 
 
-def main() -> None:
-    report = build_report()
+def _parse_args(argv: Optional[Sequence[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Summarize Cypher TCK coverage and, optionally, performance.")
+    parser.add_argument("--profile", help="profile JSONL from `python -m tests.cypher_tck.run --profile`")
+    parser.add_argument("--baseline", help="earlier profile JSONL to flag regressions against")
+    parser.add_argument("--top", type=int, default=10, help="slowest scenarios to list (default: 10)")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    args = _parse_args(argv)
+    report = build_report(args.profile, args.baseline, args.top)
     print(report)
     summary_path = os.environ.get("GITHUB_STEP_SUMMARY")
     if summary_path:
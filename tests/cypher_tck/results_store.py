@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+import graphistry
+
+from tests.cypher_tck.harness import ScenarioResult
+from tests.cypher_tck.models import Scenario
+from tests.cypher_tck.oracle_cache import chain_key
+from tests.cypher_tck.scenarios.catalog import default_cache_dir
+
+RESULTS_FORMAT = 3
+
+_TCK_DIR = Path(__file__).resolve().parent
+# Errors usually come from the environment (missing modules, OOM), so only
+# real verdicts are reused.
+_REUSABLE = ("passed", "failed")
+
+StoreKey = Tuple[str, str, str]
+
+
+def default_results_path() -> Optional[Path]:
+    if os.environ.get("TCK_GFQL_RESULTS", "1") == "0":
+        return None
+    return default_cache_dir() / "results.pkl"
+
+
+@lru_cache(maxsize=1)
+def harness_digest() -> str:
+    # Any edit to the harness modules (not tests or CLIs) may change a verdict.
+    digest = hashlib.sha256(f"format={RESULTS_FORMAT}".encode())
+    for path in sorted(_TCK_DIR.glob("*.py")):
+        if path.name.startswith("test_") or path.name in ("run.py", "report.py"):
+            continue
+        digest.update(path.name.encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def scenario_digest(scenario: Scenario, variant: str = "") -> Optional[str]:
+    chain = chain_key(scenario.gfql) if scenario.gfql is not None else "null"
+    if chain is None:
+        return None
+    expected = scenario.expected
+    payload = json.dumps(
+        [
+            scenario.key,
+            scenario.cypher,
+            scenario.graph.fingerprint,
+            chain,
+            scenario.status,
+            scenario.return_alias,
+            repr((expected.node_ids, expected.edge_ids, expected.rows)),
+            harness_digest(),
+            variant,
+        ],
+        sort_keys=True,
+        default=repr,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def pygraphistry_version() -> str:
+    return str(getattr(graphistry, "__version__", "unknown"))
+
+
+class ResultStore:
+    def __init__(self, path: Optional[Path]) -> None:
+        self.path = path
+        self.results: Dict[StoreKey, ScenarioResult] = {}
+        self.dirty = False
+        self._read()
+
+    def _read(self) -> None:
+        if self.path is None or not self.path.exists():
+            return
+        try:
+            data = pickle.loads(self.path.read_bytes())
+        except Exception:
+            return
+        if isinstance(data, dict) and data.get("format") == RESULTS_FORMAT:
+            self.results = data.get("results", {})
+
+    def lookup(self, key: StoreKey) -> Optional[ScenarioResult]:
+        return self.results.get(key)
+
+    def store(self, key: StoreKey, result: ScenarioResult) -> None:
+        if result.outcome not in _REUSABLE:
+            self.results.pop(key, None)
+            return
+        self.results[key] = result
+        self.dirty = True
+
+    def prune(self, keep: Iterable[StoreKey]) -> None:
+        # Verdicts superseded by a newer hash or version of the same scenario
+        # would only grow the file.
+        wanted = set(keep)
+        live = {self.results[key].key for key in wanted if key in self.results}
+        for key in [key for key, result in self.results.items() if key not in wanted and result.key in live]:
+            del self.results[key]
+            self.dirty = True
+
+    def save(self) -> None:
+        if not self.dirty or self.path is None:
+            return
+        data = {"format": RESULTS_FORMAT, "results": self.results}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.path.parent, prefix=".results-", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as handle:
+                    pickle.dump(data, handle, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_name, self.path)
+            except BaseException:
+                if os.path.exists(tmp_name):
+                    os.unlink(tmp_name)
+                raise
+        except OSError:
+            return
+        self.dirty = False
@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Any, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from tests.cypher_tck.values import Map, Node, ValueRows, from_python, parse_rows, render
+
+_DIFF_LIMIT = 10
+_ORDER_BY_RE = re.compile(r"\bORDER\s+BY\b", flags=re.IGNORECASE)
+_RETURN_RE = re.compile(r"\bRETURN\b", flags=re.IGNORECASE)
+_ROW_MULTIPLIER = np.uint64(0x100000001B3)
+
+
+def returns_ordered(cypher: str) -> bool:
+    returns = list(_RETURN_RE.finditer(cypher))
+    tail = cypher[returns[-1].end():] if returns else cypher
+    return _ORDER_BY_RE.search(tail) is not None
+
+
+def _object_array(values: Sequence[Any]) -> np.ndarray:
+    # np.asarray would turn tuple cells (lists, paths) into extra dimensions.
+    array = np.empty(len(values), dtype=object)
+    array[:] = list(values)
+    return array
+
+
+def _hash_cells(cells: np.ndarray) -> np.ndarray:
+    return np.fromiter(map(hash, cells), dtype=np.int64, count=len(cells)).view(np.uint64)
+
+
+# Column-major result table of typed values (tests/cypher_tck/values.py); rows
+# are compared through combined 64-bit hashes of their cells.
+@dataclass(frozen=True, eq=False)
+class RowTable:
+    columns: Tuple[str, ...]
+    cells: Mapping[str, np.ndarray]
+
+    def __len__(self) -> int:
+        return len(self.cells[self.columns[0]]) if self.columns else 0
+
+    @classmethod
+    def from_columns(cls, cells: Mapping[str, Sequence[Any]]) -> "RowTable":
+        columns = tuple(sorted(cells))
+        return cls(columns, {name: _object_array(cells[name]) for name in columns})
+
+    @classmethod
+    def from_values(cls, values: ValueRows) -> "RowTable":
+        columns = list(zip(*values.rows)) or [()] * len(values.columns)
+        return cls.from_columns(dict(zip(values.columns, columns)))
+
+    @classmethod
+    def from_expected(cls, rows: Sequence[Mapping[str, Any]]) -> "RowTable":
+        return cls.from_values(parse_rows(rows))
+
+    @cached_property
+    def keys(self) -> np.ndarray:
+        keys = np.zeros(len(self), dtype=np.uint64)
+        for name in self.columns:
+            keys = keys * _ROW_MULTIPLIER ^ _hash_cells(self.cells[name])
+        return keys
+
+    def row_text(self, index: int) -> str:
+        return "{" + ", ".join(f"{name}: {render(self.cells[name][index])}" for name in self.columns) + "}"
+
+    def distinct(self) -> "RowTable":
+        _, first = np.unique(self.keys, return_index=True)
+        first.sort()
+        return RowTable(self.columns, {name: self.cells[name][first] for name in self.columns})
+
+
+def node_values(nodes_df: pd.DataFrame, property_columns: Sequence[str], label_col: str = "labels") -> np.ndarray:
+    # Column-at-a-time conversion: each property column is converted over its
+    # distinct values and gathered back, then rows are assembled into Nodes.
+    size = len(nodes_df)
+    gathered: List[np.ndarray] = []
+    for name in sorted(property_columns):
+        if name not in nodes_df.columns:
+            continue
+        values = nodes_df[name]
+        if values.dtype == object:
+            values = values.map(_hashable)
+        codes, uniques = pd.factorize(values, use_na_sentinel=True)
+        # Trailing None is what NA codes (-1) gather: null properties are absent.
+        items = np.empty(len(uniques) + 1, dtype=object)
+        items[:-1] = [(name, from_python(value)) for value in uniques]
+        gathered.append(items[codes])
+    if label_col in nodes_df.columns:
+        codes, uniques = pd.factorize(nodes_df[label_col].map(_hashable), use_na_sentinel=True)
+        label_sets = np.empty(len(uniques) + 1, dtype=object)
+        label_sets[:-1] = [frozenset(labels) for labels in uniques]
+        label_sets[-1] = frozenset()
+        labels = label_sets[codes]
+    else:
+        labels = np.full(size, frozenset(), dtype=object)
+    properties = (Map(frozenset(item for item in row if item is not None)) for row in zip(*gathered))
+    if not gathered:
+        properties = (Map() for _ in range(size))
+    nodes = np.empty(size, dtype=object)
+    nodes[:] = [Node(row_labels, row_properties) for row_labels, row_properties in zip(labels, properties)]
+    return nodes
+
+
+def _hashable(value: Any) -> Any:
+    if isinstance(value, (list, np.ndarray)):
+        return tuple(_hashable(item) for item in value)
+    return value
+
+
+def compare_rows(
+    expected: RowTable, actual: RowTable, ordered: bool = False, limit: int = _DIFF_LIMIT
+) -> Optional[str]:
+    if expected.columns != actual.columns:
+        return f"columns differ: expected {list(expected.columns)}, got {list(actual.columns)}"
+    if ordered:
+        if len(expected) == len(actual) and np.array_equal(expected.keys, actual.keys):
+            return None
+        mismatch = np.flatnonzero(expected.keys[: len(actual)] != actual.keys[: len(expected)])
+        position = int(mismatch[0]) if len(mismatch) else min(len(expected), len(actual))
+        want = expected.row_text(position) if position < len(expected) else "<end>"
+        got = actual.row_text(position) if position < len(actual) else "<end>"
+        return f"rows differ at position {position}: expected {want}, got {got}"
+    if len(expected) == len(actual) and np.array_equal(np.sort(expected.keys), np.sort(actual.keys)):
+        return None
+    missing = _surplus_rows(expected, actual)
+    extra = _surplus_rows(actual, expected)
+    return (
+        f"rows differ: expected {len(expected)}, got {len(actual)}; "
+        f"missing {_preview(missing, limit)}, extra {_preview(extra, limit)}"
+    )
+
+
+def _surplus_rows(left: RowTable, right: RowTable) -> List[str]:
+    # Rows whose multiplicity in `left` exceeds that in `right`, once per surplus copy.
+    left_keys, left_first, left_counts = np.unique(left.keys, return_index=True, return_counts=True)
+    right_keys, right_counts = np.unique(right.keys, return_counts=True)
+    positions = np.searchsorted(right_keys, left_keys)
+    positions = np.minimum(positions, max(len(right_keys) - 1, 0))
+    matched = (right_keys[positions] == left_keys) if len(right_keys) else np.zeros(len(left_keys), dtype=bool)
+    surplus = left_counts - np.where(matched, right_counts[positions] if len(right_counts) else 0, 0)
+    rows: List[str] = []
+    for index in np.flatnonzero(surplus > 0):
+        rows.extend([left.row_text(int(left_first[index]))] * int(surplus[index]))
+    return rows
+
+
+def _preview(rows: List[str], limit: int) -> str:
+    shown = rows[:limit]
+    more = len(rows) - len(shown)
+    return "[" + ", ".join(shown) + "]" + (f" (+{more} more)" if more > 0 else "")
+
+
+def assert_rows(expected: RowTable, actual: RowTable, ordered: bool = False, limit: int = _DIFF_LIMIT) -> None:
+    message = compare_rows(expected, actual, ordered=ordered, limit=limit)
+    if message is not None:
+        raise AssertionError(message)
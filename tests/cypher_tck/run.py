@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import sys
+import tracemalloc
+from collections import Counter
+from dataclasses import asdict, replace
+from functools import partial
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from tests.cypher_tck.harness import ScenarioResult, active_engines, chain_planner, label_encoding, run_entry
+from tests.cypher_tck.models import ScenarioIndexEntry
+from tests.cypher_tck.profiling import write_profile
+from tests.cypher_tck.results_store import (
+    ResultStore,
+    StoreKey,
+    default_results_path,
+    pygraphistry_version,
+    scenario_digest,
+)
+from tests.cypher_tck.scenarios import REGISTRY
+
+_OUTCOMES = ("passed", "failed", "error", "xfailed", "skipped")
+
+
+def _affinity_groups(entries: Sequence[ScenarioIndexEntry]) -> List[List[ScenarioIndexEntry]]:
+    groups: Dict[str, List[ScenarioIndexEntry]] = {}
+    for entry in entries:
+        fingerprint = REGISTRY.get(entry.key).graph.fingerprint
+        groups.setdefault(fingerprint, []).append(entry)
+    return list(groups.values())
+
+
+def shard_entries(groups: Sequence[Sequence[ScenarioIndexEntry]], jobs: int) -> List[List[ScenarioIndexEntry]]:
+    # Whole fixture groups go to the least-loaded shard, largest first, so each
+    # worker's built-graph cache sees every scenario of the fixtures it owns.
+    shards: List[List[ScenarioIndexEntry]] = [[] for _ in range(max(1, jobs))]
+    for group in sorted(groups, key=lambda group: (-len(group), group[0].key)):
+        min(shards, key=len).extend(group)
+    return [shard for shard in shards if shard]
+
+
+def _run_shard(shard: Sequence[ScenarioIndexEntry], trace_memory: bool = False) -> List[ScenarioResult]:
+    return [run_entry(entry, trace_memory=trace_memory) for entry in shard]
+
+
+def _pool_context() -> Optional[multiprocessing.context.BaseContext]:
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return None
+
+
+def _store_key(entry: ScenarioIndexEntry) -> Optional[StoreKey]:
+    digest = scenario_digest(REGISTRY.get(entry.key), variant=f"{label_encoding()}/{chain_planner()}")
+    if digest is None:
+        return None
+    return digest, "+".join(active_engines()), pygraphistry_version()
+
+
+def _reuse(
+    entries: Sequence[ScenarioIndexEntry], store: ResultStore, full: bool
+) -> Tuple[List[ScenarioResult], List[ScenarioIndexEntry], Dict[str, StoreKey]]:
+    reused: List[ScenarioResult] = []
+    pending: List[ScenarioIndexEntry] = []
+    keys: Dict[str, StoreKey] = {}
+    for entry in entries:
+        key = _store_key(entry)
+        if key is not None:
+            keys[entry.key] = key
+        cached = None if full or key is None else store.lookup(key)
+        if cached is None:
+            pending.append(entry)
+        else:
+            reused.append(replace(cached, cached=True))
+    return reused, pending, keys
+
+
+def run_entries(
+    entries: Sequence[ScenarioIndexEntry],
+    jobs: int = 1,
+    store: Optional[ResultStore] = None,
+    full: bool = False,
+    trace_memory: bool = False,
+) -> List[ScenarioResult]:
+    runnable = [entry for entry in entries if entry.status == "supported"]
+    results = [run_entry(entry) for entry in entries if entry.status != "supported"]
+    keys: Dict[str, StoreKey] = {}
+    if store is not None:
+        reused, runnable, keys = _reuse(runnable, store, full)
+        results.extend(reused)
+    executed: List[ScenarioResult] = []
+    run_shard = partial(_run_shard, trace_memory=trace_memory)
+    context = _pool_context()
+    if jobs <= 1 or len(runnable) <= 1 or context is None:
+        executed.extend(run_shard(runnable))
+    else:
+        # Load scenarios (and import graphistry) before forking so workers inherit them.
+        shards = shard_entries(_affinity_groups(runnable), jobs)
+        with context.Pool(processes=len(shards)) as pool:
+            for shard_results in pool.map(run_shard, shards, chunksize=1):
+                executed.extend(shard_results)
+    if store is not None:
+        for result in executed:
+            if result.key in keys:
+                store.store(keys[result.key], result)
+        store.prune(keys.values())
+        store.save()
+    results.extend(executed)
+    return sorted(results, key=lambda result: result.key)
+
+
+def format_results(results: Sequence[ScenarioResult]) -> str:
+    counts = Counter(result.outcome for result in results)
+    lines = [
+        "GFQL conformance run (tck-gfql)",
+        "",
+        f"Scenarios: {len(results)}",
+        "Outcomes: " + ", ".join(f"{outcome} {counts.get(outcome, 0)}" for outcome in _OUTCOMES),
+    ]
+    totals: Dict[str, float] = {}
+    for result in results:
+        for phase, seconds in result.timings.items():
+            totals[phase] = totals.get(phase, 0.0) + seconds
+    if totals:
+        lines.append("Time: " + ", ".join(f"{phase} {seconds:.2f}s" for phase, seconds in totals.items()))
+    reused = sum(1 for result in results if result.cached)
+    if reused:
+        lines.append(f"Reused: {reused} (unchanged since the last run; --full re-runs them)")
+    failures = [result for result in results if result.outcome in ("failed", "error")]
+    if failures:
+        lines.extend(["", "Failures:"])
+        for result in failures:
+            message = (result.message or "").splitlines()[0] if result.message else ""
+            suffix = " (reused)" if result.cached else ""
+            lines.append(f"- {result.key} [{result.outcome}]{suffix} {message}".rstrip())
+    return "\n".join(lines) + "\n"
+
+
+def write_results(results: Sequence[ScenarioResult], path: str) -> None:
+    with open(path, "w", encoding="utf-8") as handle:
+        for result in results:
+            handle.write(json.dumps(asdict(result), sort_keys=True) + "\n")
+
+
+def _parse_args(argv: Optional[Sequence[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run the Cypher TCK scenarios outside pytest.")
+    parser.add_argument("--jobs", "-j", type=int, default=1, help="worker processes (default: 1)")
+    parser.add_argument("--feature-path", help="only run scenarios under this feature path prefix")
+    parser.add_argument("--key", action="append", dest="keys", help="run only this scenario key (repeatable)")
+    parser.add_argument("--output", help="write one JSON result per line to this path")
+    parser.add_argument(
+        "--profile", help="write per-scenario, per-engine phase timings as JSONL to this path (traces memory)"
+    )
+    parser.add_argument("--full", action="store_true", help="re-run scenarios whose stored results are still valid")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = _parse_args(argv)
+    entries = REGISTRY.entries(keys=args.keys, feature_path=args.feature_path)
+    trace_memory = bool(args.profile) and not tracemalloc.is_tracing()
+    if trace_memory:
+        # Started before forking so workers inherit tracing.
+        tracemalloc.start()
+    try:
+        store = ResultStore(default_results_path())
+        results = run_entries(entries, jobs=args.jobs, store=store, full=args.full, trace_memory=bool(args.profile))
+    finally:
+        if trace_memory:
+            tracemalloc.stop()
+    REGISTRY.flush()
+    print(format_results(results), end="")
+    if args.output:
+        write_results(results, args.output)
+    if args.profile:
+        write_profile(results, args.profile)
+    return 1 if any(result.outcome in ("failed", "error") for result in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,16 +1,16 @@
 from __future__ import annotations
 
-from importlib.util import module_from_spec, spec_from_file_location
-from pathlib import Path
+from typing import Any
 
-_SCENARIO_ROOT = Path(__file__).resolve().parent / "tck" / "features"
-SCENARIOS = []
+from tests.cypher_tck.scenarios.registry import REGISTRY, ScenarioRegistry
 
-for path in sorted(_SCENARIO_ROOT.rglob("*.py"), key=lambda p: p.as_posix()):
-    module_name = "tests.cypher_tck.scenarios." + path.relative_to(Path(__file__).resolve().parent).with_suffix("").as_posix().replace("/", ".")
-    spec = spec_from_file_location(module_name, path)
-    if spec is None or spec.loader is None:
-        continue
-    module = module_from_spec(spec)
-    spec.loader.exec_module(module)
-    SCENARIOS.extend(getattr(module, "SCENARIOS", []))
+__all__ = ["REGISTRY", "SCENARIOS", "ScenarioRegistry"]
+
+
+def __getattr__(name: str) -> Any:
+    # SCENARIOS is materialized on first access so index-only callers never exec feature modules.
+    if name == "SCENARIOS":
+        scenarios = REGISTRY.all()
+        globals()["SCENARIOS"] = scenarios
+        return scenarios
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from tests.cypher_tck.models import Scenario, ScenarioIndexEntry
+
+CATALOG_FORMAT = 1
+
+_SCENARIOS_DIR = Path(__file__).resolve().parent
+_TCK_DIR = _SCENARIOS_DIR.parent
+_REPO_ROOT = _TCK_DIR.parent.parent
+
+# Scenario payloads embed objects built by these modules, so any edit to them
+# invalidates the whole catalog rather than individual feature entries.
+_DEPENDENCIES = (
+    _TCK_DIR / "models.py",
+    _TCK_DIR / "columnar.py",
+    _TCK_DIR / "parse_cypher.py",
+    _TCK_DIR / "values.py",
+    _SCENARIOS_DIR / "fixtures.py",
+    _SCENARIOS_DIR / "registry.py",
+    _SCENARIOS_DIR / "catalog.py",
+)
+
+
+def default_cache_dir() -> Path:
+    return Path(os.environ.get("TCK_GFQL_CACHE_DIR", _REPO_ROOT / ".tck_cache"))
+
+
+def default_catalog_path() -> Optional[Path]:
+    if os.environ.get("TCK_GFQL_CATALOG", "1") == "0":
+        return None
+    return default_cache_dir() / "catalog.pkl"
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _stat_key(path: Path) -> Tuple[int, int]:
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _graphistry_sources() -> List[Path]:
+    # Payloads pickle GFQL AST nodes and predicates; a pygraphistry upgrade can
+    # change them without making old pickles fail to load.
+    from graphistry.compute import ast, predicates
+
+    return [Path(ast.__file__), *sorted(Path(predicates.__file__).parent.glob("*.py"))]
+
+
+def dependencies_digest(paths: Iterable[Path] = _DEPENDENCIES) -> str:
+    import graphistry
+
+    digest = hashlib.sha256(f"format={CATALOG_FORMAT}".encode())
+    digest.update(f"graphistry={getattr(graphistry, '__version__', 'unknown')}".encode())
+    for path in [*paths, *_graphistry_sources()]:
+        digest.update(path.name.encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+@dataclass
+class CatalogModule:
+    digest: str
+    stat: Tuple[int, int]
+    entries: List[ScenarioIndexEntry]
+    payload: Optional[bytes] = None
+
+
+class ScenarioCatalog:
+    def __init__(self, path: Optional[Path], deps_digest: Optional[str] = None) -> None:
+        self.path = path
+        self.deps_digest = deps_digest if deps_digest is not None else dependencies_digest()
+        self.modules: Dict[str, CatalogModule] = {}
+        self.dirty = False
+        self._read()
+
+    def _read(self) -> None:
+        if self.path is None or not self.path.exists():
+            return
+        try:
+            data = pickle.loads(self.path.read_bytes())
+        except Exception:
+            return
+        if not isinstance(data, dict):
+            return
+        if data.get("format") != CATALOG_FORMAT or data.get("deps") != self.deps_digest:
+            return
+        self.modules = data.get("modules", {})
+
+    def lookup(self, module_path: str, source_path: Path) -> Optional[CatalogModule]:
+        cached = self.modules.get(module_path)
+        if cached is None:
+            return None
+        stat = _stat_key(source_path)
+        if cached.stat == stat:
+            return cached
+        if _digest(source_path.read_bytes()) != cached.digest:
+            return None
+        cached.stat = stat
+        self.dirty = True
+        return cached
+
+    def store_entries(
+        self, module_path: str, source_path: Path, source: bytes, entries: List[ScenarioIndexEntry]
+    ) -> CatalogModule:
+        module = CatalogModule(digest=_digest(source), stat=_stat_key(source_path), entries=entries)
+        self.modules[module_path] = module
+        self.dirty = True
+        return module
+
+    def load_payload(self, module_path: str) -> Optional[List[Scenario]]:
+        module = self.modules.get(module_path)
+        if module is None or module.payload is None:
+            return None
+        try:
+            return pickle.loads(module.payload)
+        except Exception:
+            # Stale pickles (e.g. a pygraphistry upgrade renamed AST classes) just get rebuilt.
+            module.payload = None
+            self.dirty = True
+            return None
+
+    def store_payload(self, module_path: str, scenarios: Sequence[Scenario]) -> None:
+        module = self.modules.get(module_path)
+        if module is None:
+            return
+        module.payload = pickle.dumps(list(scenarios), protocol=pickle.HIGHEST_PROTOCOL)
+        self.dirty = True
+
+    def prune(self, module_paths: Iterable[str]) -> None:
+        keep = set(module_paths)
+        for module_path in [path for path in self.modules if path not in keep]:
+            del self.modules[module_path]
+            self.dirty = True
+
+    def save(self) -> None:
+        if not self.dirty or self.path is None:
+            return
+        data = {"format": CATALOG_FORMAT, "deps": self.deps_digest, "modules": self.modules}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=self.path.parent, prefix=".catalog-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                pickle.dump(data, handle, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_name, self.path)
+        except BaseException:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            raise
+        self.dirty = False
@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+import ast
+import atexit
+import re
+from dataclasses import replace
+from importlib.util import module_from_spec, spec_from_file_location
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from tests.cypher_tck.models import Scenario, ScenarioIndexEntry
+from tests.cypher_tck.parse_cypher import intern_fixture
+from tests.cypher_tck.scenarios.catalog import ScenarioCatalog, default_catalog_path
+from tests.cypher_tck.values import parse_rows
+
+_SCENARIOS_DIR = Path(__file__).resolve().parent
+_SCENARIO_ROOT = _SCENARIOS_DIR / "tck" / "features"
+_MODULE_PREFIX = "tests.cypher_tck.scenarios."
+
+_INDEX_FIELDS = ("key", "feature_path", "status", "reason", "tags", "gfql")
+_FIELD_RE = re.compile(
+    r"^[ \t]+(?:(Scenario)\(|(key|feature_path|status|reason|tags|gfql)=(.*),)$",
+    flags=re.MULTILINE,
+)
+
+
+def _module_paths(root: Path = _SCENARIO_ROOT) -> List[str]:
+    paths = sorted(root.rglob("*.py"), key=lambda p: p.as_posix())
+    return [path.relative_to(_SCENARIOS_DIR).as_posix() for path in paths]
+
+
+def _entry_from_fields(fields: Dict[str, Any], module_path: str) -> ScenarioIndexEntry:
+    return ScenarioIndexEntry(
+        key=fields["key"],
+        feature_path=fields["feature_path"],
+        module_path=module_path,
+        status=fields.get("status", "supported"),
+        reason=fields.get("reason"),
+        tags=tuple(fields.get("tags", ())),
+        translated=fields.get("gfql") is not None,
+    )
+
+
+def _scan_module_lines(
+    source: str, module_path: str, literals: Optional[Dict[str, Any]] = None
+) -> Optional[List[ScenarioIndexEntry]]:
+    # Fast path for the generated layout: one keyword argument per line.
+    literals = {} if literals is None else literals
+    records: List[Dict[str, Any]] = []
+    for match in _FIELD_RE.finditer(source):
+        start, name, raw = match.groups()
+        if start:
+            records.append({})
+            continue
+        if not records or name in records[-1]:
+            return None
+        if name == "gfql":
+            records[-1][name] = None if raw == "None" else raw
+            continue
+        if raw not in literals:
+            try:
+                literals[raw] = ast.literal_eval(raw)
+            except (SyntaxError, ValueError):
+                return None
+        records[-1][name] = literals[raw]
+    if source.count("Scenario(") != len(records):
+        return None
+    if any("key" not in record or "feature_path" not in record or "gfql" not in record for record in records):
+        return None
+    return [_entry_from_fields(record, module_path) for record in records]
+
+
+def _scan_module_ast(source: str, module_path: str) -> List[ScenarioIndexEntry]:
+    entries: List[ScenarioIndexEntry] = []
+    for node in ast.walk(ast.parse(source)):
+        if not (isinstance(node, ast.Call) and getattr(node.func, "id", None) == "Scenario"):
+            continue
+        fields: Dict[str, Any] = {}
+        for keyword in node.keywords:
+            if keyword.arg not in _INDEX_FIELDS:
+                continue
+            if keyword.arg == "gfql":
+                is_none = isinstance(keyword.value, ast.Constant) and keyword.value.value is None
+                fields["gfql"] = None if is_none else ast.unparse(keyword.value)
+            else:
+                fields[keyword.arg] = ast.literal_eval(keyword.value)
+        entries.append(_entry_from_fields(fields, module_path))
+    return entries
+
+
+def scan_module(
+    source: str, module_path: str, literals: Optional[Dict[str, Any]] = None
+) -> List[ScenarioIndexEntry]:
+    entries = _scan_module_lines(source, module_path, literals)
+    if entries is None:
+        entries = _scan_module_ast(source, module_path)
+    return entries
+
+
+def _intern_graphs(scenarios: Sequence[Scenario]) -> List[Scenario]:
+    interned: List[Scenario] = []
+    for scenario in scenarios:
+        graph = intern_fixture(scenario.graph)
+        interned.append(scenario if graph is scenario.graph else replace(scenario, graph=graph))
+    return interned
+
+
+def _parse_expected(scenarios: Sequence[Scenario]) -> List[Scenario]:
+    # Parsed once per scenario before the payload is pickled into the catalog.
+    parsed: List[Scenario] = []
+    for scenario in scenarios:
+        expected = scenario.expected
+        if expected is not None and expected.rows is not None and expected.values is None:
+            scenario = replace(scenario, expected=replace(expected, values=parse_rows(expected.rows)))
+        parsed.append(scenario)
+    return parsed
+
+
+class ScenarioRegistry:
+    def __init__(self, root: Path = _SCENARIO_ROOT, catalog: Optional[ScenarioCatalog] = None) -> None:
+        self._root = root
+        self._catalog = catalog
+        self._index: Optional[List[ScenarioIndexEntry]] = None
+        self._by_key: Dict[str, ScenarioIndexEntry] = {}
+        self._loaded: Dict[str, Dict[str, Scenario]] = {}
+        self._flush_registered = False
+
+    @property
+    def catalog(self) -> ScenarioCatalog:
+        if self._catalog is None:
+            self._catalog = ScenarioCatalog(default_catalog_path())
+        return self._catalog
+
+    @property
+    def index(self) -> List[ScenarioIndexEntry]:
+        if self._index is None:
+            catalog = self.catalog
+            index: List[ScenarioIndexEntry] = []
+            literals: Dict[str, Any] = {}
+            module_paths = _module_paths(self._root)
+            for module_path in module_paths:
+                source_path = _SCENARIOS_DIR / module_path
+                cached = catalog.lookup(module_path, source_path)
+                if cached is None:
+                    source = source_path.read_bytes()
+                    entries = scan_module(source.decode("utf-8"), module_path, literals)
+                    cached = catalog.store_entries(module_path, source_path, source, entries)
+                index.extend(cached.entries)
+            catalog.prune(module_paths)
+            self._by_key = {entry.key: entry for entry in index}
+            self._index = index
+            self.flush()
+        return self._index
+
+    def entry(self, key: str) -> ScenarioIndexEntry:
+        self.index
+        try:
+            return self._by_key[key]
+        except KeyError:
+            raise KeyError(f"Unknown scenario key: {key}") from None
+
+    def entries(
+        self,
+        keys: Optional[Iterable[str]] = None,
+        status: Optional[str] = None,
+        tags: Optional[Iterable[str]] = None,
+        feature_path: Optional[str] = None,
+    ) -> List[ScenarioIndexEntry]:
+        selected = self.index if keys is None else [self.entry(key) for key in keys]
+        if status is not None:
+            selected = [entry for entry in selected if entry.status == status]
+        if tags is not None:
+            wanted = set(tags)
+            selected = [entry for entry in selected if wanted.issubset(entry.tags)]
+        if feature_path is not None:
+            selected = [entry for entry in selected if entry.feature_path.startswith(feature_path)]
+        return selected
+
+    def get(self, key: str) -> Scenario:
+        entry = self.entry(key)
+        return self._load_module(entry.module_path)[key]
+
+    def load(self, entries: Sequence[ScenarioIndexEntry]) -> List[Scenario]:
+        return [self.get(entry.key) for entry in entries]
+
+    def all(self) -> List[Scenario]:
+        scenarios = self.load(self.index)
+        self.flush()
+        return scenarios
+
+    def flush(self) -> None:
+        try:
+            self.catalog.save()
+        except OSError:
+            # A read-only checkout still runs; it just rebuilds the catalog next time.
+            pass
+
+    def _load_module(self, module_path: str) -> Dict[str, Scenario]:
+        loaded = self._loaded.get(module_path)
+        if loaded is not None:
+            return loaded
+        scenarios = self.catalog.load_payload(module_path)
+        if scenarios is None:
+            scenarios = _parse_expected(_intern_graphs(self._exec_module(module_path)))
+            self.catalog.store_payload(module_path, scenarios)
+            if not self._flush_registered:
+                atexit.register(self.flush)
+                self._flush_registered = True
+        else:
+            scenarios = _intern_graphs(scenarios)
+        loaded = {scenario.key: scenario for scenario in scenarios}
+        indexed = [entry.key for entry in self.index if entry.module_path == module_path]
+        if sorted(indexed) != sorted(loaded):
+            raise RuntimeError(f"Scenario index is out of date for {module_path}")
+        self._loaded[module_path] = loaded
+        return loaded
+
+    def _exec_module(self, module_path: str) -> List[Scenario]:
+        path = _SCENARIOS_DIR / module_path
+        module_name = _MODULE_PREFIX + Path(module_path).with_suffix("").as_posix().replace("/", ".")
+        spec = spec_from_file_location(module_name, path)
+        if spec is None or spec.loader is None:
+            raise ImportError(f"Cannot load scenario module: {path}")
+        module = module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return list(getattr(module, "SCENARIOS", []))
+
+
+REGISTRY = ScenarioRegistry()
@@ -1,4 +1,4 @@
-from graphistry.compute import e_forward, e_undirected, n
+from graphistry.compute import e_forward, e_undirected, is_in, n
 
 from tests.cypher_tck.models import Expected, GraphFixture, Scenario
 from tests.cypher_tck.parse_cypher import graph_fixture_from_create
@@ -160,10 +160,8 @@ SCENARIOS = [
             """
         ),
         expected=Expected(node_ids=["a", "b"]),
-        gfql=None,
-        status="xfail",
-        reason="Disjunctive WHERE predicates are not supported in harness",
-        tags=("match-where", "or", "xfail"),
+        gfql=[n(query="((`p1` == 12) | (`p2` == 13))")],
+        tags=("match-where", "or"),
     ),
 
     Scenario(
@@ -182,15 +180,14 @@ SCENARIOS = [
             """
         ),
         expected=Expected(
+            edge_ids=["rel_1", "rel_2"],
             rows=[
                 {"r": "[:KNOWS]"},
                 {"r": "[:HATES]"},
-            ]
+            ],
         ),
-        gfql=None,
-        status="xfail",
-        reason="Disjunctive WHERE predicates and edge-return validation are not supported",
-        tags=("match-where", "or", "edge-return", "xfail"),
+        gfql=[n(), e_forward({"type": is_in(["KNOWS", "HATES"])}), n()],
+        tags=("match-where", "or", "edge-return"),
     ),
 
     Scenario(
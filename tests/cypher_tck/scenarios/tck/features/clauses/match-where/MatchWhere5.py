@@ -123,7 +123,7 @@ SCENARIOS = [
         ),
         gfql=None,
         status="xfail",
-        reason="OR predicates, comparison predicates, IS NOT NULL, and null semantics are not supported",
+        reason="Ordering comparison over a mixed-type property (string vs number) is not supported",
         tags=("match-where", "null", "or", "comparison", "is-not-null", "xfail"),
     ),
 ]
@@ -1,4 +1,4 @@
-from graphistry.compute import e_forward, e_undirected, n
+from graphistry.compute import e_forward, e_undirected, is_in, n
 
 from tests.cypher_tck.models import Expected, GraphFixture, Scenario
 from tests.cypher_tck.parse_cypher import graph_fixture_from_create
@@ -139,14 +139,13 @@ SCENARIOS = [
             """
         ),
         expected=Expected(
+            edge_ids=["rel_1", "rel_2"],
             rows=[
                 {"r": "[:KNOWS]"},
                 {"r": "[:HATES]"},
             ],
         ),
-        gfql=None,
-        status="xfail",
-        reason="Multiple relationship types and row projections are not supported",
-        tags=("match", "relationship", "multi-type", "xfail"),
+        gfql=[n(), e_forward({"type": is_in(["KNOWS", "HATES"])}), n()],
+        tags=("match", "relationship", "multi-type"),
     ),
 ]
@@ -196,10 +196,9 @@ SCENARIOS = [
                 {"b": "(:B)"},
             ],
         ),
-        gfql=None,
-        status="xfail",
-        reason="Multiple relationship types are not supported",
-        tags=("match", "relationship", "multi-type", "xfail"),
+        gfql=[n(), e_forward({"type": "T"}), n(name="b")],
+        return_alias="b",
+        tags=("match", "relationship", "multi-type"),
     ),
 
     Scenario(
@@ -0,0 +1,404 @@
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Any, Dict, Hashable, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from graphistry.compute.predicates.ASTPredicate import ASTPredicate
+from graphistry.compute.predicates.comparison import EQ, GE, GT, LE, LT, IsNA, NotNA
+from graphistry.compute.predicates.is_in import IsIn
+
+from tests.cypher_tck.labels import LABEL_PREFIX
+from tests.cypher_tck.where import query_columns
+
+# Label, type, property and degree statistics of a loaded graph, each computed
+# on first use with one vectorized pass and kept for the graph's lifetime.
+
+DEFAULT_QUANTILES = (0.5, 0.9, 0.99, 1.0)
+_HISTOGRAM_BINS = 32
+_TOP_VALUES = 16
+_MAX_CACHED_GRAPHS = 32
+
+
+@dataclass(frozen=True, eq=False)
+class ColumnStats:
+    rows: int
+    nulls: int
+    # None when the values are unhashable (maps).
+    distinct: Optional[int]
+    # Most frequent values with their counts, most frequent first.
+    top: Tuple[Tuple[Any, int], ...]
+    # Numeric columns only: bin edges and counts over the non-null values.
+    bin_edges: Optional[np.ndarray] = None
+    bin_counts: Optional[np.ndarray] = None
+
+    @cached_property
+    def _top_counts(self) -> Dict[Any, int]:
+        return dict(self.top)
+
+    def eq_fraction(self, value: Any) -> float:
+        if not self.rows or value is None:
+            return 0.0
+        try:
+            count = self._top_counts.get(value)
+        except TypeError:
+            count = None
+        if count is not None:
+            return count / self.rows
+        if self.distinct is None:
+            return 1.0 / self.rows
+        # Values outside the top list share the remaining rows uniformly.
+        others = self.distinct - len(self.top)
+        remaining = self.rows - self.nulls - sum(count for _, count in self.top)
+        return remaining / others / self.rows if others > 0 else 0.0
+
+    def above_fraction(self, value: float) -> Optional[float]:
+        # Fraction of rows above `value`, interpolated within the bins; None
+        # without a histogram.
+        if self.bin_edges is None or self.bin_counts is None:
+            return None
+        if not self.rows or not len(self.bin_counts):
+            return 0.0
+        low, high = self.bin_edges[:-1], self.bin_edges[1:]
+        width = np.where(high > low, high - low, 1.0)
+        above = np.clip((high - value) / width, 0.0, 1.0)
+        above = np.where(high > low, above, (low > value).astype(float))
+        return float((above * self.bin_counts).sum()) / self.rows
+
+
+def _dense_range(array: np.ndarray) -> Optional[int]:
+    # Minimum of an integer array whose value range is small enough to count
+    # with np.bincount instead of hashing; None otherwise.
+    if array.dtype.kind not in "iu" or not len(array):
+        return None
+    low, high = int(array.min()), int(array.max())
+    return low if high - low <= 4 * len(array) + 1024 else None
+
+
+def _top_counts(values: np.ndarray, counts: np.ndarray, top_k: int) -> Tuple[Tuple[Any, int], ...]:
+    if len(counts) > top_k:
+        picked = np.argpartition(-counts, top_k)[:top_k]
+    else:
+        picked = np.arange(len(counts))
+    picked = picked[np.argsort(-counts[picked], kind="stable")]
+    return tuple(zip(values[picked].tolist(), counts[picked].tolist()))
+
+
+def column_stats(series: pd.Series, bins: int = _HISTOGRAM_BINS, top_k: int = _TOP_VALUES) -> ColumnStats:
+    rows = len(series)
+    values = series[series.notna()]
+    array = values.to_numpy()
+    low = _dense_range(array)
+    if low is not None:
+        dense = np.bincount(array - low)
+        present = np.flatnonzero(dense)
+        distinct, top = len(present), _top_counts(present + low, dense[present], top_k)
+    else:
+        try:
+            counts = values.value_counts(sort=False)
+        except TypeError:
+            return ColumnStats(rows, rows - len(values), None, ())
+        distinct, top = len(counts), _top_counts(counts.index.to_numpy(), counts.to_numpy(), top_k)
+    bin_edges = bin_counts = None
+    if values.dtype.kind in "iuf" and len(values):
+        numbers = values.to_numpy(dtype=float)
+        numbers = numbers[np.isfinite(numbers)]
+        if len(numbers):
+            bin_counts, bin_edges = np.histogram(numbers, bins=max(1, min(bins, distinct)))
+    return ColumnStats(rows, rows - len(values), distinct, top, bin_edges, bin_counts)
+
+
+def _distinct(ids: np.ndarray) -> np.ndarray:
+    low = _dense_range(ids)
+    if low is None:
+        return pd.unique(ids)
+    seen = np.zeros(int(ids.max()) - low + 1, dtype=bool)
+    seen[ids - low] = True
+    return ids if int(seen.sum()) == len(ids) else np.flatnonzero(seen) + low
+
+
+def _positions(ids: np.ndarray, endpoints: np.ndarray) -> np.ndarray:
+    # Positions in `ids` of the endpoints that are known IDs.
+    low = _dense_range(ids)
+    if low is None or endpoints.dtype.kind not in "iu":
+        positions = pd.Index(ids).get_indexer(endpoints)
+        return positions[positions >= 0]
+    # Dense integer IDs (the common case) map to positions by lookup, not hashing.
+    lookup = np.full(int(ids.max()) - low + 1, -1, dtype=np.int64)
+    lookup[ids - low] = np.arange(len(ids))
+    offsets = endpoints - low
+    offsets = offsets[(offsets >= 0) & (offsets < len(lookup))]
+    positions = lookup[offsets]
+    return positions[positions >= 0]
+
+
+def _count_quantiles(values: np.ndarray, qs: Sequence[float]) -> Tuple[float, ...]:
+    # np.quantile's linear interpolation, read off cumulative value counts
+    # instead of a sort; degrees are small non-negative integers.
+    if not len(values):
+        return tuple(0.0 for _ in qs)
+    cumulative = np.cumsum(np.bincount(values))
+    positions = (len(values) - 1) * np.asarray(qs, dtype=float)
+    below = np.floor(positions).astype(np.int64)
+    lower = np.searchsorted(cumulative, below, side="right")
+    upper = np.searchsorted(cumulative, np.minimum(below + 1, len(values) - 1), side="right")
+    return tuple((lower + (upper - lower) * (positions - below)).tolist())
+
+
+@dataclass(frozen=True, eq=False)
+class DegreeStats:
+    out_degree: np.ndarray
+    in_degree: np.ndarray
+
+    @property
+    def degree(self) -> np.ndarray:
+        return self.out_degree + self.in_degree
+
+    def quantiles(self, qs: Sequence[float] = DEFAULT_QUANTILES) -> Dict[str, Tuple[float, ...]]:
+        return {
+            name: _count_quantiles(values, qs)
+            for name, values in (("out", self.out_degree), ("in", self.in_degree), ("total", self.degree))
+        }
+
+
+class GraphStats:
+    # Holds the frames it describes; statistics go stale if they are mutated.
+    def __init__(
+        self,
+        nodes: Optional[pd.DataFrame],
+        edges: Optional[pd.DataFrame],
+        node_col: Optional[str] = None,
+        src: Optional[str] = None,
+        dst: Optional[str] = None,
+        edge_col: Optional[str] = None,
+        label_col: str = "labels",
+        type_col: str = "type",
+    ) -> None:
+        self.nodes = nodes if nodes is not None else pd.DataFrame()
+        self.edges = edges if edges is not None else pd.DataFrame()
+        self.node_col = node_col
+        self.src = src
+        self.dst = dst
+        self.edge_col = edge_col
+        self.label_col = label_col
+        self.type_col = type_col
+        self._node_columns: Dict[str, ColumnStats] = {}
+        self._edge_columns: Dict[str, ColumnStats] = {}
+        self._node_queries: Dict[str, float] = {}
+        self._edge_queries: Dict[str, float] = {}
+
+    @classmethod
+    def of(cls, g: Any) -> "GraphStats":
+        return cls(g._nodes, g._edges, g._node, g._source, g._destination, g._edge)
+
+    @property
+    def node_count(self) -> int:
+        return len(self.nodes)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.edges)
+
+    @cached_property
+    def label_counts(self) -> Dict[str, int]:
+        columns = [col for col in self.nodes.columns if isinstance(col, str) and col.startswith(LABEL_PREFIX)]
+        if columns:
+            sums = self.nodes[columns].fillna(False).astype(bool).sum()
+            return {col[len(LABEL_PREFIX):]: int(count) for col, count in sums.items()}
+        if self.label_col not in self.nodes.columns:
+            return {}
+        exploded = self.nodes[self.label_col].explode()
+        return {str(label): int(count) for label, count in exploded[exploded.notna()].value_counts().items()}
+
+    @cached_property
+    def type_counts(self) -> Dict[Any, int]:
+        if self.type_col not in self.edges.columns:
+            return {}
+        return {key: int(count) for key, count in self.edges[self.type_col].value_counts().items()}
+
+    def node_column(self, name: str) -> Optional[ColumnStats]:
+        return self._column(self.nodes, self._node_columns, name)
+
+    def edge_column(self, name: str) -> Optional[ColumnStats]:
+        return self._column(self.edges, self._edge_columns, name)
+
+    @staticmethod
+    def _column(df: pd.DataFrame, cache: Dict[str, ColumnStats], name: str) -> Optional[ColumnStats]:
+        if name not in df.columns:
+            return None
+        stats = cache.get(name)
+        if stats is None:
+            stats = cache[name] = column_stats(df[name])
+        return stats
+
+    @cached_property
+    def degrees(self) -> DegreeStats:
+        if self.node_col not in self.nodes.columns or not self.edge_count:
+            empty = np.zeros(self.node_count, dtype=np.int64)
+            return DegreeStats(empty, empty)
+        # One degree per distinct node ID; edges to unknown IDs are not counted.
+        ids = _distinct(self.nodes[self.node_col].to_numpy())
+        degrees = [
+            np.bincount(_positions(ids, self.edges[col].to_numpy()), minlength=len(ids)) for col in (self.src, self.dst)
+        ]
+        return DegreeStats(degrees[0], degrees[1])
+
+    def node_selectivity(self, filters: Optional[Dict[str, Any]], query: Optional[str] = None) -> float:
+        return self._selectivity(filters, query, nodes=True)
+
+    def edge_selectivity(self, filters: Optional[Dict[str, Any]], query: Optional[str] = None) -> float:
+        return self._selectivity(filters, query, nodes=False)
+
+    def _selectivity(self, filters: Optional[Dict[str, Any]], query: Optional[str], nodes: bool) -> float:
+        # Fraction of rows matching `filters` and `query`, assuming independent columns.
+        if not filters and query is None:
+            return 1.0
+        rows = self.node_count if nodes else self.edge_count
+        if not rows:
+            return 0.0
+        selectivity = 1.0 if query is None else self._query_selectivity(query, nodes)
+        for key, value in (filters or {}).items():
+            selectivity *= self._key_selectivity(key, value, nodes, rows)
+            if selectivity == 0.0:
+                break
+        return selectivity
+
+    def _key_selectivity(self, key: str, value: Any, nodes: bool, rows: int) -> float:
+        if nodes and key.startswith(LABEL_PREFIX) and isinstance(value, (bool, np.bool_)):
+            count = self.label_counts.get(key[len(LABEL_PREFIX):], 0)
+            return (count if value else rows - count) / rows
+        if not nodes and key == self.type_col:
+            if isinstance(value, IsIn):
+                return sum(self.type_counts.get(option, 0) for option in set(value.options)) / rows
+            if not isinstance(value, ASTPredicate):
+                return self.type_counts.get(value, 0) / rows
+        stats = self.node_column(key) if nodes else self.edge_column(key)
+        if stats is None:
+            return 0.0
+        estimate = _estimate(stats, value)
+        if estimate is not None:
+            return estimate
+        # Predicates the statistics cannot answer (bitmask labels, string
+        # ranges) are evaluated on the column.
+        df = self.nodes if nodes else self.edges
+        mask = value(df[key]) if isinstance(value, ASTPredicate) else df[key] == value
+        return float(pd.Series(mask).fillna(False).astype(bool).mean())
+
+    def _query_selectivity(self, query: str, nodes: bool) -> float:
+        # WHERE masks are evaluated on the frame, absent properties as null.
+        # Comparisons pandas cannot order (mixed types) cost as unfiltered and
+        # are left to fail in the engine.
+        cache, df = (self._node_queries, self.nodes) if nodes else (self._edge_queries, self.edges)
+        if query not in cache:
+            missing = sorted(query_columns(query) - set(df.columns))
+            try:
+                cache[query] = len(df.assign(**dict.fromkeys(missing)).query(query)) / max(len(df), 1)
+            except TypeError:
+                cache[query] = 1.0
+        return cache[query]
+
+    def describe(self, qs: Sequence[float] = DEFAULT_QUANTILES) -> str:
+        lines = [f"nodes: {self.node_count}", f"edges: {self.edge_count}"]
+        lines.extend(f"label {label}: {count}" for label, count in sorted(self.label_counts.items()))
+        lines.extend(f"type {name}: {count}" for name, count in sorted(self.type_counts.items(), key=str))
+        quantiles = ", ".join(f"p{q * 100:g}" for q in qs)
+        for name, values in self.degrees.quantiles(qs).items():
+            lines.append(f"{name} degree ({quantiles}): {', '.join(f'{value:g}' for value in values)}")
+        # Property columns only: IDs, endpoints, labels and types are covered above.
+        structural = {self.node_col, self.src, self.dst, self.edge_col, self.label_col, self.type_col}
+        for kind, df, column in (("node", self.nodes, self.node_column), ("edge", self.edges, self.edge_column)):
+            for name in df.columns:
+                if name in structural or (isinstance(name, str) and name.startswith(LABEL_PREFIX)):
+                    continue
+                stats = column(name)
+                if stats is None:
+                    continue
+                distinct = "?" if stats.distinct is None else stats.distinct
+                lines.append(f"{kind} {name}: {stats.rows - stats.nulls} non-null, {distinct} distinct")
+        return "\n".join(lines) + "\n"
+
+
+def _estimate(stats: ColumnStats, value: Any) -> Optional[float]:
+    if not isinstance(value, ASTPredicate):
+        return stats.eq_fraction(value)
+    if isinstance(value, EQ):
+        return stats.eq_fraction(value.val)
+    if isinstance(value, IsNA):
+        return stats.nulls / stats.rows if stats.rows else 0.0
+    if isinstance(value, NotNA):
+        return 1.0 - stats.nulls / stats.rows if stats.rows else 0.0
+    if isinstance(value, IsIn):
+        return min(1.0, sum(stats.eq_fraction(option) for option in value.options))
+    if isinstance(value, (GT, GE, LT, LE)) and isinstance(value.val, (int, float)) and not isinstance(value.val, bool):
+        above = stats.above_fraction(float(value.val))
+        if above is None:
+            return None
+        # The bins spread a repeated value over its bin; half of its known
+        # frequency is taken to sit on either side of the bound.
+        equal = stats.eq_fraction(value.val)
+        greater = max(0.0, above - equal / 2)
+        non_null = 1.0 - stats.nulls / stats.rows
+        estimate = {GT: greater, GE: greater + equal, LT: non_null - greater - equal, LE: non_null - greater}
+        return min(max(estimate[type(value)], 0.0), non_null)
+    return None
+
+
+_CACHE: "OrderedDict[Hashable, GraphStats]" = OrderedDict()
+
+
+def graph_stats(g: Any, key: Optional[Hashable] = None) -> GraphStats:
+    # Cached per graph: by `key` when the caller has a stable one (a fixture
+    # fingerprint), otherwise by the identity of the graph's frames, which the
+    # cached GraphStats keeps alive.
+    if key is None:
+        key = ("frames", id(g._nodes), id(g._edges))
+    stats = _CACHE.get(key)
+    if stats is None:
+        stats = _CACHE[key] = GraphStats.of(g)
+        while len(_CACHE) > _MAX_CACHED_GRAPHS:
+            _CACHE.popitem(last=False)
+    else:
+        _CACHE.move_to_end(key)
+    return stats
+
+
+def clear_stats_cache() -> None:
+    _CACHE.clear()
+
+
+def _parse_args(argv: Optional[Sequence[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Print label, type, property and degree statistics of TCK graphs.")
+    parser.add_argument("--key", action="append", dest="keys", required=True, help="scenario key (repeatable)")
+    parser.add_argument("--edges", type=int, help="scale the fixture to this many edges (see bench.py)")
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    from tests.cypher_tck.bench import synthesize_frames
+    from tests.cypher_tck.harness import GRAPH_CACHE, graph_from_frames
+    from tests.cypher_tck.scenarios import REGISTRY
+
+    args = _parse_args(argv)
+    for key in args.keys:
+        scenario = REGISTRY.get(key)
+        if args.edges is None:
+            g = GRAPH_CACHE.get(scenario.graph)
+        else:
+            g = graph_from_frames(scenario.graph, *synthesize_frames(scenario.graph, args.edges, seed=args.seed))
+        start = time.perf_counter()
+        text = GraphStats.of(g).describe()
+        print(f"# {key} ({time.perf_counter() - start:.2f}s)")
+        print(text, end="")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
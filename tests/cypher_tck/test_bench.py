@@ -0,0 +1,41 @@
+import pytest
+
+from tests.cypher_tck.bench import bench_scenario, main, synthesize_frames
+from tests.cypher_tck.harness import label_encoding
+from tests.cypher_tck.labels import LABEL_PREFIX, label_dictionary
+from tests.cypher_tck.parse_cypher import graph_fixture_from_create
+from tests.cypher_tck.scenarios import REGISTRY
+
+
+def test_synthesize_frames_keeps_fixture_schema():
+    fixture = graph_fixture_from_create("CREATE (:A {num: 1})-[:T {w: 2}]->(:B {name: 'b'}), (:C)")
+    nodes, edges = synthesize_frames(fixture, 2000, seed=1)
+    assert len(edges) == 2000
+    assert len(nodes) == 4000  # 3 nodes per edge, capped at 2
+    assert nodes["id"].is_unique and edges["edge_id"].is_unique
+    assert set(edges["type"]) == {"T"}
+    assert set(edges["w"]) == {2}
+    by_id = nodes.set_index("id")
+    assert all("A" in labels for labels in by_id.loc[edges["src"], "labels"])
+    assert all("B" in labels for labels in by_id.loc[edges["dst"], "labels"])
+    assert set(nodes.loc[nodes["labels"].map(lambda labels: "B" in labels), "name"]) == {"b"}
+    # Label columns follow the active encoding (TCK_LABEL_ENCODING).
+    if label_encoding() == "bitmask":
+        label_columns = set(label_dictionary(fixture).columns)
+    else:
+        label_columns = {f"{LABEL_PREFIX}{label}" for label in "ABC"}
+    assert label_columns | {"num", "name"} <= set(nodes.columns)
+
+
+def test_repeat_must_be_positive():
+    with pytest.raises(SystemExit):
+        main(["--repeat", "0"])
+
+
+def test_bench_scenario_records():
+    records = list(bench_scenario(REGISTRY.get("match2-1"), [500], engines=["pandas"], repeat=2))
+    assert len(records) == 1
+    record = records[0]
+    assert (record.scenario, record.engine, record.edges) == ("match2-1", "pandas", 500)
+    assert len(record.seconds) == 2 and record.edges_per_sec > 0
+    assert record.result_edges == 500
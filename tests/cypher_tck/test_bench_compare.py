@@ -0,0 +1,46 @@
+import json
+
+import numpy as np
+
+from tests.cypher_tck.bench_compare import compare, main, pooled_seconds
+
+
+def _records(scale, noise, seed, key="match2-1", **fields):
+    rng = np.random.default_rng(seed)
+    seconds = (scale * (1 + noise * rng.standard_normal(10))).tolist()
+    return [
+        {"scenario": key, "engine": "pandas", "edges": 1000, "seconds": seconds[:5], **fields},
+        {"scenario": key, "engine": "pandas", "edges": 1000, "seconds": seconds[5:], **fields},
+    ]
+
+
+def test_pooled_bootstrap_verdicts():
+    baseline = pooled_seconds(_records(1.0, 0.02, 1))
+    assert len(baseline[("match2-1", "pandas", "selectivity", "columns", 1000)]) == 10
+    assert [item.verdict for item in compare(baseline, pooled_seconds(_records(1.0, 0.02, 2)))] == ["unchanged"]
+    assert [item.verdict for item in compare(baseline, pooled_seconds(_records(1.5, 0.02, 2)))] == ["regressed"]
+    assert [item.verdict for item in compare(baseline, pooled_seconds(_records(0.5, 0.02, 2)))] == ["improved"]
+    # A 15% median shift buried in 40% noise stays inside the CI band.
+    noisy = compare(pooled_seconds(_records(1.0, 0.4, 1)), pooled_seconds(_records(1.15, 0.4, 2)))
+    assert [item.verdict for item in noisy] == ["unchanged"]
+
+
+def test_main_exit_status(tmp_path, capsys):
+    paths = {}
+    for name, scale in (("base", 1.0), ("same", 1.0), ("slow", 2.0)):
+        paths[name] = tmp_path / f"{name}.jsonl"
+        records = _records(scale, 0.02, 3 if name == "base" else 4) + _records(1.0, 0.02, 5, key=f"only-{name}")
+        paths[name].write_text("".join(json.dumps(record) + "\n" for record in records))
+    assert main([str(paths["base"]), str(paths["same"])]) == 0
+    assert main([str(paths["base"]), str(paths["slow"]), "--threshold", "0.5"]) == 1
+    out = capsys.readouterr().out
+    assert "| match2-1 | pandas | selectivity | columns | 1000 | 10/10 |" in out
+    assert "Only in one file (not compared): 2" in out
+
+
+def test_planner_and_label_encoding_are_part_of_the_key():
+    baseline = pooled_seconds(_records(1.0, 0.02, 1, planner="off"))
+    assert compare(baseline, pooled_seconds(_records(2.0, 0.02, 2))) == []
+    assert compare(baseline, pooled_seconds(_records(2.0, 0.02, 2, planner="off", label_encoding="bitmask"))) == []
+    matched = compare(baseline, pooled_seconds(_records(2.0, 0.02, 2, planner="off", label_encoding="columns")))
+    assert [item.verdict for item in matched] == ["regressed"]
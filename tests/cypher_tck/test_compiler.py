@@ -0,0 +1,135 @@
+import pytest
+from graphistry.compute import e_forward, e_reverse, e_undirected, ge, gt, is_in, isna, n
+
+from tests.cypher_tck.compiler import (
+    UnsupportedQuery,
+    compile_cypher,
+    normalize_query,
+    plan_cache_info,
+    translation_mismatch,
+)
+from tests.cypher_tck.scenarios import REGISTRY
+
+
+def _json(chain):
+    return [op.to_json() for op in chain]
+
+
+def test_compile_path_pattern_with_where():
+    plan = compile_cypher(
+        "MATCH (n:Person {name: 'Bob'})<-[r:KNOWS]-(m)-[]-(x)\nWHERE r.since > 2000 AND x.age IS NULL\nRETURN x"
+    )
+    assert plan.return_alias == "x"
+    assert _json(plan.chain) == _json(
+        [
+            n({"label__Person": True, "name": "Bob"}),
+            e_reverse(edge_match={"type": "KNOWS", "since": gt(2000)}),
+            n(),
+            e_undirected(),
+            n({"age": isna()}, name="x"),
+        ]
+    )
+
+
+def test_compile_flipped_comparison_and_type_function():
+    plan = compile_cypher("MATCH (a)-[r]->(b) WHERE 3 < b.num AND type(r) = 'T' AND b:B RETURN b")
+    assert _json(plan.chain) == _json([n(), e_forward({"type": "T"}), n({"num": gt(3), "label__B": True}, name="b")])
+
+
+def test_type_alternatives_compile_to_one_membership_test():
+    plan = compile_cypher("MATCH (a)-[r:KNOWS|HATES|:KNOWS]->(b) RETURN r")
+    assert _json(plan.chain) == _json([n(), e_forward({"type": is_in(["KNOWS", "HATES"])}), n()])
+    assert _json(compile_cypher("MATCH (a)-[:T|:T]->(b) RETURN b").chain)[1]["edge_match"] == {"type": "T"}
+
+
+def test_where_tree_compiles_to_one_mask_per_hop():
+    plan = compile_cypher(
+        "MATCH (a)-[r]->(b) WHERE a.x >= 1 AND a.x < 9 AND (r.w <> 2 OR NOT r.v IS NULL) AND (b.y = 1 XOR b.z = 2) "
+        "RETURN b"
+    )
+    assert _json(plan.chain) == _json(
+        [
+            n({"x": ge(1)}, query="(`x` < 9)"),
+            e_forward(edge_query="(((`w` == `w`) & (`w` != 2)) | (`v` == `v`))"),
+            n(
+                query="(((`y` == 1) & ((`z` == `z`) & (`z` != 2))) | (((`y` == `y`) & (`y` != 1)) & (`z` == 2)))",
+                name="b",
+            ),
+        ]
+    )
+
+
+def test_or_of_equalities_folds_to_membership_test():
+    plan = compile_cypher(
+        "MATCH (n)-[r]->() WHERE (n.p = 1 OR n.p = 2 OR n.p = 1) AND (type(r) = 'A' OR type(r) = 'B') RETURN n"
+    )
+    assert _json(plan.chain)[0] == _json([n({"p": is_in([1, 2])}, name="n")])[0]
+    assert _json(plan.chain)[1]["edge_match"] == {"type": is_in(["A", "B"]).to_json()}
+
+
+def test_single_node_return_has_no_alias():
+    plan = compile_cypher("MATCH (a:A:B) RETURN a")
+    assert plan.return_alias is None
+    assert _json(plan.chain) == _json([n({"label__A": True, "label__B": True})])
+
+
+@pytest.mark.parametrize(
+    "cypher",
+    [
+        "MATCH (a) RETURN a.name",
+        "MATCH (a), (b) RETURN a",
+        "MATCH (a)-[*2]->(b) RETURN b",
+        "MATCH (a)-->(a) RETURN a",
+        "MATCH (a)-->(b) WHERE a.x = 1 OR b.x = 1 RETURN a",
+        "MATCH (a) WHERE a:A OR a.x = 1 RETURN a",
+        "MATCH (a) WHERE a.x = null RETURN a",
+        "MATCH (a)-->(b) WHERE a.x = 1 XOR b.x = 1 AND a.y = 2 RETURN a",
+        "MATCH (a) RETURN a ORDER BY a.x",
+        "RETURN 1",
+    ],
+)
+def test_unsupported_queries(cypher):
+    with pytest.raises(UnsupportedQuery):
+        compile_cypher(cypher)
+
+
+def test_plan_cache_keys_on_normalized_text():
+    assert normalize_query("match (n)\n  where n.name='x'  return n;") == normalize_query(
+        "MATCH (n) WHERE n.name = 'x' RETURN n"
+    )
+    compile_cypher("MATCH (cached:Cached) RETURN cached")
+    hits = plan_cache_info().hits
+    plan = compile_cypher("match  (cached:Cached)\nreturn cached")
+    assert plan_cache_info().hits == hits + 1
+    assert plan is compile_cypher("MATCH (cached:Cached) RETURN cached")
+
+
+@pytest.mark.parametrize(
+    "cypher, filters",
+    [
+        ("MATCH (n:Distinct) RETURN n", {"label__Distinct": True}),
+        ("MATCH (n) WHERE n.distinct = 1 RETURN n", {"distinct": 1}),
+        ("MATCH (n {null: 1, Return: 2}) RETURN n", {"null": 1, "Return": 2}),
+        ("match (n:Null {k: null}) return n", {"label__Null": True, "k": None}),
+    ],
+)
+def test_names_that_spell_keywords_keep_their_case(cypher, filters):
+    assert compile_cypher(cypher).chain[0].filter_dict == filters
+
+
+def test_plan_cache_keeps_identifier_case():
+    assert normalize_query("MATCH (n:Distinct) RETURN n") != normalize_query("MATCH (n:DISTINCT) RETURN n")
+    assert compile_cypher("MATCH (n:Distinct) RETURN n") is not compile_cypher("MATCH (n:DISTINCT) RETURN n")
+
+
+def test_translation_mismatch_ignores_unreturned_names():
+    cypher = "MATCH (a)-[r:T]->(b) RETURN b"
+    assert translation_mismatch(cypher, [n(name="a"), e_forward({"type": "T"}, name="r"), n(name="b")], "b") is None
+    assert "op 1" in translation_mismatch(cypher, [n(), e_forward(), n(name="b")], "b")
+    assert "return alias" in translation_mismatch(cypher, [n(), e_forward({"type": "T"}), n(name="b")], None)
+
+
+@pytest.mark.parametrize("key", [entry.key for entry in REGISTRY.entries(status="supported")])
+def test_hand_written_translations_match_compiled(key):
+    scenario = REGISTRY.get(key)
+    assert translation_mismatch(scenario.cypher, scenario.gfql, scenario.return_alias) is None
@@ -0,0 +1,64 @@
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from graphistry.tests.test_compute import CGFull
+
+from tests.cypher_tck.graph_cache import BuiltGraphCache
+from tests.cypher_tck.parse_cypher import graph_fixture_from_create
+
+
+def _build(fixture):
+    nodes = pd.DataFrame(list(fixture.nodes))
+    edges = pd.DataFrame(list(fixture.edges))
+    return CGFull().nodes(nodes, fixture.node_id).edges(edges, fixture.src, fixture.dst, edge=fixture.edge_id)
+
+
+def test_cache_reuses_build_and_isolates_mutation():
+    builds = []
+
+    def build(fixture):
+        builds.append(fixture)
+        return _build(fixture)
+
+    cache = BuiltGraphCache(build, verify=True)
+    fixture = graph_fixture_from_create("CREATE (:A {num: 1})-[:T]->(:B {num: 2})")
+    first = cache.get(fixture)
+    first._nodes["num"] = 0
+    second = cache.get(fixture)
+    assert len(builds) == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert list(second._nodes["num"]) == [1, 2]
+
+    # Cached NumPy buffers are read-only, so an in-place edit cannot write
+    # through; views copy before writing.
+    ((cached, _, _),) = cache._entries.values()
+    assert not np.asarray(cached._nodes["num"].array).flags.writeable
+    second._nodes.loc[0, "num"] = 5
+    assert list(cache.get(fixture)._nodes["num"]) == [1, 2]
+
+    # Columns that cannot be frozen (Arrow strings here, cudf) are covered by
+    # the opt-in digest check, which rebuilds instead of handing the edit on.
+    cached._nodes.loc[0, "id"] = "changed"
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        third = cache.get(fixture)
+    assert "changed" not in set(third._nodes["id"])
+    assert sum("mutated in place" in str(item.message) for item in caught) == cache.mutations == len(builds) - 1 == 1
+    assert not BuiltGraphCache(build).verify
+
+
+def test_cache_evicts_lru_and_by_budget():
+    fixtures = [graph_fixture_from_create(f"CREATE (:A {{num: {i}}})") for i in range(3)]
+    cache = BuiltGraphCache(_build, max_entries=2)
+    for fixture in fixtures:
+        cache.get(fixture)
+    cache.get(fixtures[1])
+    assert len(cache) == 2
+    cache.get(fixtures[0])
+    assert cache.misses == 4
+
+    tiny = BuiltGraphCache(_build, max_bytes=1)
+    tiny.get(fixtures[0])
+    assert len(tiny) == 0 and tiny.nbytes == 0
@@ -0,0 +1,51 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from tests.cypher_tck.idsets import alias_ids, assert_same_ids, diff_ids, id_set, ids_from_df
+
+
+def test_id_set_ignores_order_duplicates_and_dtype():
+    assert id_set(["b", "a", "a"]) == id_set(pd.Series(["a", "b"], dtype=object))
+    assert id_set(pd.Series(["a", "b"], dtype="string")) == id_set({"a", "b"})
+    assert id_set([3, 1, 2]) == id_set(np.array([1.0, 2.0, 3.0]))
+    assert id_set([]) == id_set(None)
+    assert id_set(["1"]) != id_set([1])
+    assert id_set(pd.Series([1, 2], dtype=object)) == id_set([1, 2]) == id_set(pd.Series([2, 1], dtype="Int64"))
+    assert id_set(pd.Series([1, 2.0], dtype=object)) == id_set(np.array([1, 2]))
+
+
+def test_mixed_object_ids_do_not_match_their_strings():
+    assert id_set([1, "a"]) != id_set(["1", "a"])
+    assert id_set([True, "a"]) != id_set(["True", "a"])
+    assert id_set([(1, 2)]) != id_set(["(1, 2)"])
+    assert id_set([None]) != id_set(["None"])
+    assert id_set([np.int64(1), "a"]) == id_set(["a", 1])
+
+
+def test_null_ids_are_kept_and_reported():
+    assert id_set(["a", None]) != id_set(["a"])
+    assert id_set([1, None]) != id_set([1])
+    assert id_set(pd.Series([1, None], dtype=object)) == id_set(np.array([1.0, np.nan, np.nan]))
+    assert id_set(["a", None, np.nan]) == id_set([None, "a"])
+    with pytest.raises(AssertionError, match=r"missing \[\], extra \[nan\]"):
+        assert_same_ids(id_set([1, 2]), id_set(pd.Series([1, 2, None], dtype="Int64")), "node ids")
+    with pytest.raises(AssertionError, match=r"missing \[\], extra \[None\]"):
+        assert_same_ids(id_set(["a"]), id_set(["a", None]), "node ids")
+
+
+def test_ids_from_frames():
+    df = pd.DataFrame({"id": ["a", "b", "c"], "x": [True, None, False]})
+    assert ids_from_df(df, "id") == id_set(["c", "b", "a"])
+    assert ids_from_df(df, "missing") == id_set([])
+    assert alias_ids(df, "id", "x") == id_set(["a"])
+
+
+def test_diff_is_capped():
+    expected = id_set([f"n{i}" for i in range(30)])
+    actual = id_set([f"n{i}" for i in range(5, 30)] + ["x"])
+    missing, extra = diff_ids(expected, actual)
+    assert sorted(missing) == ["n0", "n1", "n2", "n3", "n4"]
+    assert list(extra) == ["x"]
+    with pytest.raises(AssertionError, match=r"expected 30, got 26; missing .*\(\+2 more\), extra \['x'\]"):
+        assert_same_ids(expected, actual, "node ids", limit=3)
@@ -0,0 +1,53 @@
+import pandas as pd
+
+from graphistry.compute import e_forward, n
+from graphistry.compute.filter_by_dict import filter_by_dict
+from graphistry.tests.test_compute import CGFull
+
+from tests.cypher_tck.labels import (
+    LabelDictionary,
+    encode_label_bitmask,
+    label_dictionary,
+    label_mask_filter,
+    rewrite_label_filters,
+)
+from tests.cypher_tck.parse_cypher import graph_fixture_from_create
+
+
+def test_encode_label_bitmask_multiword():
+    labels = [f"L{i:02d}" for i in range(70)]
+    nodes = pd.DataFrame({"id": [0, 1, 2], "labels": [("L00", "L69"), (), ("L65",)]})
+    dictionary = LabelDictionary(tuple(labels))
+    encoded = encode_label_bitmask(nodes, dictionary)
+    assert dictionary.columns == ["label_mask_0", "label_mask_1"]
+    assert encoded["label_mask_0"].tolist() == [1, 0, 0]
+    assert encoded["label_mask_1"].tolist() == [1 << 5, 0, 1 << 1]
+    assert str(encoded["label_mask_0"].dtype) == "uint64"
+
+    matched = filter_by_dict(encoded, label_mask_filter({"label__L69": True}, dictionary))
+    assert matched["id"].tolist() == [0]
+    none = filter_by_dict(encoded, label_mask_filter({"label__Missing": True}, dictionary))
+    assert none.empty
+    without = filter_by_dict(encoded, label_mask_filter({"label__L65": False}, dictionary))
+    assert without["id"].tolist() == [0, 1]
+
+
+def test_bitmask_chain_matches_label_columns():
+    fixture = graph_fixture_from_create(
+        """
+        CREATE (:A)-[:T1]->(:B),
+               (:B)-[:T2]->(:A),
+               (:B)-[:T3]->(:B),
+               (:A)-[:T4]->(:A)
+        """
+    )
+    dictionary = label_dictionary(fixture)
+    assert dictionary.labels == ("A", "B")
+    nodes = encode_label_bitmask(fixture.nodes.to_pandas(fixture.node_columns), dictionary)
+    edges = fixture.edges.to_pandas(fixture.edge_columns)
+    g = CGFull().nodes(nodes, "id").edges(edges, "src", "dst", edge="edge_id")
+    chain = rewrite_label_filters(
+        [n({"label__A": True}), e_forward(), n({"label__B": True})], dictionary
+    )
+    result = g.gfql(chain, engine="pandas")
+    assert set(result._edges["edge_id"]) == {"rel_1"}
@@ -0,0 +1,37 @@
+from graphistry import n
+from graphistry.gfql.ref.enumerator import OracleCaps
+
+from tests.cypher_tck.oracle_cache import OracleCache, OracleEntry
+from tests.cypher_tck.parse_cypher import graph_fixture_from_create
+
+
+def test_oracle_cache_round_trip(tmp_path):
+    fixture = graph_fixture_from_create("CREATE (:A)-[:T]->(:B)")
+    chain = [n({"label__A": True})]
+    caps = OracleCaps(max_nodes=10, max_edges=10)
+    entry = OracleEntry(node_ids=("anon_1",), edge_ids=(), tags={"a": ("anon_1",)})
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return entry
+
+    cache = OracleCache(tmp_path)
+    assert cache.get(fixture, chain, caps, compute) == entry
+    assert OracleCache(tmp_path).get(fixture, chain, caps, compute) == entry
+    assert len(calls) == 1
+
+    key = cache.key(fixture, chain, caps)
+    assert cache.key(fixture, chain, OracleCaps(max_nodes=11, max_edges=10)) != key
+    assert cache.key(fixture, [n({"label__B": True})], caps) != key
+    assert cache.key(graph_fixture_from_create("CREATE (:A)"), chain, caps) != key
+    assert cache.key(fixture, chain, caps, variant="bitmask") != key
+
+
+def test_oracle_cache_disabled(tmp_path):
+    fixture = graph_fixture_from_create("CREATE (:A)")
+    entry = OracleEntry(node_ids=(), edge_ids=(), tags={})
+    cache = OracleCache(None)
+    cache.get(fixture, [n()], OracleCaps(), lambda: entry)
+    cache.get(fixture, [n()], OracleCaps(), lambda: entry)
+    assert (cache.hits, cache.misses) == (0, 2)
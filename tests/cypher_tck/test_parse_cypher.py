@@ -1,4 +1,14 @@
-from tests.cypher_tck.parse_cypher import graph_fixture_from_create
+import io
+import time
+
+import pytest
+
+from tests.cypher_tck.parse_cypher import (
+    graph_fixture_from_create,
+    iter_fixture_chunks,
+    merge_fixtures,
+    write_fixture_parquet,
+)
 
 
 def test_parse_create_nodes_only():
@@ -25,8 +35,8 @@ def test_parse_create_relationship():
     fixture = graph_fixture_from_create(script)
     nodes = {node["id"]: node for node in fixture.nodes}
     assert set(nodes) == {"a", "b"}
-    assert nodes["a"].get("labels") == ["A"]
-    assert nodes["b"].get("labels") == ["B"]
+    assert nodes["a"].get("labels") == ("A",)
+    assert nodes["b"].get("labels") == ("B",)
 
     assert len(fixture.edges) == 1
     edge = fixture.edges[0]
@@ -56,3 +66,150 @@ def test_parse_create_relationship_properties():
     assert edge["type"] == "T"
     assert edge["name"] == "bar"
     assert edge["weight"] == 2
+
+
+def test_parse_create_is_interned_and_immutable():
+    first = graph_fixture_from_create("CREATE (a:A)-[:LOOP]->(a)")
+    second = graph_fixture_from_create(
+        """
+        CREATE (a:A)-[:LOOP]->(a)
+        """
+    )
+    assert first is second
+    with pytest.raises(TypeError):
+        first.nodes[0]["name"] = "x"
+    with pytest.raises(AttributeError):
+        first.nodes.append({"id": "b"})
+
+
+def test_parse_create_columnar_tables():
+    fixture = graph_fixture_from_create(
+        """
+        CREATE (a:A {num: 1}), (b:B {num: 2, name: 'b'})
+        CREATE (a)-[:T {weight: 1.5}]->(b)
+        """
+    )
+    nodes = fixture.nodes.to_pandas(fixture.node_columns)
+    assert list(nodes["id"]) == ["a", "b"]
+    assert str(nodes["num"].dtype) == "int64"
+    assert nodes["name"].isna().tolist() == [True, False]
+    edges = fixture.edges.to_pandas(fixture.edge_columns)
+    assert edges["weight"].tolist() == [1.5]
+    assert edges["undirected"].dtype == bool
+    assert "name" not in fixture.nodes[0]
+
+
+def test_columnar_fingerprint_follows_values_and_types():
+    def fingerprint(script):
+        return graph_fixture_from_create(script).fingerprint
+
+    base = fingerprint("CREATE (:A {num: 1})-[:T]->(:B {name: 'b'})")
+    assert base == fingerprint("CREATE (:A {num: 1})-[:T]->(:B {name: 'b'})")
+    assert base != fingerprint("CREATE (:A {num: 2})-[:T]->(:B {name: 'b'})")
+    assert base != fingerprint("CREATE (:A {num: 1.0})-[:T]->(:B {name: 'b'})")
+    assert base != fingerprint("CREATE (:A {num: '1'})-[:T]->(:B {name: 'b'})")
+    assert base != fingerprint("CREATE (:A {num: 1})-[:T]->(:B {name: 'c'})")
+
+
+def test_parse_create_quotes_escapes_and_backticks():
+    script = r"""
+    CREATE (`my node`:`Odd Label` {name: 'it\'s, (not) a [node]', alt: "say \"hi\""})
+    CREATE (`my node`)-->(:B)<-[:`HAS TYPE`]-(c)
+    """
+    fixture = graph_fixture_from_create(script)
+    nodes = {node["id"]: node for node in fixture.nodes}
+    assert nodes["my node"]["labels"] == ("Odd Label",)
+    assert nodes["my node"]["name"] == "it's, (not) a [node]"
+    assert nodes["my node"]["alt"] == 'say "hi"'
+    edges = [(edge["src"], edge["dst"], edge["type"]) for edge in fixture.edges]
+    assert edges == [("my node", "anon_2", None), ("c", "anon_2", "HAS TYPE")]
+
+
+def test_parse_create_list_properties():
+    fixture = graph_fixture_from_create("CREATE ({numbers: [1, 2, 3], nested: [[1], ['a', null]], expr: [1 + 2]})")
+    node = fixture.nodes[0]
+    assert node["numbers"] == (1, 2, 3)
+    assert node["nested"] == ((1,), ("a", None))
+    assert node["expr"] == "[1 + 2]"
+
+
+def test_parse_create_long_chain():
+    length = 5000
+    script = "CREATE (n0)" + "".join(f"-[:NEXT {{step: {i}}}]->(n{i + 1})" for i in range(length))
+    fixture = graph_fixture_from_create(script)
+    assert len(fixture.nodes) == length + 1
+    assert len(fixture.edges) == length
+    last = fixture.edges[length - 1]
+    assert (last["src"], last["dst"], last["step"]) == (f"n{length - 1}", f"n{length}", length - 1)
+
+
+def test_parse_create_rejects_malformed_scripts():
+    with pytest.raises(ValueError, match="Unterminated"):
+        graph_fixture_from_create("CREATE ({name: 'open})")
+    with pytest.raises(ValueError, match="Expected"):
+        graph_fixture_from_create("CREATE (a)-[:T]->(b")
+
+
+def _records(table):
+    return [dict(row) for row in table]
+
+
+def test_iter_fixture_chunks_matches_whole_script():
+    script = """
+    CREATE (a:A {name: 'a'}), (b:B {name: 'multi
+    line'})
+    CREATE (a)-[:T {w: 1}]->(b)<-[:U]-(:C), (b)-[:T {w: [1, 2]}]->(a)
+    """
+    whole = graph_fixture_from_create(script)
+    for chunk_rows in (1, 2, 100):
+        chunks = list(iter_fixture_chunks(io.StringIO(script), chunk_rows=chunk_rows))
+        assert all(len(chunk.nodes) <= chunk_rows and len(chunk.edges) <= chunk_rows for chunk in chunks)
+        merged = merge_fixtures(chunks)
+        assert _records(merged.nodes) == _records(whole.nodes)
+        assert _records(merged.edges) == _records(whole.edges)
+    assert {node["name"] for node in whole.nodes if "name" in node} == {"a", "multi line"}
+
+
+def test_iter_fixture_chunks_multi_line_literals_are_linear():
+    body = [f"line {i} with 'quote' and \\\\ slash" for i in range(20000)]
+    lines = ["CREATE (a {text: \"first"] + body + ["last\", `odd``", "key`: 1}), (b {s: 'x\\", "y'})"]
+    start = time.perf_counter()
+    (chunk,) = iter_fixture_chunks(lines)
+    assert time.perf_counter() - start < 5.0
+    nodes = _records(chunk.nodes)
+    assert nodes[0]["text"] == " ".join(["first", *(line.replace("\\\\", "\\") for line in body), "last"])
+    assert nodes[0]["odd` key"] == 1
+    assert nodes[1]["s"] == "x y"
+    assert nodes == _records(graph_fixture_from_create("\n".join(lines)).nodes)
+
+
+def test_iter_fixture_chunks_reports_unterminated_literals():
+    with pytest.raises(ValueError, match="literal opened on line 2$"):
+        list(iter_fixture_chunks(["CREATE (a)", "CREATE ({name: 'open", "", "more"]))
+    with pytest.raises(ValueError, match="opened on line 1 runs past"):
+        list(iter_fixture_chunks(["CREATE ({name: 'open"] + ["x" * 1000] * 2000))
+
+
+def test_iter_fixture_chunks_rejects_late_labels():
+    lines = ["CREATE (a:A), (b:B)", "CREATE (a)-[:T]->(b)", "CREATE (a:Late)"]
+    assert len(list(iter_fixture_chunks(lines[:2], chunk_rows=1))) == 3
+    with pytest.raises(ValueError, match="earlier chunk"):
+        list(iter_fixture_chunks(lines, chunk_rows=1))
+
+
+def test_write_fixture_parquet(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    source = tmp_path / "setup.cypher"
+    source.write_text("\n".join(f"CREATE (n{i}:N {{num: {i}}})-[:NEXT]->(m{i})" for i in range(5)))
+    paths = write_fixture_parquet(source, tmp_path / "out", chunk_rows=4)
+    assert [path.name for path in paths] == [
+        "nodes-00000.parquet",
+        "edges-00000.parquet",
+        "nodes-00001.parquet",
+        "edges-00001.parquet",
+        "nodes-00002.parquet",
+        "edges-00002.parquet",
+    ]
+    nodes = [pq.read_table(path).to_pylist() for path in paths if path.name.startswith("nodes")]
+    assert sum(len(part) for part in nodes) == 10
+    assert nodes[0][0] == {"id": "n0", "labels": ["N"], "num": 0}
@@ -0,0 +1,76 @@
+import pandas as pd
+import pytest
+
+from graphistry.compute import e_forward, e_undirected, n
+from graphistry.gfql.ref.enumerator import OracleCaps, enumerate_chain
+from graphistry.tests.test_compute import CGFull
+
+from tests.cypher_tck.harness import GRAPH_CACHE, scenario_chain
+from tests.cypher_tck.planner import plan_chain, reverse_chain
+from tests.cypher_tck.scenarios import REGISTRY
+
+
+def _skewed_graph():
+    # 200 :A nodes fan into 4 :B nodes.
+    nodes = pd.DataFrame(
+        {
+            "id": range(204),
+            "label__A": [True] * 200 + [False] * 4,
+            "label__B": [False] * 200 + [True] * 4,
+            "num": list(range(204)),
+        }
+    )
+    edges = pd.DataFrame({"src": range(200), "dst": [200 + i % 4 for i in range(200)], "edge_id": range(200)})
+    edges["type"] = ["T" if i % 2 else "U" for i in range(200)]
+    return CGFull().nodes(nodes, "id").edges(edges, "src", "dst", edge="edge_id")
+
+
+def _ids(g, chain, alias):
+    result = g.gfql(chain)
+    nodes = result._nodes
+    if alias is not None:
+        nodes = nodes[nodes[alias].fillna(False).astype(bool)]
+    return set(nodes["id"]), set(result._edges["edge_id"])
+
+
+def test_selective_far_end_reverses_chain_with_oracle_results():
+    g = _skewed_graph()
+    chain = [n({"label__A": True}, name="a"), e_forward({"type": "T"}, name="r"), n({"label__B": True}, name="b")]
+    plan = plan_chain(chain, g)
+    assert plan.reversed and plan.reverse_cost < plan.forward_cost
+    assert [op.to_json()["direction"] for op in plan.chain[1::2]] == ["reverse"]
+    assert [op._name for op in plan.chain] == ["b", "r", "a"]
+
+    oracle = enumerate_chain(g, chain, caps=OracleCaps(max_nodes=500, max_edges=500))
+    for alias in ("a", "b"):
+        assert _ids(g, plan.chain, alias) == (set(oracle.tags[alias]), set(oracle.edges["edge_id"]))
+
+
+def test_query_masks_count_toward_anchor_cost():
+    g = _skewed_graph()
+    chain = [n(name="a"), e_forward(), n(query="(`num` < 3) | (`num` > 300)", name="b")]
+    plan = plan_chain(chain, g)
+    assert plan.reversed and plan.chain[0].query == chain[-1].query
+    oracle = enumerate_chain(g, chain, caps=OracleCaps(max_nodes=500, max_edges=500))
+    for alias in ("a", "b"):
+        assert _ids(g, plan.chain, alias) == (set(oracle.tags[alias]), set(oracle.edges["edge_id"]))
+
+
+def test_selective_near_end_and_ties_keep_chain():
+    g = _skewed_graph()
+    chain = [n({"label__B": True}), e_undirected(), n({"label__A": True})]
+    assert not plan_chain(chain, g).reversed
+    assert not plan_chain([n(), e_forward(), n()], g).reversed
+    assert not plan_chain([n({"label__B": True})], g).reversed
+    assert not plan_chain([n(), e_forward(hops=2), n({"label__B": True})], g).reversed
+
+
+@pytest.mark.parametrize("key", [entry.key for entry in REGISTRY.entries(status="supported")])
+def test_reversed_supported_chains_match_as_written(key):
+    scenario = REGISTRY.get(key)
+    chain = scenario_chain(scenario)
+    if len(chain) < 3:
+        pytest.skip("single-node chain")
+    g = GRAPH_CACHE.get(scenario.graph)
+    alias = scenario.return_alias
+    assert _ids(g, reverse_chain(chain), alias) == _ids(g, chain, alias)
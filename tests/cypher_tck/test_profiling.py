@@ -0,0 +1,73 @@
+import json
+import time
+import tracemalloc
+
+from tests.cypher_tck.harness import ScenarioResult
+from tests.cypher_tck.profiling import PhaseTimer, phase, profile_records, write_profile
+
+
+def test_phase_timer_accumulates_and_activates():
+    timer = PhaseTimer({}, {})
+    with timer.phase("oracle"):
+        pass
+    with timer.phase("oracle"):
+        pass
+    with phase("fixture_build"):
+        pass
+    with timer.active():
+        with phase("fixture_build"):
+            pass
+    assert set(timer.timings) == {"oracle", "fixture_build"}
+    assert not timer.metrics
+
+
+def test_phase_timer_traces_memory():
+    tracemalloc.start()
+    try:
+        timer = PhaseTimer({}, {}, trace_memory=True)
+        with timer.phase("pandas.run"):
+            block = bytearray(1 << 20)
+        del block
+    finally:
+        tracemalloc.stop()
+    assert timer.metrics["pandas.run.peak_bytes"] >= 1 << 20
+
+
+def test_nested_phases_keep_outer_peak_and_split_time():
+    tracemalloc.start()
+    try:
+        timer = PhaseTimer({}, {}, trace_memory=True)
+        with timer.phase("pandas.convert"):
+            block = bytearray(4 << 20)
+            del block
+            with timer.phase("fixture_build"):
+                time.sleep(0.05)
+                inner = bytearray(1 << 20)
+            del inner
+            time.sleep(0.02)
+    finally:
+        tracemalloc.stop()
+    assert timer.metrics["pandas.convert.peak_bytes"] >= 4 << 20
+    assert 1 << 20 <= timer.metrics["fixture_build.peak_bytes"] < 4 << 20
+    assert timer.timings["fixture_build"] >= 0.05
+    assert 0.02 <= timer.timings["pandas.convert"] < 0.05
+
+
+def test_profile_records_one_line_per_engine(tmp_path):
+    result = ScenarioResult(
+        "k-1",
+        "f.feature",
+        "passed",
+        timings={"catalog_load": 0.5, "oracle": 1.0, "pandas.run": 2.0, "cudf.run": 0.5, "cudf.convert": 0.25},
+        metrics={"pandas.nodes": 3, "cudf.nodes": 3, "oracle.nodes": 3, "oracle.run.peak_bytes": 7, "oracle.cached": 1},
+    )
+    records = profile_records(result)
+    assert all(record["oracle_cached"] for record in records)
+    assert [record["engine"] for record in records] == ["pandas", "cudf"]
+    assert records[0]["phases"] == {"catalog_load": 0.5, "oracle": 1.0, "engine_run": 2.0}
+    assert records[1]["total"] == 2.25
+    assert records[1]["result_nodes"] == 3
+
+    path = tmp_path / "profile.jsonl"
+    write_profile([result, ScenarioResult("k-2", "f.feature", "xfailed")], str(path))
+    assert [json.loads(line)["engine"] for line in path.read_text().splitlines()] == ["pandas", "cudf"]
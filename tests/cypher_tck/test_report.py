@@ -0,0 +1,56 @@
+from tests.cypher_tck.report import build_performance, load_baseline
+
+
+def _record(key, engine, total, group="clauses", oracle=0.0, run=0.0, **flags):
+    # `total` stands in for the sum of every phase, oracle included.
+    return {
+        "key": key,
+        "engine": engine,
+        "feature_path": f"tck/features/{group}/match/Match1.feature",
+        "total": total,
+        "phases": {"oracle": oracle, "engine_run": run},
+        **flags,
+    }
+
+
+def test_performance_summary_single_pass():
+    records = [_record(f"s{i}", "pandas", i / 100, oracle=0.02, run=i / 200) for i in range(1, 101)]
+    records.append(_record("e1", "pandas", 5.0, group="expressions", oracle=0.02, run=0.01))
+    baseline = load_baseline([_record("s100", "pandas", 0.2, run=0.1), _record("s50", "pandas", 0.49, run=0.245)])
+    summary = build_performance(iter(records), baseline, top_n=2)
+
+    assert sorted(summary.slowest, reverse=True) == [(5.0, "e1", "pandas"), (1.0, "s100", "pandas")]
+    clauses = summary.groups["clauses"]
+    assert clauses.count == 100
+    assert 0.95 <= clauses.quantile(0.95) <= 0.95 * 1.05
+    assert summary.groups["expressions"].quantile(0.95) == 5.0
+    assert [(key, before) for _, key, _, before, _ in summary.regressions] == [("s100", 0.1)]
+
+    text = "\n".join(summary.lines())
+    assert "| pandas | 25.2600 | 2.0200 | 0.08x |" in text
+    assert "- s100 [pandas]: 0.1000s -> 0.5000s (5.00x)" in text
+
+
+def test_cached_records_and_oracle_hits_are_not_timed():
+    records = [
+        _record("s1", "pandas", 0.5, oracle=0.2, run=0.1),
+        _record("s2", "pandas", 0.1, oracle=0.001, run=0.1, oracle_cached=True),
+        _record("s3", "pandas", 9.0, oracle=4.0, run=5.0, cached=True),
+        _record("s1", "cudf", 0.1, oracle=0.001, run=0.05, oracle_cached=True),
+    ]
+    baseline = load_baseline(
+        [
+            _record("s3", "pandas", 1.0, run=1.0),
+            # The oracle hit its cache in the baseline run but not here: not an engine regression.
+            _record("s1", "pandas", 0.11, oracle=0.001, run=0.1, oracle_cached=True),
+        ]
+    )
+    summary = build_performance(iter(records), baseline)
+    assert [key for _, key, _ in sorted(summary.slowest, reverse=True)] == ["s1", "s2", "s1"]
+    assert summary.groups["clauses"].count == 3
+    assert summary.regressions == []
+
+    text = "\n".join(summary.lines())
+    assert "(4 profile records, 1 reused and not timed)" in text
+    assert "| pandas | 0.1000 | 0.2000 | 2.00x |" in text
+    assert "| cudf | n/a | n/a | n/a |" in text
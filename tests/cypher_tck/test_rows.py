@@ -0,0 +1,59 @@
+import pandas as pd
+import pytest
+
+from tests.cypher_tck.rows import (
+    RowTable,
+    assert_rows,
+    compare_rows,
+    node_values,
+    returns_ordered,
+)
+from tests.cypher_tck.values import Map, Node, Scalar
+
+
+def test_unordered_comparison_is_multiset():
+    expected = RowTable.from_expected([{"n": "1"}, {"n": "1"}, {"n": "2"}])
+    assert compare_rows(expected, RowTable.from_expected([{"n": 2}, {"n": 1}, {"n": 1}])) is None
+    message = compare_rows(expected, RowTable.from_expected([{"n": 1}, {"n": 2}, {"n": 2}]))
+    assert message == "rows differ: expected 3, got 3; missing [{n: 1}], extra [{n: 2}]"
+    assert len(expected.distinct()) == 2
+
+
+def test_integer_float_and_boolean_cells_differ():
+    expected = RowTable.from_expected([{"n": "1.0"}])
+    assert compare_rows(expected, RowTable.from_expected([{"n": "true"}])) is not None
+    assert compare_rows(expected, RowTable.from_expected([{"n": "1"}])) is not None
+    assert compare_rows(expected, RowTable.from_expected([{"n": 1.0}])) is None
+    nodes = pd.DataFrame({"id": ["a"], "labels": [["A"]], "num": [True]})
+    actual = RowTable.from_columns({"n": node_values(nodes, ["num"])})
+    assert compare_rows(RowTable.from_expected([{"n": "(:A {num: 1})"}]), actual) is not None
+    assert compare_rows(RowTable.from_expected([{"n": "(:A {num: true})"}]), actual) is None
+
+
+def test_ordered_comparison_reports_first_mismatch():
+    expected = RowTable.from_expected([{"n": 1}, {"n": 2}])
+    with pytest.raises(AssertionError, match=r"position 0: expected \{n: 1\}, got \{n: 2\}"):
+        assert_rows(expected, RowTable.from_expected([{"n": 2}, {"n": 1}]), ordered=True)
+    assert compare_rows(expected, RowTable.from_expected([{"m": 1}, {"m": 2}])).startswith("columns differ")
+    assert returns_ordered("MATCH (n) RETURN n ORDER BY n.x")
+    assert not returns_ordered("MATCH (n) WITH n ORDER BY n.x LIMIT 1 RETURN n")
+
+
+def test_node_values_match_expected_literals():
+    nodes = pd.DataFrame(
+        {
+            "id": ["a", "b", "c"],
+            "labels": [["B", "A"], [], ["A"]],
+            "name": ["x", None, "z"],
+            "nums": [None, [1, 2], None],
+        }
+    )
+    values = node_values(nodes, ["nums", "name"])
+    assert values[1] == Node(properties=Map.of({"nums": (Scalar("int", 1), Scalar("int", 2))}))
+    actual = RowTable.from_columns({"n": values})
+    expected = RowTable.from_expected(
+        [{"n": "({nums: [1, 2]})"}, {"n": "(:A {name: 'z'})"}, {"n": "(:B:A {name: 'x'})"}]
+    )
+    assert compare_rows(expected, actual) is None
+    message = compare_rows(expected, RowTable.from_columns({"n": values[:2]}))
+    assert message.endswith("missing [{n: (:A {name: 'z'})}], extra []")
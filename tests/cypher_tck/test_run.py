@@ -0,0 +1,56 @@
+import multiprocessing
+from dataclasses import replace
+
+import pytest
+
+from tests.cypher_tck import run
+from tests.cypher_tck.models import ScenarioIndexEntry
+from tests.cypher_tck.results_store import ResultStore
+from tests.cypher_tck.run import format_results, run_entries, shard_entries
+from tests.cypher_tck.scenarios import REGISTRY
+
+
+def _stable(result, **changes):
+    # Wall times, and which build phases ran, depend on each process's graph cache.
+    return replace(result, duration=0.0, timings={}, **changes)
+
+
+def _entry(key):
+    return ScenarioIndexEntry(key=key, feature_path="f", module_path="m.py")
+
+
+def test_shard_entries_keeps_fixture_groups_together():
+    groups = [[_entry("a1"), _entry("a2"), _entry("a3")], [_entry("b1"), _entry("b2")], [_entry("c1")], [_entry("d1")]]
+    shards = shard_entries(groups, jobs=2)
+    assert [[entry.key for entry in shard] for shard in shards] == [["a1", "a2", "a3", "d1"], ["b1", "b2", "c1"]]
+    assert len(shard_entries(groups, jobs=8)) == 4
+
+
+@pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(), reason="needs fork")
+def test_parallel_run_matches_serial():
+    entries = REGISTRY.entries(status="supported") + REGISTRY.entries(status="xfail")[:5]
+    serial = run_entries(entries, jobs=1)
+    parallel = run_entries(entries, jobs=3)
+    assert [_stable(result) for result in parallel] == [_stable(result) for result in serial]
+    stable_parallel = [_stable(result) for result in parallel]
+    assert format_results(stable_parallel) == format_results([_stable(result) for result in serial])
+    assert {result.outcome for result in serial} == {"passed", "xfailed"}
+
+
+def test_result_store_reuses_unchanged_scenarios(tmp_path, monkeypatch):
+    path = tmp_path / "results.pkl"
+    entries = REGISTRY.entries(status="supported")[:3] + REGISTRY.entries(status="xfail")[:2]
+    first = run_entries(entries, store=ResultStore(path))
+    assert not any(result.cached for result in first)
+
+    second = run_entries(entries, store=ResultStore(path))
+    assert {result.key: result.cached for result in second} == {
+        entry.key: entry.status == "supported" for entry in entries
+    }
+    assert [_stable(result, cached=False) for result in second] == [_stable(result) for result in first]
+    assert "Reused: 3" in format_results(second)
+    assert not any(result.cached for result in run_entries(entries, store=ResultStore(path), full=True))
+
+    monkeypatch.setattr(run, "pygraphistry_version", lambda: "next")
+    assert not any(result.cached for result in run_entries(entries, store=ResultStore(path)))
+    assert len(ResultStore(path).results) == 3
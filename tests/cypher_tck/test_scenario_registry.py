@@ -0,0 +1,78 @@
+import graphistry
+
+from tests.cypher_tck.scenarios.catalog import ScenarioCatalog, dependencies_digest
+from tests.cypher_tck.scenarios.registry import ScenarioRegistry, scan_module
+
+
+def test_index_matches_loaded_scenarios():
+    registry = ScenarioRegistry()
+    entries = registry.entries(feature_path="tck/features/clauses/match/Match2.feature")
+    assert entries
+    for entry in entries:
+        scenario = registry.get(entry.key)
+        assert scenario.feature_path == entry.feature_path
+        assert scenario.status == entry.status
+        assert scenario.reason == entry.reason
+        assert scenario.tags == entry.tags
+        assert (scenario.gfql is not None) == entry.translated
+
+
+def test_get_loads_only_owning_module():
+    registry = ScenarioRegistry()
+    entry = registry.entry("match2-1")
+    registry.get("match2-1")
+    assert list(registry._loaded) == [entry.module_path]
+
+
+def test_scan_module_falls_back_to_ast():
+    source = """
+SCENARIOS = [
+    Scenario(key="k-1", feature_path="f.feature", scenario="s", cypher="MATCH (n) RETURN n",
+             graph=None, expected=None, gfql=[n()], tags=("match",)),
+]
+"""
+    entries = scan_module(source, "f.py")
+    assert [(entry.key, entry.translated, entry.tags) for entry in entries] == [("k-1", True, ("match",))]
+    assert entries[0].status == "supported"
+
+
+def test_catalog_serves_payloads_without_exec(tmp_path, monkeypatch):
+    path = tmp_path / "catalog.pkl"
+    registry = ScenarioRegistry(catalog=ScenarioCatalog(path))
+    expected = registry.get("match2-1")
+    registry.flush()
+
+    cached = ScenarioRegistry(catalog=ScenarioCatalog(path))
+
+    def _fail(module_path):
+        raise AssertionError(f"unexpected exec of {module_path}")
+
+    monkeypatch.setattr(cached, "_exec_module", _fail)
+    scenario = cached.get("match2-1")
+    assert scenario.key == expected.key
+    assert scenario.graph == expected.graph
+    assert scenario.expected == expected.expected
+
+
+def test_catalog_invalidates_only_edited_module(tmp_path):
+    source_a = tmp_path / "A.py"
+    source_b = tmp_path / "B.py"
+    source_a.write_text("SCENARIOS = []\n")
+    source_b.write_text("SCENARIOS = []\n")
+    catalog = ScenarioCatalog(tmp_path / "catalog.pkl", deps_digest="deps")
+    catalog.store_entries("A.py", source_a, source_a.read_bytes(), [])
+    catalog.store_entries("B.py", source_b, source_b.read_bytes(), [])
+    catalog.save()
+
+    source_a.write_text("SCENARIOS = []  # edited\n")
+    reloaded = ScenarioCatalog(tmp_path / "catalog.pkl", deps_digest="deps")
+    assert reloaded.lookup("A.py", source_a) is None
+    assert reloaded.lookup("B.py", source_b) is not None
+
+    assert ScenarioCatalog(tmp_path / "catalog.pkl", deps_digest="other").modules == {}
+
+
+def test_dependencies_digest_covers_graphistry(monkeypatch):
+    before = dependencies_digest(())
+    monkeypatch.setattr(graphistry, "__version__", "0.0.0+other", raising=False)
+    assert dependencies_digest(()) != before
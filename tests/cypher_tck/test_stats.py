@@ -0,0 +1,86 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from graphistry.compute import gt, is_in, isna, le
+from graphistry.tests.test_compute import CGFull
+
+from tests.cypher_tck.labels import encode_label_bitmask, has_labels
+from tests.cypher_tck.stats import GraphStats, column_stats, graph_stats
+
+
+def _graph():
+    nodes = pd.DataFrame(
+        {
+            "id": [10, 11, 12, 13, 14],
+            "labels": [("A",), ("A", "B"), ("B",), (), ("A",)],
+            "num": [1, 2, 2, 3, None],
+            "name": ["x", "y", "x", None, "z"],
+        }
+    )
+    edges = pd.DataFrame(
+        {"src": [10, 10, 11, 12, 99], "dst": [11, 12, 12, 10, 10], "type": ["T", "T", "U", "T", "U"], "eid": range(5)}
+    )
+    return CGFull().nodes(nodes, "id").edges(edges, "src", "dst", edge="eid")
+
+
+def test_label_and_type_counts():
+    g = _graph()
+    stats = GraphStats.of(g)
+    assert stats.label_counts == {"A": 3, "B": 2}
+    assert stats.type_counts == {"T": 3, "U": 2}
+    expanded = g.nodes(g._nodes.assign(label__A=[True, True, False, False, True]))
+    assert GraphStats.of(expanded).label_counts == {"A": 3}
+
+
+def test_column_stats_and_histogram():
+    stats = column_stats(pd.Series([1, 2, 2, 3, None]))
+    assert (stats.rows, stats.nulls, stats.distinct) == (5, 1, 3)
+    assert stats.top[0] == (2.0, 2)
+    assert stats.bin_counts.sum() == 4
+    assert stats.eq_fraction(2) == pytest.approx(2 / 5)
+    assert stats.above_fraction(3.0) == 0.0
+    assert stats.above_fraction(0.0) == pytest.approx(4 / 5)
+
+    dense = column_stats(pd.Series(np.arange(1000) % 7))
+    assert dense.distinct == 7 and dense.top[0] == (0, 143)
+    strings = column_stats(pd.Series(["a", "b", "a"]))
+    assert strings.top == (("a", 2), ("b", 1)) and strings.bin_edges is None
+
+
+def test_degrees_and_quantiles():
+    stats = GraphStats.of(_graph())
+    assert stats.degrees.out_degree.tolist() == [2, 1, 1, 0, 0]
+    assert stats.degrees.in_degree.tolist() == [2, 1, 2, 0, 0]
+    quantiles = stats.degrees.quantiles((0.0, 0.5, 1.0))
+    assert quantiles["total"] == tuple(np.quantile([4, 2, 3, 0, 0], [0.0, 0.5, 1.0]))
+
+    nodes, edges = pd.DataFrame({"id": ["a", "b"]}), pd.DataFrame({"s": ["a", "a"], "d": ["b", "c"]})
+    hashed = GraphStats(nodes, edges, "id", "s", "d")
+    assert hashed.degrees.out_degree.tolist() == [2, 0]
+    assert hashed.degrees.in_degree.tolist() == [0, 1]
+
+
+def test_selectivity():
+    g = _graph()
+    stats = GraphStats.of(g)
+    assert stats.node_selectivity(None) == 1.0
+    assert stats.node_selectivity({"num": 2}) == pytest.approx(2 / 5)
+    assert stats.node_selectivity({"num": gt(2.5)}) == pytest.approx(1 / 5, abs=0.1)
+    assert stats.node_selectivity({"num": le(2)}) == pytest.approx(3 / 5, abs=0.1)
+    assert stats.node_selectivity({"name": isna()}) == pytest.approx(1 / 5)
+    assert stats.node_selectivity({"name": is_in(["x", "z"])}) == pytest.approx(3 / 5)
+    assert stats.node_selectivity({"missing": 1}) == 0.0
+    assert stats.edge_selectivity({"type": "T"}) == pytest.approx(3 / 5)
+    assert stats.edge_selectivity({"type": is_in(["T", "U", "V"])}) == 1.0
+
+    bitmask = GraphStats.of(g.nodes(encode_label_bitmask(g._nodes)))
+    # A and B are bits 0 and 1; bitmask predicates are evaluated on the column.
+    assert bitmask.node_selectivity({"label_mask_0": has_labels(all_of=0b11)}) == pytest.approx(1 / 5)
+
+
+def test_graph_stats_cached_per_graph():
+    g = _graph()
+    assert graph_stats(g) is graph_stats(g)
+    assert graph_stats(g.nodes(g._nodes.copy())) is not graph_stats(g)
+    assert graph_stats(g, key="fixture") is graph_stats(_graph(), key="fixture")
@@ -0,0 +1,62 @@
+import math
+import pickle
+
+import numpy as np
+
+from tests.cypher_tck.values import (
+    NAN,
+    Map,
+    Node,
+    Path,
+    Relationship,
+    Scalar,
+    Unparsed,
+    from_python,
+    parse_cell,
+    render,
+)
+
+
+def _int(value):
+    return Scalar("int", value)
+
+
+def test_parse_structural_values():
+    assert parse_cell("(:B:A {y: 2, x: 'a'})") == Node(frozenset({"A", "B"}), Map.of({"x": "a", "y": _int(2)}))
+    assert parse_cell("(n:A {gone: null})") == Node(frozenset({"A"}))
+    assert parse_cell("[:T {b: 1, a: [1, 2]}]") == Relationship("T", Map.of({"a": (_int(1), _int(2)), "b": _int(1)}))
+    path = parse_cell("<(:A)-[:T]->(:B)<-[:U]-()>")
+    assert isinstance(path, Path)
+    assert path.steps[1] == ("<-", Relationship("U"), "-", Node())
+    assert render(path) == "<(:A)-[:T]->(:B)<-[:U]-()>"
+
+
+def test_parse_scalars_and_collections():
+    assert parse_cell("{b: null, a: true}") == Map.of({"a": Scalar("bool", True), "b": None})
+    assert parse_cell("'it\\'s'") == parse_cell("\"it's\"") == "it's"
+    assert parse_cell("[1, -2.5, 1e308, -Infinity, null]") == (
+        _int(1),
+        Scalar("float", -2.5),
+        Scalar("float", 1e308),
+        Scalar("float", -math.inf),
+        None,
+    )
+    assert parse_cell(3) == parse_cell("3") == _int(3)
+    assert parse_cell("NaN") == Scalar("float", NAN) == from_python(float("nan"))
+    assert parse_cell("not a < literal") == Unparsed("not a < literal")
+
+
+def test_engine_values_match_parsed_values():
+    assert from_python(np.array([np.int64(1), np.int64(2)])) == parse_cell("[1, 2]")
+    assert from_python({"k": [np.float64(0.5)]}) == parse_cell("{k: [0.5]}")
+    assert hash(from_python(float("nan"))) == hash(from_python(pickle.loads(pickle.dumps(NAN))))
+    assert pickle.loads(pickle.dumps(NAN)) is NAN
+
+
+def test_integers_floats_and_booleans_are_distinct():
+    one, one_float, true = parse_cell("1"), parse_cell("1.0"), parse_cell("true")
+    assert len({one, one_float, true}) == 3
+    assert one != one_float != true != one
+    assert from_python(np.int64(1)) == one and from_python(1.0) == one_float and from_python(np.bool_(True)) == true
+    assert parse_cell("(:A {num: 1})") != parse_cell("(:A {num: true})") != parse_cell("(:A {num: 1.0})")
+    assert [render(value) for value in (one, one_float, true)] == ["1", "1.0", "true"]
@@ -0,0 +1,90 @@
+import pandas as pd
+import pytest
+
+from graphistry.tests.test_compute import CGFull
+
+from tests.cypher_tck.compiler import compile_cypher
+from tests.cypher_tck.stats import GraphStats
+from tests.cypher_tck.where import (
+    And,
+    Comparison,
+    IsNull,
+    Not,
+    Or,
+    Xor,
+    mask_expression,
+    query_columns,
+    with_mask_columns,
+)
+
+
+def _frame():
+    # Row 2 has null p1, row 3 null p2; NaN and None are both Cypher null.
+    return pd.DataFrame({"p1": [12.0, 1.0, None, 12.0], "p2": [1.0, 13.0, 13.0, None], "s": ["a", "b", None, "a"]})
+
+
+def _rows(predicate):
+    return list(_frame().query(mask_expression(predicate)).index)
+
+
+def test_or_and_comparisons():
+    assert mask_expression(Or((Comparison("p1", "=", 12), Comparison("p2", "=", 13)))) == (
+        "((`p1` == 12) | (`p2` == 13))"
+    )
+    assert _rows(Or((Comparison("p1", "=", 12), Comparison("p2", "=", 13)))) == [0, 1, 2, 3]
+    assert _rows(And((Comparison("p1", ">=", 1), Comparison("p2", "<", 13)))) == [0]
+
+
+@pytest.mark.parametrize(
+    "predicate, rows",
+    [
+        # A comparison with null is null, and so is its negation.
+        (Comparison("p1", "<>", 12), [1]),
+        (Not(Comparison("p1", "=", 12)), [1]),
+        (Not(Comparison("s", "=", "a")), [1]),
+        (Not(Or((Comparison("p1", "=", 1), Comparison("p2", "=", 13)))), [0]),
+        (Not(And((Comparison("p1", "=", 12), Comparison("p2", "=", 13)))), [0, 1]),
+        (IsNull("p1"), [2]),
+        (Not(IsNull("s", negated=True)), [2]),
+        (Xor(Comparison("p1", "=", 12), Comparison("p2", "=", 13)), [0, 1]),
+        (Not(Xor(Comparison("p1", "=", 12), Comparison("p2", "=", 1))), [0, 1]),
+    ],
+)
+def test_null_semantics(predicate, rows):
+    assert _rows(predicate) == rows
+
+
+def test_rejects_null_literals_and_backticked_columns():
+    with pytest.raises(ValueError):
+        mask_expression(Comparison("p1", "=", None))
+    with pytest.raises(ValueError):
+        mask_expression(IsNull("a`b"))
+
+
+def test_query_columns_skip_string_literals():
+    query = mask_expression(Or((Comparison("name", "=", "a`b'"), IsNull("p 1"))))
+    assert query_columns(query) == {"name", "p 1"}
+
+
+@pytest.mark.parametrize(
+    "cypher, node_ids",
+    [
+        # A missing property is null: the OR falls back to its other side.
+        ("MATCH (n) WHERE n.missing = 1 OR n.name = 'a' RETURN n", [1]),
+        ("MATCH (n) WHERE NOT n.missing = 1 RETURN n", []),
+        ("MATCH (a)-[r]->(b) WHERE r.w <> 1 RETURN a", []),
+    ],
+)
+def test_masks_on_missing_properties_are_null(cypher, node_ids):
+    nodes = pd.DataFrame({"id": [1, 2, 3], "name": ["a", "b", None]})
+    edges = pd.DataFrame({"s": [1, 2], "d": [2, 3], "eid": [0, 1]})
+    g = CGFull().nodes(nodes, "id").edges(edges, "s", "d", edge="eid")
+    chain = list(compile_cypher(cypher).chain)
+    assert list(with_mask_columns(g, chain).gfql(chain)._nodes["id"]) == node_ids
+    assert "missing" not in g._nodes.columns
+    # The planner's estimate evaluates the same masks without raising.
+    stats = GraphStats.of(g)
+    if len(chain) == 1:
+        assert stats.node_selectivity(None, chain[0].query) == len(node_ids) / 3
+    else:
+        assert stats.edge_selectivity(None, chain[1].edge_query) == 0.0
@@ -0,0 +1,333 @@
+from __future__ import annotations
+
+import math
+import re
+from dataclasses import dataclass
+from typing import Any, FrozenSet, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from tests.cypher_tck.parse_cypher import Token, tokenize
+
+_INT_RE = re.compile(r"-?\d+")
+
+
+class _NaN:
+    # NaN that equals itself, so rows holding NaN hash and compare like the TCK
+    # expects. Pickles by reference to keep the singleton across catalog loads.
+    __slots__ = ()
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _NaN) or (isinstance(other, float) and math.isnan(other))
+
+    def __hash__(self) -> int:
+        return hash("NaN")
+
+    def __repr__(self) -> str:
+        return "NaN"
+
+    def __reduce__(self) -> str:
+        return "NAN"
+
+
+NAN = _NaN()
+
+
+@dataclass(frozen=True)
+class Scalar:
+    # Numbers and booleans carry their Cypher type: Python treats 1, 1.0 and
+    # True as equal with equal hashes, the TCK does not.
+    type: str
+    value: Any
+
+
+@dataclass(frozen=True)
+class Map:
+    items: FrozenSet[Tuple[str, Any]] = frozenset()
+
+    @classmethod
+    def of(cls, items: Mapping[str, Any]) -> "Map":
+        return cls(frozenset(items.items()))
+
+
+@dataclass(frozen=True)
+class Node:
+    labels: FrozenSet[str] = frozenset()
+    properties: Map = Map()
+
+
+@dataclass(frozen=True)
+class Relationship:
+    type: Optional[str] = None
+    properties: Map = Map()
+
+
+@dataclass(frozen=True)
+class Path:
+    start: Node
+    # (left arrow, relationship, right arrow, node) per hop, arrows as written.
+    steps: Tuple[Tuple[str, Relationship, str, Node], ...] = ()
+
+
+@dataclass(frozen=True)
+class Unparsed:
+    # Expected cell text this parser does not understand; compared verbatim.
+    text: str
+
+
+@dataclass(frozen=True)
+class ValueRows:
+    columns: Tuple[str, ...]
+    rows: Tuple[Tuple[Any, ...], ...]
+
+
+def _float(value: float) -> Scalar:
+    return Scalar("float", NAN if math.isnan(value) else value)
+
+
+def from_python(value: Any) -> Any:
+    # Typed value for an engine or fixture value; lists become tuples.
+    if value is None or value is pd.NA or value is pd.NaT:
+        return None
+    if value is NAN:
+        return Scalar("float", NAN)
+    if isinstance(value, Scalar):
+        return value
+    if isinstance(value, (bool, np.bool_)):
+        return Scalar("bool", bool(value))
+    if isinstance(value, (int, np.integer)):
+        return Scalar("int", int(value))
+    if isinstance(value, (float, np.floating)):
+        return _float(float(value))
+    if isinstance(value, str):
+        return value
+    if isinstance(value, Mapping):
+        return Map.of({str(key): from_python(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return tuple(from_python(item) for item in value)
+    return value
+
+
+class _ValueReader:
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.tokens = tokenize(text)
+        self.pos = 0
+
+    def _peek(self, offset: int = 0) -> Optional[Token]:
+        index = self.pos + offset
+        return self.tokens[index] if index < len(self.tokens) else None
+
+    def _next(self) -> Token:
+        token = self._peek()
+        if token is None:
+            raise ValueError(f"Unexpected end of literal: {self.text}")
+        self.pos += 1
+        return token
+
+    def _expect(self, kind: str) -> Token:
+        token = self._next()
+        if token.kind != kind:
+            raise ValueError(f"Expected '{kind}' but found '{token.raw}' in literal: {self.text}")
+        return token
+
+    def _at(self, kind: str, offset: int = 0, value: Optional[str] = None) -> bool:
+        token = self._peek(offset)
+        return token is not None and token.kind == kind and (value is None or token.value == value)
+
+    def read(self) -> Any:
+        value = self._value()
+        if self.pos != len(self.tokens):
+            raise ValueError(f"Trailing text in literal: {self.text}")
+        return value
+
+    def _value(self) -> Any:
+        token = self._peek()
+        if token is None:
+            raise ValueError(f"Empty literal: {self.text}")
+        if token.kind == "(":
+            return self._node()
+        if token.kind == "[":
+            if self._at(":", 1) or (self._at("name", 1) and self._at(":", 2)):
+                return self._relationship()
+            return self._list()
+        if token.kind == "{":
+            return Map.of(self._map())
+        if self._at("other", value="<"):
+            return self._path()
+        if token.kind == "string":
+            self.pos += 1
+            return token.value
+        if token.kind in ("-", "number"):
+            return self._number()
+        if token.kind == "name":
+            self.pos += 1
+            lowered = token.value.lower()
+            if lowered in ("true", "false"):
+                return Scalar("bool", lowered == "true")
+            if lowered == "null":
+                return None
+            if token.value == "NaN":
+                return _float(math.nan)
+            if token.value == "Infinity":
+                return _float(math.inf)
+            raise ValueError(f"Unsupported name '{token.value}' in literal: {self.text}")
+        raise ValueError(f"Unsupported literal: {self.text}")
+
+    def _number(self) -> Any:
+        sign = "-" if self._at("-") else ""
+        if sign:
+            self.pos += 1
+            if self._at("name", value="Infinity"):
+                self.pos += 1
+                return _float(-math.inf)
+        raw = sign + self._expect("number").value
+        if _INT_RE.fullmatch(raw):
+            return Scalar("int", int(raw))
+        return _float(float(raw))
+
+    def _labels(self) -> List[str]:
+        labels: List[str] = []
+        while self._at(":"):
+            self.pos += 1
+            labels.append(self._expect("name").value)
+        return labels
+
+    def _map(self) -> dict:
+        self._expect("{")
+        items: dict = {}
+        if self._at("}"):
+            self.pos += 1
+            return items
+        while True:
+            key = self._expect("name").value
+            self._expect(":")
+            items[key] = self._value()
+            if not self._at(","):
+                break
+            self.pos += 1
+        self._expect("}")
+        return items
+
+    def _properties(self) -> Map:
+        # A null property is the same as an absent one.
+        items = self._map() if self._at("{") else {}
+        return Map.of({key: value for key, value in items.items() if value is not None})
+
+    def _node(self) -> Node:
+        self._expect("(")
+        if self._at("name"):
+            self.pos += 1
+        labels = self._labels()
+        properties = self._properties()
+        self._expect(")")
+        return Node(frozenset(labels), properties)
+
+    def _relationship(self) -> Relationship:
+        self._expect("[")
+        if self._at("name"):
+            self.pos += 1
+        labels = self._labels()
+        properties = self._properties()
+        self._expect("]")
+        return Relationship(labels[0] if labels else None, properties)
+
+    def _list(self) -> Tuple[Any, ...]:
+        self._expect("[")
+        items: List[Any] = []
+        if not self._at("]"):
+            while True:
+                items.append(self._value())
+                if not self._at(","):
+                    break
+                self.pos += 1
+        self._expect("]")
+        return tuple(items)
+
+    def _path(self) -> Path:
+        self.pos += 1
+        start = self._node()
+        steps: List[Tuple[str, Relationship, str, Node]] = []
+        while not self._at("other", value=">"):
+            left = self._next().kind
+            if left not in ("-", "<-"):
+                raise ValueError(f"Malformed path literal: {self.text}")
+            relationship = self._relationship()
+            right = self._next().kind
+            if right not in ("-", "->"):
+                raise ValueError(f"Malformed path literal: {self.text}")
+            steps.append((left, relationship, right, self._node()))
+        self.pos += 1
+        return Path(start, tuple(steps))
+
+
+def parse_value(text: str) -> Any:
+    return _ValueReader(text).read()
+
+
+def parse_cell(value: Any) -> Any:
+    # Expected cells hold Cypher literal text; generated scenarios also store
+    # plain ints and floats.
+    if not isinstance(value, str):
+        return from_python(value)
+    try:
+        return parse_value(value)
+    except ValueError:
+        return Unparsed(value.strip())
+
+
+def parse_rows(rows: Sequence[Mapping[str, Any]]) -> ValueRows:
+    columns = tuple(sorted({name for row in rows for name in row}))
+    return ValueRows(
+        columns, tuple(tuple(parse_cell(row[name]) if name in row else None for name in columns) for row in rows)
+    )
+
+
+def _render_string(value: str) -> str:
+    return "'" + value.replace("\\", "\\\\").replace("'", "\\'") + "'"
+
+
+def _render_map(items: Iterable[Tuple[str, Any]]) -> str:
+    return "{" + ", ".join(f"{key}: {render(item)}" for key, item in sorted(items, key=lambda item: item[0])) + "}"
+
+
+def _render_entity(open_: str, labels: Sequence[str], properties: Map, close: str) -> str:
+    label_text = "".join(f":{label}" for label in labels)
+    if not properties.items:
+        return f"{open_}{label_text}{close}"
+    return f"{open_}{label_text}{' ' if label_text else ''}{_render_map(properties.items)}{close}"
+
+
+def _render_scalar(scalar: Scalar) -> str:
+    value = scalar.value
+    if scalar.type == "bool":
+        return "true" if value else "false"
+    if scalar.type == "float":
+        return "Infinity" if value == math.inf else "-Infinity" if value == -math.inf else repr(value)
+    return repr(value)
+
+
+def render(value: Any) -> str:
+    # Cypher literal text for a typed value, with sorted labels and keys; only
+    # used for diff messages.
+    if value is None:
+        return "null"
+    if isinstance(value, Scalar):
+        return _render_scalar(value)
+    if isinstance(value, str):
+        return _render_string(value)
+    if isinstance(value, tuple):
+        return "[" + ", ".join(render(item) for item in value) + "]"
+    if isinstance(value, Map):
+        return _render_map(value.items)
+    if isinstance(value, Node):
+        return _render_entity("(", sorted(value.labels), value.properties, ")")
+    if isinstance(value, Relationship):
+        return _render_entity("[", [value.type] if value.type else [], value.properties, "]")
+    if isinstance(value, Path):
+        hops = "".join(f"{left}{render(rel)}{right}{render(node)}" for left, rel, right, node in value.steps)
+        return f"<{render(value.start)}{hops}>"
+    if isinstance(value, Unparsed):
+        return value.text
+    return repr(value)
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import math
+import re
+from dataclasses import dataclass
+from typing import Any, FrozenSet, Iterable, Optional, Set, Tuple, Union
+
+# WHERE predicate trees over one node or edge pattern, rendered to a single
+# pandas query expression (`n(query=...)`, `e_forward(edge_query=...)`), so
+# every predicate of a hop is evaluated in one pass into one boolean mask.
+#
+# Cypher predicates are three-valued: a comparison with null is null, NOT
+# null is null, and WHERE keeps only rows that are true. Each node renders
+# to a pair of expressions, "is true" and "is false", and negation swaps
+# them, so a null never turns into a match. `x == x` is the null test: it is
+# False for None and NaN without a method call.
+#
+# A missing property is null, but pandas cannot name a column the frame does
+# not have; `with_mask_columns` adds the columns a chain's masks reference as
+# all-null before it runs.
+
+_NEGATED = {"=": "<>", "<>": "=", "<": ">=", "<=": ">", ">": "<=", ">=": "<"}
+_PANDAS_OPS = {"=": "==", "<>": "!=", "<": "<", "<=": "<=", ">": ">", ">=": ">="}
+# Rendered string literals are skipped so a backtick inside one is not a column.
+_QUOTED_OR_COLUMN_RE = re.compile(r"""'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*"|`([^`]*)`""")
+
+
+@dataclass(frozen=True)
+class Comparison:
+    key: str
+    op: str
+    value: Any
+    # Pattern variable the property belongs to; not part of the rendering.
+    var: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class IsNull:
+    key: str
+    negated: bool = False
+    var: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class Not:
+    operand: "Predicate"
+
+
+@dataclass(frozen=True)
+class And:
+    operands: Tuple["Predicate", ...]
+
+
+@dataclass(frozen=True)
+class Or:
+    operands: Tuple["Predicate", ...]
+
+
+@dataclass(frozen=True)
+class Xor:
+    left: "Predicate"
+    right: "Predicate"
+
+
+Predicate = Union[Comparison, IsNull, Not, And, Or, Xor]
+
+
+def _column(key: str) -> str:
+    if "`" in key:
+        raise ValueError(f"Unsupported column name in query: {key!r}")
+    return f"`{key}`"
+
+
+def _literal(value: Any) -> str:
+    if isinstance(value, (bool, str, int)) or (isinstance(value, float) and math.isfinite(value)):
+        return repr(value)
+    raise ValueError(f"Unsupported literal in query: {value!r}")
+
+
+def _comparison(column: str, op: str, literal: str) -> str:
+    return f"({column} {_PANDAS_OPS[op]} {literal})"
+
+
+def _truth(predicate: Predicate) -> Tuple[str, str]:
+    # (is true, is false); rows where neither holds are null.
+    if isinstance(predicate, Comparison):
+        if predicate.value is None:
+            raise ValueError("Comparison with null is always null")
+        column, literal = _column(predicate.key), _literal(predicate.value)
+        true, false = (_comparison(column, op, literal) for op in (predicate.op, _NEGATED[predicate.op]))
+        # Only `<>` holds for a null: NaN != x is True in pandas.
+        present = f"({column} == {column})"
+        if predicate.op == "<>":
+            true = f"({present} & {true})"
+        if predicate.op == "=":
+            false = f"({present} & {false})"
+        return true, false
+    if isinstance(predicate, IsNull):
+        column = _column(predicate.key)
+        null, present = f"({column} != {column})", f"({column} == {column})"
+        return (present, null) if predicate.negated else (null, present)
+    if isinstance(predicate, Not):
+        true, false = _truth(predicate.operand)
+        return false, true
+    if isinstance(predicate, (And, Or)):
+        parts = [_truth(operand) for operand in predicate.operands]
+        if len(parts) == 1:
+            return parts[0]
+        join_true, join_false = (" & ", " | ") if isinstance(predicate, And) else (" | ", " & ")
+        return f"({join_true.join(true for true, _ in parts)})", f"({join_false.join(false for _, false in parts)})"
+    if isinstance(predicate, Xor):
+        (left_true, left_false), (right_true, right_false) = _truth(predicate.left), _truth(predicate.right)
+        return (
+            f"(({left_true} & {right_false}) | ({left_false} & {right_true}))",
+            f"(({left_true} & {right_true}) | ({left_false} & {right_false}))",
+        )
+    raise TypeError(f"Not a predicate: {predicate!r}")
+
+
+def mask_expression(predicate: Predicate) -> str:
+    # pandas query text selecting the rows where `predicate` is true.
+    return _truth(predicate)[0]
+
+
+def query_columns(query: Optional[str]) -> FrozenSet[str]:
+    # Columns named by a rendered mask.
+    if not query:
+        return frozenset()
+    return frozenset(match.group(1) for match in _QUOTED_OR_COLUMN_RE.finditer(query) if match.group(1) is not None)
+
+
+def _add_null_columns(df: Any, names: Iterable[str]) -> Any:
+    missing = [name for name in sorted(names) if name not in df.columns]
+    return df.assign(**{name: None for name in missing}) if missing else df
+
+
+def with_mask_columns(g: Any, chain: Iterable[Any]) -> Any:
+    # `g` with every column the chain's masks reference, absent ones all-null.
+    node_columns: Set[str] = set()
+    edge_columns: Set[str] = set()
+    for op in chain:
+        for attr in ("query", "source_node_query", "destination_node_query"):
+            node_columns |= query_columns(getattr(op, attr, None))
+        edge_columns |= query_columns(getattr(op, "edge_query", None))
+    if node_columns and g._nodes is not None:
+        nodes = _add_null_columns(g._nodes, node_columns)
+        if nodes is not g._nodes:
+            g = g.nodes(nodes)
+    if edge_columns and g._edges is not None:
+        edges = _add_null_columns(g._edges, edge_columns)
+        if edges is not g._edges:
+            g = g.edges(edges)
+    return g